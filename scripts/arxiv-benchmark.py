@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the KIGLAND arXiv Daily Paper Fetcher
+
+Measures parse, score and render throughput of arxiv-daily-fetch.py, and a
+full offline pipeline run, on synthetic corpora. Nothing touches the network
+and nothing is rate limited, so numbers reflect only the pipeline's own work.
+
+Save a run with --output before a performance change and pass it as
+--baseline afterwards to get before/after numbers.
+
+Usage:
+    python scripts/arxiv-benchmark.py [--sizes 1000 10000 100000] [--repeat 3]
+    python scripts/arxiv-benchmark.py --output before.json
+    python scripts/arxiv-benchmark.py --baseline before.json
+
+Author: KIGLAND Research Intelligence
+Version: 1.0.0
+"""
+
+import argparse
+import importlib.util
+import io
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+import urllib.parse
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List
+from xml.sax.saxutils import escape
+
+# The pipeline lives in a script with a hyphenated name, so load it by path
+FETCHER_PATH = Path(__file__).with_name("arxiv-daily-fetch.py")
+_spec = importlib.util.spec_from_file_location("arxiv_daily_fetch", FETCHER_PATH)
+fetcher = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(fetcher)
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_REPEAT = 3
+SEED = 20260101
+
+# Filler vocabulary; about one paper in three also gets KIGLAND keywords
+FILLER_WORDS = (
+    "we propose novel method results show that model data training large "
+    "scale benchmark performance efficient framework approach learning task "
+    "evaluation experiments demonstrate state art baseline improve robust "
+    "analysis dataset tasks existing methods significant accuracy inference "
+    "representation structure optimization theoretical empirical study"
+).split()
+
+# ============================================================================
+# Synthetic Corpus
+# ============================================================================
+
+class SyntheticCorpus:
+    """
+    Deterministic synthetic arXiv papers, rendered as Atom pages on demand.
+    
+    Paper i always has the same title, abstract, authors and categories, so
+    any page of any corpus size can be generated independently.
+    """
+    
+    def __init__(self, size: int, seed: int = SEED):
+        self.size = size
+        self.seed = seed
+        self.keywords = fetcher.ALL_KEYWORDS
+        self._pages: Dict[tuple, bytes] = {}
+    
+    def _entry(self, i: int) -> str:
+        """One Atom <entry> for paper i."""
+        rng = random.Random(self.seed * 1_000_003 + i)
+        words = rng.choices(FILLER_WORDS, k=rng.randint(120, 220))
+        title = rng.choices(FILLER_WORDS, k=rng.randint(6, 12))
+        if rng.random() < 0.35:
+            for keyword in rng.sample(self.keywords, rng.randint(1, 4)):
+                words.insert(rng.randrange(len(words)), keyword)
+            if rng.random() < 0.5:
+                title.insert(rng.randrange(len(title)), rng.choice(self.keywords))
+        
+        categories = rng.sample(fetcher.TARGET_CATEGORIES + ["cs.CL", "cs.GR", "stat.ML"], 2)
+        authors = "".join(
+            f"<author><name>Author {rng.randrange(self.size // 3 + 1)}</name></author>"
+            for _ in range(rng.randint(1, 6))
+        )
+        paper_id = f"2601.{i:05d}v1" if i < 100000 else f"2601.{i:06d}v1"
+        stamp = f"2026-01-01T{i % 24:02d}:{i % 60:02d}:00Z"
+        return (
+            f"<entry><id>http://arxiv.org/abs/{paper_id}</id>"
+            f"<updated>{stamp}</updated><published>{stamp}</published>"
+            f"<title>{escape(' '.join(title).title())}</title>"
+            f"<summary>{escape(' '.join(words))}</summary>{authors}"
+            f'<link href="http://arxiv.org/abs/{paper_id}" rel="alternate" type="text/html"/>'
+            f'<link title="pdf" href="http://arxiv.org/pdf/{paper_id}" rel="related" '
+            f'type="application/pdf"/>'
+            f'<arxiv:primary_category term="{categories[0]}"/>'
+            + "".join(f'<category term="{c}"/>' for c in categories)
+            + "</entry>"
+        )
+    
+    def page(self, start: int, max_results: int) -> bytes:
+        """Atom feed for results start .. start + max_results (memoized)."""
+        key = (start, max_results)
+        if key not in self._pages:
+            self._pages[key] = self._render_page(start, max_results)
+        return self._pages[key]
+    
+    def _render_page(self, start: int, max_results: int) -> bytes:
+        """Render one Atom feed page."""
+        end = min(self.size, start + max_results)
+        entries = "".join(self._entry(i) for i in range(start, end))
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<feed xmlns="http://www.w3.org/2005/Atom" '
+            'xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/" '
+            'xmlns:arxiv="http://arxiv.org/schemas/atom">'
+            f"<title>ArXiv Query</title>"
+            f"<opensearch:totalResults>{self.size}</opensearch:totalResults>"
+            f"<opensearch:startIndex>{start}</opensearch:startIndex>"
+            f"{entries}</feed>"
+        ).encode("utf-8")
+
+
+class SyntheticArxivAPI(fetcher.ArxivAPI):
+    """ArxivAPI that answers every request from a SyntheticCorpus, unthrottled."""
+    
+    def __init__(self, corpus: SyntheticCorpus, **kwargs: Any):
+        kwargs.update(delay=0, cache=None)
+        super().__init__(**kwargs)
+        self.corpus = corpus
+    
+    def _rate_limit(self) -> None:
+        """Synthetic pages are not rate limited."""
+    
+    def _open(self, url: str, retries: int = 3) -> BinaryIO:
+        """Generate the requested page."""
+        params = urllib.parse.parse_qs(urllib.parse.urlsplit(url).query)
+        start = int(params["start"][0])
+        max_results = int(params["max_results"][0])
+        self.metrics.count("api_calls")
+        return io.BytesIO(self.corpus.page(start, max_results))
+
+# ============================================================================
+# Benchmarks
+# ============================================================================
+
+def best_of(repeat: int, func: Callable[[], Any]) -> float:
+    """Fastest wall time of func over repeat runs."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run_benchmarks(size: int, repeat: int) -> Dict[str, float]:
+    """
+    Benchmark one corpus size.
+    
+    Returns:
+        Papers per second for each benchmark
+    """
+    corpus = SyntheticCorpus(size)
+    page_size = fetcher.ARXIV_MAX_PAGE_SIZE
+    pages = [corpus.page(start, page_size) for start in range(0, size, page_size)]
+    api = fetcher.ArxivAPI(delay=0)
+    
+    def parse() -> List[Any]:
+        papers = []
+        for page in pages:
+            papers.extend(fetcher.AtomFeedParser(io.BytesIO(page), api._parse_single_entry))
+        return papers
+    
+    papers = parse()
+    results = {"parse": size / best_of(repeat, parse)}
+    
+    keyword_filter = fetcher.RelevanceFilter()
+    results["score"] = size / best_of(
+        repeat, lambda: keyword_filter.filter_papers(papers, min_score=1.0)
+    )
+    if fetcher.np is not None:
+        bm25_filter = fetcher.BM25RelevanceFilter()
+        results["score_bm25"] = size / best_of(
+            repeat, lambda: bm25_filter.filter_papers(papers, min_score=1.0)
+        )
+    
+    relevant = keyword_filter.filter_papers(papers, min_score=1.0)
+    report = fetcher.ReportGenerator()
+    date = datetime(2026, 1, 1)
+    results["render"] = len(relevant) / best_of(
+        repeat, lambda: report.generate_markdown(relevant, date, size)
+    )
+    
+    def pipeline() -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            run = fetcher.ArxivPipeline(output_dir=Path(tmp), use_cache=False)
+            run.api = SyntheticArxivAPI(
+                corpus, page_ceiling=fetcher.PAGE_CEILING, metrics=run.metrics
+            )
+            run.run(date=date, max_papers=size, incremental=False)
+            run.close()
+    
+    pipeline()  # Warm-up: generates and memoizes the pages the pipeline asks for
+    results["pipeline"] = size / best_of(repeat, pipeline)
+    return results
+
+
+def format_results(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]]
+) -> str:
+    """Format papers/second per benchmark and size, with speedups vs baseline."""
+    lines = [f"{'benchmark':<12}{'papers':>10}{'papers/s':>14}" + ("   vs baseline" if baseline else "")]
+    lines.append("-" * len(lines[0]))
+    for size, benches in results.items():
+        for name, rate in benches.items():
+            line = f"{name:<12}{size:>10}{rate:>14,.0f}"
+            before = baseline.get(size, {}).get(name)
+            if before:
+                line += f"   {rate / before:>6.2f}x ({before:,.0f})"
+            lines.append(line)
+    return "\n".join(lines)
+
+# ============================================================================
+# CLI Entry Point
+# ============================================================================
+
+def main():
+    """Main entry point for the CLI."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the arXiv daily pipeline on synthetic corpora"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Corpus sizes in papers (default: 1000 10000 100000)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help=f"Runs per benchmark; the fastest is reported (default: {DEFAULT_REPEAT})"
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        help="Write results as JSON, to pass as --baseline later"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        help="JSON results from an earlier run to compare against"
+    )
+    args = parser.parse_args()
+    
+    # Keep the pipeline's own logging out of the measurements
+    logging.getLogger("arxiv_fetcher").setLevel(logging.WARNING)
+    
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = {int(k): v for k, v in json.load(f)["results"].items()}
+    
+    results = {}
+    for size in args.sizes:
+        print(f"Benchmarking {size} papers...", file=sys.stderr)
+        results[size] = run_benchmarks(size, args.repeat)
+    
+    print(format_results(results, baseline))
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(
+                {
+                    "created": datetime.now().isoformat(timespec="seconds"),
+                    "python": sys.version.split()[0],
+                    "repeat": args.repeat,
+                    "results": results,
+                },
+                f, indent=2
+            )
+
+
+if __name__ == "__main__":
+    main()
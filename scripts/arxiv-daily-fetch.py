@@ -8,25 +8,53 @@ a structured markdown report.
 
 Usage:
     python scripts/arxiv-daily-fetch.py [--date YYYY-MM-DD] [--test]
+    python scripts/arxiv-daily-fetch.py --from YYYY-MM-DD [--to YYYY-MM-DD]
+    python scripts/arxiv-daily-fetch.py rescore [--workers N]
+    python scripts/arxiv-daily-fetch.py search "QUERY" [--from YYYY-MM-DD]
+    python scripts/arxiv-daily-fetch.py trends [--date YYYY-MM-DD]
+    python scripts/arxiv-daily-fetch.py [--date YYYY-MM-DD] --record DIR | --replay DIR
 
 Author: KIGLAND Research Intelligence
 Version: 1.0.0
 """
 
 import argparse
+import gzip
+import hashlib
+import heapq
+import http.client
+import io
+import itertools
 import json
 import logging
 import os
 import re
+import sqlite3
+import string
 import sys
+import textwrap
+import threading
 import time
 import urllib.error
+import urllib.parse
 import urllib.request
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from html import escape as escape_html
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
 from xml.etree import ElementTree as ET
 
+try:
+    import numpy as np
+except ImportError:  # Only needed for --scorer bm25
+    np = None
+
 # ============================================================================
 # Configuration
 # ============================================================================
@@ -34,7 +62,13 @@ from xml.etree import ElementTree as ET
 BASE_URL = "http://export.arxiv.org/api/query"
 RATE_LIMIT_SECONDS = 3
 MAX_RESULTS_PER_CALL = 100
-BATCH_SIZE = 50  # Smaller batches for testing
+BATCH_SIZE = 50  # First page size for incremental runs
+
+# Pagination planning
+ARXIV_MAX_PAGE_SIZE = 2000  # Hard API limit per call
+PAGE_CEILING = 1000  # Largest page requested by default
+MIN_PAGE_SIZE = 25  # Smallest page tried when retrying a truncated page
+MAX_PAGE_RETRIES = 3  # Retries at a smaller size per truncated page
 
 # Target categories for KIGLAND research
 TARGET_CATEGORIES = ["cs.AI", "cs.CV", "cs.LG", "cs.RO"]
@@ -49,6 +83,47 @@ NAMESPACES = {
 # Output directory
 OUTPUT_DIR = Path("/home/remi/clawd/kigland-intern-room/research/intelligence/arxiv-daily")
 
+# Raw API response cache (lives next to the outputs by default)
+CACHE_DIRNAME = ".cache"
+
+# Days after which a submission date's results are treated as final
+SETTLED_DAYS = 7
+
+# Saved daily outputs: gzipped JSON Lines by default, pretty JSON on request
+DAILY_JSON_PATTERN = re.compile(r"^arxiv-(\d{4}-\d{2}-\d{2})\.(json|jsonl\.gz)$")
+OUTPUT_SUFFIXES = {"jsonl": ".jsonl.gz", "json": ".json"}
+
+# Header line of .jsonl.gz outputs; bump the version on incompatible changes
+SCHEMA_NAME = "kigland.arxiv.papers"
+SCHEMA_VERSION = 1
+
+# Cross-day SQLite search index, in the output directory
+INDEX_FILENAME = "arxiv-index.sqlite"
+
+# Weekly trend counts and reports, in the output directory
+TRENDS_STATE_FILENAME = "arxiv-trends.state.json"
+TRENDS_STATE_VERSION = 1  # Bump when the state layout changes; it is then rebuilt
+
+# Papers per task when rescoring in a process pool
+RESCORE_CHUNK_SIZE = 500
+
+# PDF store for --fetch-pdfs, under the output directory
+PDF_DIRNAME = "pdfs"
+PDF_WORKERS = 4  # Concurrent PDF downloads (still rate limited per host)
+PDF_CHUNK_SIZE = 64 * 1024
+FULLTEXT_REFERENCE_WORDS = 200  # Full-text hits are scaled to an abstract-length text
+FULLTEXT_WEIGHT = 0.5  # Share of the full-text score in a re-ranked paper's score
+
+# Near-duplicate grouping for --dedup
+DEDUP_THRESHOLD = 0.85  # Cosine similarity for two papers to be grouped
+EMBED_DIM = 256  # Hashed n-gram embedding size
+LSH_TABLES = 24  # Random-hyperplane hash tables
+LSH_BITS = 16  # Hyperplanes per table
+
+# BM25 parameters for --scorer bm25
+BM25_K1 = 1.2
+BM25_B = 0.75
+
 # KIGLAND Focus Areas - Keywords for relevance filtering
 KIGLAND_KEYWORDS = {
     "ai": [
@@ -107,6 +182,133 @@ def setup_logging(verbose: bool = False) -> logging.Logger:
     
     return logger
 
+# ============================================================================
+# Paper Record
+# ============================================================================
+
+@dataclass(slots=True)
+class Paper:
+    """
+    A single arXiv paper with its relevance metadata.
+    
+    Slotted to keep per-paper overhead low when a backfill holds tens of
+    thousands of papers in memory. Converted to a plain dict only when
+    written out.
+    """
+    id: str
+    title: str = ""
+    summary: str = ""
+    published: str = ""
+    updated: str = ""
+    authors: List[str] = field(default_factory=list)
+    primary_category: str = ""
+    categories: List[str] = field(default_factory=list)
+    abstract_url: Optional[str] = None
+    pdf_url: Optional[str] = None
+    comment: Optional[str] = None
+    journal_ref: Optional[str] = None
+    doi: Optional[str] = None
+    relevance_score: float = 0.0
+    matched_areas: List[str] = field(default_factory=list)
+    fulltext_score: Optional[float] = None
+    pdf_sha256: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serialisable dictionary."""
+        # Shallow: avoids asdict()'s deep copy of every list field
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Paper":
+        """Build a Paper from a saved JSON dictionary."""
+        paper = cls(**{k: data[k] for k in cls.__dataclass_fields__ if k in data})
+        paper.primary_category = sys.intern(paper.primary_category or "")
+        paper.categories = [sys.intern(c) for c in paper.categories]
+        return paper
+
+
+# ============================================================================
+# Instrumentation
+# ============================================================================
+
+class PipelineMetrics:
+    """
+    Wall time per pipeline stage and simple counters for one pipeline run.
+    
+    Stages overlap in time because papers stream from the network through
+    the parser into the filter, so each component records only the time it
+    spends in its own work.
+    """
+    
+    STAGES = (
+        "fetch",
+        "rate_limit",
+        "parse_entries",
+        "filter_papers",
+        "fetch_pdfs",
+        "extract_text",
+        "dedup",
+        "save_json",
+        "save_index",
+        "render_report",
+    )
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self) -> None:
+        """Clear all timings and counters and restart the run clock."""
+        self.timings: Dict[str, float] = dict.fromkeys(self.STAGES, 0.0)
+        self.counters: Counter = Counter()
+        self.started = time.perf_counter()
+    
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as part of a stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+    
+    def add_time(self, name: str, seconds: float) -> None:
+        """Add seconds to a stage."""
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+    
+    def count(self, name: str, n: int = 1) -> None:
+        """Increment a counter."""
+        self.counters[name] += n
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarise the run as a JSON-serialisable dictionary."""
+        total = time.perf_counter() - self.started
+        papers = self.counters.get("papers_fetched", 0)
+        return {
+            "total_seconds": round(total, 4),
+            "stages": {name: round(t, 4) for name, t in self.timings.items()},
+            "counters": dict(self.counters),
+            "papers_per_second": round(papers / total, 2) if total > 0 else 0.0,
+        }
+    
+    @staticmethod
+    def format_table(summary: Dict[str, Any]) -> str:
+        """Render a summary from to_dict() as a plain-text table."""
+        total = summary["total_seconds"]
+        
+        lines = [f"{'Stage':<20}{'Seconds':>10}{'Share':>9}", "-" * 39]
+        for name, seconds in summary["stages"].items():
+            share = seconds / total * 100 if total > 0 else 0.0
+            lines.append(f"{name:<20}{seconds:>10.3f}{share:>8.1f}%")
+        lines.append("-" * 39)
+        lines.append(f"{'total':<20}{total:>10.3f}")
+        lines.append("")
+        for name, value in sorted(summary["counters"].items()):
+            lines.append(f"{name:<20}{value:>10}")
+        lines.append(f"{'papers_per_second':<20}{summary['papers_per_second']:>10}")
+        
+        return "\n".join(lines)
+
+
 # ============================================================================
 # ArXiv API Client
 # ============================================================================
@@ -116,19 +318,281 @@ class ArxivAPIError(Exception):
     pass
 
 
+class ResponseCache:
+    """
+    On-disk cache of raw Atom pages returned by the arXiv API.
+    
+    Pages are stored under a SHA-256 of the request URL (query, start, page
+    size and sort order), so a repeated request for the same page is served
+    from disk without touching the network or the rate limiter.
+    """
+    
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize the cache.
+        
+        Args:
+            cache_dir: Directory holding cached pages
+        """
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger("arxiv_fetcher.cache")
+    
+    def _path(self, url: str) -> Path:
+        """Return the cache file path for a request URL."""
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.xml"
+    
+    def get(self, url: str, not_before: Optional[float] = None) -> Optional[str]:
+        """
+        Look up a cached page.
+        
+        Args:
+            url: Request URL
+            not_before: Ignore entries written before this UNIX timestamp
+            
+        Returns:
+            Raw XML string, or None on a miss
+        """
+        path = self._path(url)
+        try:
+            if not_before is not None and path.stat().st_mtime < not_before:
+                self.misses += 1
+                return None
+            data = path.read_text(encoding="utf-8")
+        except OSError:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        self.logger.debug(f"Cache hit: {path.name}")
+        return data
+    
+    def put(self, url: str, data: str) -> None:
+        """Store a page, replacing any previous entry atomically."""
+        path = self._path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(data, encoding="utf-8")
+        os.replace(tmp_path, path)
+    
+    def discard(self, url: str) -> None:
+        """Remove a page from the cache if present."""
+        try:
+            self._path(url).unlink()
+        except FileNotFoundError:
+            pass
+
+
+class FixtureRecorder:
+    """
+    Stands in for the response cache and copies every page a run uses,
+    fetched or cached, into a fixture directory for ReplayArxivAPI.
+    """
+    
+    def __init__(self, fixtures: ResponseCache, cache: Optional[ResponseCache] = None):
+        """
+        Initialize the recorder.
+        
+        Args:
+            fixtures: Where recorded pages are written
+            cache: The regular response cache, if enabled
+        """
+        self.fixtures = fixtures
+        self.cache = cache
+    
+    @property
+    def hits(self) -> int:
+        return self.cache.hits if self.cache else 0
+    
+    @property
+    def misses(self) -> int:
+        return self.cache.misses if self.cache else 0
+    
+    def get(self, url: str, not_before: Optional[float] = None) -> Optional[str]:
+        """Look up a page in the regular cache, recording it on a hit."""
+        data = self.cache.get(url, not_before=not_before) if self.cache else None
+        if data is not None:
+            self.fixtures.put(url, data)
+        return data
+    
+    def put(self, url: str, data: str) -> None:
+        """Store a fetched page in the cache and the fixtures."""
+        if self.cache:
+            self.cache.put(url, data)
+        self.fixtures.put(url, data)
+    
+    def discard(self, url: str) -> None:
+        """Remove a page (e.g. a truncated one) from the cache and the fixtures."""
+        if self.cache:
+            self.cache.discard(url)
+        self.fixtures.discard(url)
+
+
+class _MeteredReader:
+    """
+    File-like wrapper around an HTTP response that records read time and
+    bytes downloaded, optionally keeping a copy of everything read.
+    """
+    
+    def __init__(self, stream: BinaryIO, metrics: PipelineMetrics, keep: bool = False):
+        self.stream = stream
+        self.metrics = metrics
+        self.keep = keep
+        self.chunks: List[bytes] = []
+    
+    def read(self, size: int = -1) -> bytes:
+        with self.metrics.stage("fetch"):
+            data = self.stream.read(size)
+        self.metrics.count("bytes_downloaded", len(data))
+        if self.keep:
+            self.chunks.append(data)
+        return data
+    
+    def getvalue(self) -> bytes:
+        return b"".join(self.chunks)
+    
+    def close(self) -> None:
+        self.stream.close()
+
+
+class AtomFeedParser:
+    """
+    Streaming parser for arXiv Atom feeds.
+    
+    Reads the source incrementally with iterparse and yields each paper as
+    soon as its <entry> element closes. opensearch:totalResults is captured
+    on the same pass, and processed elements are cleared so a page never
+    sits in memory as a full tree.
+    """
+    
+    ENTRY_TAG = f"{{{NAMESPACES['atom']}}}entry"
+    TOTAL_RESULTS_TAG = f"{{{NAMESPACES['opensearch']}}}totalResults"
+    ERROR_ID_MARKER = "arxiv.org/api/errors"
+    
+    def __init__(
+        self,
+        source: BinaryIO,
+        parse_entry: Callable[[ET.Element], Optional[Paper]],
+        on_complete: Optional[Callable[[], None]] = None,
+        metrics: Optional[PipelineMetrics] = None
+    ):
+        """
+        Initialize the parser.
+        
+        Args:
+            source: Binary file-like object holding the Atom XML
+            parse_entry: Converts an <entry> element into a Paper
+            on_complete: Called once the whole feed has been parsed
+            metrics: Records parse time (excluding time spent in fetch)
+        """
+        self.source = source
+        self.parse_entry = parse_entry
+        self.on_complete = on_complete
+        self.metrics = metrics or PipelineMetrics()
+        self.total_results: Optional[int] = None
+        self.logger = logging.getLogger("arxiv_fetcher.parser")
+    
+    def __iter__(self) -> Iterator[Paper]:
+        """
+        Yield papers in feed order.
+        
+        Raises:
+            ArxivAPIError: On an API error feed, malformed XML or a failed read
+        """
+        timings = self.metrics.timings
+        # Time spent in this generator, minus reads, is parse time
+        resumed = time.perf_counter()
+        fetch_before = timings["fetch"]
+        
+        try:
+            root = None
+            for event, elem in ET.iterparse(self.source, events=("start", "end")):
+                if event == "start":
+                    if root is None:
+                        root = elem
+                    continue
+                
+                if elem.tag == self.TOTAL_RESULTS_TAG:
+                    self._read_total(elem)
+                elif elem.tag == self.ENTRY_TAG:
+                    paper = self._parse(elem)
+                    # Drop everything parsed so far
+                    root.clear()
+                    if paper:
+                        self._add_parse_time(resumed, fetch_before)
+                        yield paper
+                        resumed = time.perf_counter()
+                        fetch_before = timings["fetch"]
+        except ET.ParseError as e:
+            raise ArxivAPIError(f"XML parse error: {e}") from e
+        except (OSError, http.client.HTTPException) as e:
+            raise ArxivAPIError(f"Read failed: {e}") from e
+        finally:
+            self.source.close()
+        
+        self._add_parse_time(resumed, fetch_before)
+        
+        if self.on_complete is not None:
+            self.on_complete()
+    
+    def _add_parse_time(self, resumed: float, fetch_before: float) -> None:
+        """Record time since resumed, less any fetch time recorded meanwhile."""
+        elapsed = time.perf_counter() - resumed
+        fetched = self.metrics.timings["fetch"] - fetch_before
+        self.metrics.add_time("parse_entries", max(0.0, elapsed - fetched))
+    
+    def _read_total(self, elem: ET.Element) -> None:
+        """Record opensearch:totalResults."""
+        try:
+            self.total_results = int(elem.text or "")
+        except ValueError as e:
+            self.logger.warning(f"Failed to parse total results: {e}")
+    
+    def _parse(self, entry: ET.Element) -> Optional[Paper]:
+        """Parse one entry, raising on API error entries."""
+        id_elem = entry.find("atom:id", NAMESPACES)
+        if id_elem is not None and self.ERROR_ID_MARKER in (id_elem.text or ""):
+            summary = entry.find("atom:summary", NAMESPACES)
+            error_msg = summary.text if summary is not None else "Unknown error"
+            raise ArxivAPIError(f"API Error: {error_msg}")
+        
+        try:
+            return self.parse_entry(entry)
+        except Exception as e:
+            self.logger.warning(f"Failed to parse entry: {e}")
+            return None
+
+
 class ArxivAPI:
     """
     Client for the arXiv API with rate limiting and error handling.
     """
     
-    def __init__(self, delay: int = RATE_LIMIT_SECONDS):
+    def __init__(
+        self,
+        delay: int = RATE_LIMIT_SECONDS,
+        cache: Optional[ResponseCache] = None,
+        page_ceiling: int = PAGE_CEILING,
+        metrics: Optional[PipelineMetrics] = None
+    ):
         """
         Initialize the API client.
         
         Args:
             delay: Seconds to wait between requests (default 3)
+            cache: Optional on-disk cache for raw responses
+            page_ceiling: Largest page size to request (capped at 2000)
+            metrics: Records fetch, rate-limit and parse timings
         """
         self.delay = delay
+        self.cache = cache
+        self.metrics = metrics or PipelineMetrics()
+        self.page_ceiling = max(1, min(page_ceiling, ARXIV_MAX_PAGE_SIZE))
+        # Cache entries older than this UNIX timestamp are refetched
+        self.cache_not_before: Optional[float] = None
         self.last_request_time: Optional[float] = None
         self.logger = logging.getLogger("arxiv_fetcher.api")
     
@@ -139,7 +603,8 @@ class ArxivAPI:
             if elapsed < self.delay:
                 sleep_time = self.delay - elapsed
                 self.logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
-                time.sleep(sleep_time)
+                with self.metrics.stage("rate_limit"):
+                    time.sleep(sleep_time)
         self.last_request_time = time.time()
     
     def _build_url(
@@ -161,31 +626,20 @@ class ArxivAPI:
         )
         return url
     
-    def fetch(
-        self,
-        query: str,
-        start: int = 0,
-        max_results: int = MAX_RESULTS_PER_CALL,
-        retries: int = 3
-    ) -> str:
+    def _open(self, url: str, retries: int = 3) -> BinaryIO:
         """
-        Fetch data from arXiv API with rate limiting and retry logic.
+        Open a rate-limited connection to the API with retry logic.
         
         Args:
-            query: Search query string
-            start: Start index (0-based)
-            max_results: Number of results to fetch
+            url: Request URL
             retries: Number of retry attempts on failure
             
         Returns:
-            Raw XML response string
+            The open HTTP response (caller must close it)
             
         Raises:
             ArxivAPIError: If all retry attempts fail
         """
-        url = self._build_url(query, start, max_results)
-        self.logger.debug(f"Fetching: {url}")
-        
         for attempt in range(retries):
             try:
                 self._rate_limit()
@@ -197,18 +651,10 @@ class ArxivAPI:
                     }
                 )
                 
-                with urllib.request.urlopen(req, timeout=30) as response:
-                    data = response.read().decode("utf-8")
-                    
-                # Check for error response
-                if "<title>Error</title>" in data:
-                    error_match = re.search(
-                        r"<summary>(.*?)</summary>", data, re.DOTALL
-                    )
-                    error_msg = error_match.group(1) if error_match else "Unknown error"
-                    raise ArxivAPIError(f"API Error: {error_msg}")
-                
-                return data
+                with self.metrics.stage("fetch"):
+                    response = urllib.request.urlopen(req, timeout=30)
+                self.metrics.count("api_calls")
+                return response
                 
             except urllib.error.HTTPError as e:
                 self.logger.warning(f"HTTP {e.code} on attempt {attempt + 1}: {e.reason}")
@@ -233,93 +679,260 @@ class ArxivAPI:
         
         raise ArxivAPIError("All retry attempts failed")
     
-    def fetch_all(
+    def fetch(
         self,
         query: str,
-        max_total: int = 1000
-    ) -> List[Dict[str, Any]]:
+        start: int = 0,
+        max_results: int = MAX_RESULTS_PER_CALL,
+        retries: int = 3,
+        sort_by: str = "submittedDate"
+    ) -> str:
         """
-        Fetch all results with pagination.
+        Fetch data from arXiv API with rate limiting and retry logic.
+        
+        Pages found in the response cache are returned without a request
+        and without waiting on the rate limit.
         
         Args:
             query: Search query string
-            max_total: Maximum total results to fetch
+            start: Start index (0-based)
+            max_results: Number of results to fetch
+            retries: Number of retry attempts on failure
+            sort_by: Sort field (submittedDate or lastUpdatedDate)
+            
+        Returns:
+            Raw XML response string
+            
+        Raises:
+            ArxivAPIError: If all retry attempts fail
+        """
+        url = self._build_url(query, start, max_results, sort_by=sort_by)
+        
+        if self.cache is not None:
+            cached = self.cache.get(url, not_before=self.cache_not_before)
+            if cached is not None:
+                self.metrics.count("cache_hits")
+                return cached
+        
+        self.logger.debug(f"Fetching: {url}")
+        
+        try:
+            with self._open(url, retries=retries) as response:
+                data = _MeteredReader(response, self.metrics).read().decode("utf-8")
+        except (OSError, http.client.HTTPException) as e:
+            raise ArxivAPIError(f"Read failed: {e}") from e
+        
+        # Check for error response
+        if "<title>Error</title>" in data:
+            error_match = re.search(
+                r"<summary>(.*?)</summary>", data, re.DOTALL
+            )
+            error_msg = error_match.group(1) if error_match else "Unknown error"
+            raise ArxivAPIError(f"API Error: {error_msg}")
+        
+        if self.cache is not None:
+            self.cache.put(url, data)
+        
+        return data
+    
+    def open_page(
+        self,
+        query: str,
+        start: int = 0,
+        max_results: int = MAX_RESULTS_PER_CALL,
+        retries: int = 3,
+        sort_by: str = "submittedDate"
+    ) -> "AtomFeedParser":
+        """
+        Open one page of results for streaming.
+        
+        Papers are parsed while the response is still downloading. Cached
+        pages are streamed from disk; fresh pages are written to the cache
+        once they have been read completely.
+        
+        Args:
+            query: Search query string
+            start: Start index (0-based)
+            max_results: Number of results to fetch
+            retries: Number of retry attempts on failure
+            sort_by: Sort field (submittedDate or lastUpdatedDate)
             
         Returns:
-            List of paper dictionaries
+            Parser yielding the page's papers
+            
+        Raises:
+            ArxivAPIError: If the request fails
+        """
+        url = self._build_url(query, start, max_results, sort_by=sort_by)
+        
+        if self.cache is not None:
+            cached = self.cache.get(url, not_before=self.cache_not_before)
+            if cached is not None:
+                self.metrics.count("cache_hits")
+                return AtomFeedParser(
+                    io.BytesIO(cached.encode("utf-8")),
+                    self._parse_single_entry,
+                    metrics=self.metrics
+                )
+        
+        self.logger.debug(f"Fetching: {url}")
+        response = self._open(url, retries=retries)
+        source = _MeteredReader(response, self.metrics, keep=self.cache is not None)
+        
+        store = None
+        if self.cache is not None:
+            def store() -> None:
+                self.cache.put(url, source.getvalue().decode("utf-8"))
+        
+        return AtomFeedParser(
+            source, self._parse_single_entry, on_complete=store, metrics=self.metrics
+        )
+    
+    def iter_all(
+        self,
+        query: str,
+        max_total: int = 1000,
+        sort_by: str = "submittedDate",
+        until: Optional[Callable[[Paper], bool]] = None,
+        page_size: Optional[int] = None
+    ) -> Iterator[Paper]:
+        """
+        Stream all results with pagination.
+        
+        The first page is requested at page_size (default: the page ceiling).
+        Once totalResults is known, the remaining results are split into the
+        fewest pages that fit under the ceiling. A page that comes back short
+        is retried from where it stopped at half the size.
+        
+        Args:
+            query: Search query string
+            max_total: Maximum total results to fetch
+            sort_by: Sort field (submittedDate or lastUpdatedDate)
+            until: Stop paging at the first paper for which this returns True
+                (that paper is not yielded)
+            page_size: Size of the first page (default: the page ceiling)
+            
+        Yields:
+            Papers, as soon as each entry has been received
         """
-        all_papers = []
+        fetched = 0
         start = 0
+        limit = max_total
+        ceiling = self.page_ceiling
+        size = min(page_size or ceiling, ceiling, limit)
+        retries = 0
         
-        while start < max_total:
-            self.logger.info(f"Fetching papers {start} to {start + BATCH_SIZE}...")
+        while start < limit:
+            self.logger.info(f"Fetching papers {start} to {start + size}...")
             
+            count = 0
+            reached = False
             try:
-                xml_data = self.fetch(query, start=start, max_results=BATCH_SIZE)
-                papers = self._parse_entries(xml_data)
-                
-                if not papers:
-                    self.logger.info("No more papers found.")
-                    break
-                
-                all_papers.extend(papers)
-                
-                # Check if we've reached the total
-                total_results = self._get_total_results(xml_data)
-                if start + BATCH_SIZE >= min(total_results, max_total):
-                    break
-                
-                start += BATCH_SIZE
-                
+                page = self.open_page(
+                    query, start=start, max_results=size, sort_by=sort_by
+                )
+                for paper in page:
+                    if until is not None and until(paper):
+                        reached = True
+                        break
+                    count += 1
+                    yield paper
             except ArxivAPIError as e:
                 self.logger.error(f"Failed to fetch batch: {e}")
                 break
+            finally:
+                fetched += count
+            
+            if reached:
+                self.logger.info("Reached already-known papers.")
+                break
+            
+            if page.total_results is not None:
+                limit = min(page.total_results, max_total)
+            elif count == 0:
+                self.logger.info("No more papers found.")
+                break
+            
+            expected = min(size, limit - start)
+            
+            if count < expected:
+                # Truncated or empty page: retry the rest at a smaller size
+                if self.cache is not None:
+                    self.cache.discard(
+                        self._build_url(query, start, size, sort_by=sort_by)
+                    )
+                start += count
+                if retries >= MAX_PAGE_RETRIES or size <= MIN_PAGE_SIZE:
+                    self.logger.warning(
+                        f"Got {count} of {expected} papers at offset {start - count}; "
+                        "giving up"
+                    )
+                    break
+                retries += 1
+                ceiling = size = max(MIN_PAGE_SIZE, size // 2)
+                self.logger.warning(
+                    f"Got {count} of {expected} papers; retrying at page size {size}"
+                )
+                continue
+            
+            retries = 0
+            start += count
+            size = self._plan_page_size(limit - start, ceiling)
+        
+        self.logger.info(f"Fetched {fetched} papers total")
+    
+    def close(self) -> None:
+        """Release network resources (nothing to release for this client)."""
+    
+    @staticmethod
+    def _plan_page_size(remaining: int, ceiling: int) -> int:
+        """Split the remaining results into the fewest even pages under ceiling."""
+        if remaining <= 0:
+            return ceiling
+        calls = -(-remaining // ceiling)
+        return -(-remaining // calls)
+    
+    def fetch_all(
+        self,
+        query: str,
+        max_total: int = 1000
+    ) -> List[Paper]:
+        """
+        Fetch all results with pagination.
         
-        self.logger.info(f"Fetched {len(all_papers)} papers total")
-        return all_papers
+        Args:
+            query: Search query string
+            max_total: Maximum total results to fetch
+            
+        Returns:
+            List of papers
+        """
+        return list(self.iter_all(query, max_total=max_total))
     
-    def _parse_entries(self, xml_data: str) -> List[Dict[str, Any]]:
+    def _parse_entries(self, xml_data: str) -> List[Paper]:
         """Parse Atom XML and extract paper metadata."""
+        parser = AtomFeedParser(
+            io.BytesIO(xml_data.encode("utf-8")),
+            self._parse_single_entry,
+            metrics=self.metrics
+        )
         try:
-            root = ET.fromstring(xml_data)
-        except ET.ParseError as e:
+            return list(parser)
+        except ArxivAPIError as e:
             self.logger.error(f"XML parse error: {e}")
             return []
-        
-        entries = []
-        
-        for entry in root.findall("atom:entry", NAMESPACES):
-            try:
-                paper = self._parse_single_entry(entry)
-                if paper:
-                    entries.append(paper)
-            except Exception as e:
-                self.logger.warning(f"Failed to parse entry: {e}")
-                continue
-        
-        return entries
     
-    def _parse_single_entry(self, entry: ET.Element) -> Optional[Dict[str, Any]]:
-        """Parse a single entry element into a paper dictionary."""
-        paper = {}
-        
+    def _parse_single_entry(self, entry: ET.Element) -> Optional[Paper]:
+        """Parse a single entry element into a Paper."""
         # Required fields
         id_elem = entry.find("atom:id", NAMESPACES)
         if id_elem is None or not id_elem.text:
             return None
-        paper["id"] = id_elem.text.strip()
         
         title_elem = entry.find("atom:title", NAMESPACES)
-        paper["title"] = self._clean_text(title_elem.text) if title_elem is not None else ""
-        
         summary_elem = entry.find("atom:summary", NAMESPACES)
-        paper["summary"] = self._clean_text(summary_elem.text) if summary_elem is not None else ""
-        
         published_elem = entry.find("atom:published", NAMESPACES)
-        paper["published"] = published_elem.text if published_elem is not None else ""
-        
         updated_elem = entry.find("atom:updated", NAMESPACES)
-        paper["updated"] = updated_elem.text if updated_elem is not None else ""
         
         # Authors
         authors = []
@@ -327,24 +940,20 @@ class ArxivAPI:
             name_elem = author.find("atom:name", NAMESPACES)
             if name_elem is not None and name_elem.text:
                 authors.append(name_elem.text.strip())
-        paper["authors"] = authors
         
-        # Categories
+        # Categories (a small vocabulary repeated on every paper)
         primary_cat = entry.find("arxiv:primary_category", NAMESPACES)
-        paper["primary_category"] = (
-            primary_cat.get("term") if primary_cat is not None else ""
-        )
+        primary_category = primary_cat.get("term") if primary_cat is not None else ""
         
         categories = []
         for cat in entry.findall("atom:category", NAMESPACES):
             term = cat.get("term")
             if term:
-                categories.append(term)
-        paper["categories"] = categories
+                categories.append(sys.intern(term))
         
         # Links
-        paper["abstract_url"] = None
-        paper["pdf_url"] = None
+        abstract_url = None
+        pdf_url = None
         
         for link in entry.findall("atom:link", NAMESPACES):
             rel = link.get("rel", "")
@@ -352,21 +961,30 @@ class ArxivAPI:
             href = link.get("href", "")
             
             if rel == "alternate":
-                paper["abstract_url"] = href
+                abstract_url = href
             elif rel == "related" and title == "pdf":
-                paper["pdf_url"] = href
+                pdf_url = href
         
         # Optional fields
         comment = entry.find("arxiv:comment", NAMESPACES)
-        paper["comment"] = comment.text if comment is not None else None
-        
         journal_ref = entry.find("arxiv:journal_ref", NAMESPACES)
-        paper["journal_ref"] = journal_ref.text if journal_ref is not None else None
-        
         doi = entry.find("arxiv:doi", NAMESPACES)
-        paper["doi"] = doi.text if doi is not None else None
         
-        return paper
+        return Paper(
+            id=id_elem.text.strip(),
+            title=self._clean_text(title_elem.text) if title_elem is not None else "",
+            summary=self._clean_text(summary_elem.text) if summary_elem is not None else "",
+            published=published_elem.text if published_elem is not None else "",
+            updated=updated_elem.text if updated_elem is not None else "",
+            authors=authors,
+            primary_category=sys.intern(primary_category),
+            categories=categories,
+            abstract_url=abstract_url,
+            pdf_url=pdf_url,
+            comment=comment.text if comment is not None else None,
+            journal_ref=journal_ref.text if journal_ref is not None else None,
+            doi=doi.text if doi is not None else None,
+        )
     
     def _clean_text(self, text: Optional[str]) -> str:
         """Clean and normalize text content."""
@@ -375,114 +993,1353 @@ class ArxivAPI:
         # Remove excessive whitespace and newlines
         text = " ".join(text.split())
         return text.strip()
-    
-    def _get_total_results(self, xml_data: str) -> int:
-        """Extract total result count from response."""
-        try:
-            root = ET.fromstring(xml_data)
-            total = root.find("opensearch:totalResults", NAMESPACES)
-            if total is not None and total.text:
-                return int(total.text)
-        except (ET.ParseError, ValueError) as e:
-            self.logger.warning(f"Failed to parse total results: {e}")
-        return 0
 
 
-# ============================================================================
+class ReplayArxivAPI(ArxivAPI):
+    """
+    arXiv client that serves pages recorded with FixtureRecorder and never
+    touches the network.
+    
+    There is no rate limit, so a recorded run replays as fast as it parses.
+    Requesting a page that was not recorded is an error.
+    """
+    
+    def __init__(self, fixtures: ResponseCache, **kwargs: Any):
+        kwargs.update(delay=0, cache=None)
+        super().__init__(**kwargs)
+        self.fixtures = fixtures
+    
+    def _rate_limit(self) -> None:
+        """Replayed pages are not rate limited."""
+    
+    def _open(self, url: str, retries: int = 3) -> BinaryIO:
+        """Open a recorded page."""
+        data = self.fixtures.get(url)
+        if data is None:
+            raise ArxivAPIError(f"No recorded response for {url}")
+        self.metrics.count("api_calls")
+        return io.BytesIO(data.encode("utf-8"))
+
+
+class _KeepAliveResponse:
+    """
+    Response on a KeepAliveArxivAPI connection.
+    
+    Records whether the body was read to the end. When it is closed, the
+    client keeps the connection for the next request only if it was;
+    otherwise unread bytes would be left on the socket, so the connection
+    is dropped.
+    """
+    
+    def __init__(self, response: http.client.HTTPResponse, release: Callable[[bool], None]):
+        self.response = response
+        self.release = release
+        self.complete = False
+        self.closed = False
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self.response.read(size if size >= 0 else None)
+        if not data or size < 0 or self.response.isclosed():
+            self.complete = True
+        return data
+    
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.response.close()
+            self.release(self.complete)
+    
+    def __enter__(self) -> "_KeepAliveResponse":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class KeepAliveArxivAPI(ArxivAPI):
+    """
+    arXiv client that sends every request over one persistent HTTP connection.
+    
+    Requests go out one at a time: the next one is sent only after the
+    previous response has been read to the end and closed, so there is never
+    more than one connection or one request in flight, as arXiv asks. A page
+    the caller stops reading early (e.g. an incremental run reaching known
+    papers) drops the connection, and the next request opens a new one.
+    Requests are paced by the same rate limiter as ArxivAPI, and papers are
+    still parsed while each response downloads. There is no fetching ahead.
+    """
+    
+    HEADERS = {"User-Agent": "KIGLAND-Research/1.0 (research@kigland.dev)"}
+    MAX_REDIRECTS = 3
+    
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._origin: Optional[tuple] = None
+        self._response: Optional[_KeepAliveResponse] = None
+    
+    def _open(self, url: str, retries: int = 3) -> BinaryIO:
+        """
+        Send a rate-limited request on the shared connection, with retries.
+        
+        Returns:
+            The response (caller must read or close it before the next request)
+            
+        Raises:
+            ArxivAPIError: If all retry attempts fail
+        """
+        if self._response is not None:
+            self._response.close()
+        
+        error = "All retry attempts failed"
+        for attempt in range(retries):
+            try:
+                response = self._get(url)
+            except (OSError, http.client.HTTPException) as e:
+                self.close()
+                self.logger.warning(f"Connection error on attempt {attempt + 1}: {e}")
+                error = f"Connection error: {e}"
+            else:
+                if response.status == 200:
+                    self.metrics.count("api_calls")
+                    self._response = _KeepAliveResponse(response, self._release)
+                    return self._response
+                self.logger.warning(
+                    f"HTTP {response.status} on attempt {attempt + 1}: {response.reason}"
+                )
+                error = f"HTTP Error {response.status}: {response.reason}"
+                self._drain(response)
+            
+            if attempt < retries - 1:
+                time.sleep(2 ** attempt)  # Exponential backoff
+        
+        raise ArxivAPIError(error)
+    
+    def _get(self, url: str) -> http.client.HTTPResponse:
+        """Rate-limited GET on the shared connection, following redirects."""
+        for _ in range(self.MAX_REDIRECTS + 1):
+            self._rate_limit()
+            with self.metrics.stage("fetch"):
+                response = self._send(url)
+            location = response.getheader("Location")
+            if response.status not in (301, 302, 303, 307, 308) or not location:
+                return response
+            self._drain(response)
+            url = urllib.parse.urljoin(url, location)
+            self.logger.debug(f"Redirected to {url}")
+        return response
+    
+    def _send(self, url: str) -> http.client.HTTPResponse:
+        """Send one request, reconnecting once if an idle connection was closed."""
+        parts = urllib.parse.urlsplit(url)
+        origin = (parts.scheme, parts.netloc)
+        path = f"{parts.path or '/'}?{parts.query}" if parts.query else parts.path or "/"
+        if self._conn is not None and origin != self._origin:
+            self.close()
+        
+        reused = self._conn is not None
+        if not reused:
+            self._connect(origin)
+        try:
+            self._conn.request("GET", path, headers=self.HEADERS)
+            return self._conn.getresponse()
+        except (OSError, http.client.HTTPException):
+            self.close()
+            if not reused:
+                raise
+        
+        # The server closed the connection while it sat idle
+        self._connect(origin)
+        self._conn.request("GET", path, headers=self.HEADERS)
+        return self._conn.getresponse()
+    
+    def _connect(self, origin: tuple) -> None:
+        """Open the shared connection to a scheme and host."""
+        scheme, netloc = origin
+        connection_class = (
+            http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        )
+        self._conn = connection_class(netloc, timeout=30)
+        self._origin = origin
+    
+    def _drain(self, response: http.client.HTTPResponse) -> None:
+        """Read the rest of a response so the connection can be reused."""
+        response.read()
+        if response.will_close:
+            self.close()
+    
+    def _release(self, complete: bool) -> None:
+        """Called when a response is closed; keep the connection only if it was read."""
+        self._response = None
+        if not complete or (self._conn is not None and self._conn.sock is None):
+            self.close()
+    
+    def close(self) -> None:
+        """Close the shared connection."""
+        self._response = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+# ============================================================================
 # Relevance Filter
 # ============================================================================
 
+class KeywordMatcher:
+    """
+    Compiled keyword matcher for relevance scoring.
+    
+    Keywords are lowercased, de-duplicated and mapped to the focus areas that
+    list them once at build time. Keywords that share a word with another
+    keyword (e.g. "learning", "detection") are grouped behind that word: a
+    keyword can only occur in a text that contains the shared word, so one
+    substring check rules out the whole group when the word is absent.
+    """
+    
+    TITLE_WEIGHT = 3
+    SUMMARY_WEIGHT = 1
+    
+    def __init__(self, keywords: Dict[str, List[str]]):
+        """
+        Build the matcher.
+        
+        Args:
+            keywords: Mapping of focus area to keyword list
+        """
+        self.areas = list(keywords)
+        
+        table: Dict[str, List[int]] = {}
+        for index, area in enumerate(self.areas):
+            for keyword in keywords[area]:
+                table.setdefault(keyword.lower(), []).append(index)
+        
+        # Distinct keywords and the areas each one counts towards
+        self.keywords = list(table)
+        self.keyword_areas = [tuple(indices) for indices in table.values()]
+        
+        # How many distinct keywords each word appears in
+        word_counts = Counter(
+            word for keyword in table for word in set(self._words(keyword))
+        )
+        
+        groups: Dict[Optional[str], List[tuple]] = {}
+        for keyword_id, (keyword, indices) in enumerate(table.items()):
+            shared = [
+                word for word in self._words(keyword)
+                if word_counts[word] > 1 and word != keyword
+            ]
+            gate = max(shared, key=len) if shared else None
+            groups.setdefault(gate, []).append((keyword, tuple(indices), keyword_id))
+        
+        self.ungated = tuple(groups.pop(None, []))
+        self.gated = tuple(
+            (gate, tuple(members)) for gate, members in groups.items()
+        )
+    
+    @staticmethod
+    def _words(keyword: str) -> List[str]:
+        """Split a keyword into its words."""
+        return keyword.replace("-", " ").split()
+    
+    def area_hits(self, title: str, summary: str) -> List[int]:
+        """
+        Count weighted keyword hits per focus area.
+        
+        Args:
+            title: Lowercased paper title
+            summary: Lowercased paper abstract
+            
+        Returns:
+            Weighted hit count for each area, in the order of ``self.areas``
+        """
+        hits = [0] * len(self.areas)
+        title_weight = self.TITLE_WEIGHT
+        summary_weight = self.SUMMARY_WEIGHT
+        
+        for keyword, indices, _ in self.ungated:
+            weight = 0
+            # Title matches are weighted more heavily
+            if keyword in title:
+                weight += title_weight
+            if keyword in summary:
+                weight += summary_weight
+            if weight:
+                for index in indices:
+                    hits[index] += weight
+        
+        for gate, members in self.gated:
+            in_title = gate in title
+            in_summary = gate in summary
+            if not (in_title or in_summary):
+                continue
+            for keyword, indices, _ in members:
+                weight = 0
+                if in_title and keyword in title:
+                    weight += title_weight
+                if in_summary and keyword in summary:
+                    weight += summary_weight
+                if weight:
+                    for index in indices:
+                        hits[index] += weight
+        
+        return hits
+    
+    def keyword_counts(self, title: str, summary: str) -> List[tuple]:
+        """
+        Count occurrences of each keyword.
+        
+        Args:
+            title: Lowercased paper title
+            summary: Lowercased paper abstract
+            
+        Returns:
+            (keyword_id, title_count, summary_count) for every keyword that
+            occurs at least once, where keyword_id indexes ``self.keywords``
+        """
+        counts = []
+        
+        for keyword, _, keyword_id in self.ungated:
+            in_title = title.count(keyword)
+            in_summary = summary.count(keyword)
+            if in_title or in_summary:
+                counts.append((keyword_id, in_title, in_summary))
+        
+        for gate, members in self.gated:
+            gate_in_title = gate in title
+            gate_in_summary = gate in summary
+            if not (gate_in_title or gate_in_summary):
+                continue
+            for keyword, _, keyword_id in members:
+                in_title = title.count(keyword) if gate_in_title else 0
+                in_summary = summary.count(keyword) if gate_in_summary else 0
+                if in_title or in_summary:
+                    counts.append((keyword_id, in_title, in_summary))
+        
+        return counts
+
+
 class RelevanceFilter:
     """
     Filters papers by relevance to KIGLAND focus areas.
     """
     
-    def __init__(self):
+    # Whether a paper's score depends on the rest of the batch it is scored in
+    batch_dependent = False
+    
+    def __init__(self, metrics: Optional[PipelineMetrics] = None):
         self.logger = logging.getLogger("arxiv_fetcher.filter")
+        self.metrics = metrics or PipelineMetrics()
         self.keywords = KIGLAND_KEYWORDS
         self.all_keywords = ALL_KEYWORDS
+        self.matcher = KeywordMatcher(self.keywords)
+        self.target_categories = frozenset(c.lower() for c in TARGET_CATEGORIES)
     
-    def calculate_score(self, paper: Dict[str, Any]) -> tuple[float, List[str]]:
+    def calculate_score(
+        self,
+        paper: Paper,
+        text: Optional[str] = None
+    ) -> tuple[float, List[str]]:
         """
         Calculate relevance score for a paper.
         
+        The abstract is scored by which keywords it contains. A body text
+        (e.g. a whole PDF) mentions nearly every keyword somewhere, so it is
+        scored by keyword occurrences instead, scaled down to what a text of
+        FULLTEXT_REFERENCE_WORDS words would have. That keeps the two scores
+        on the same scale and makes keyword density, not length, count.
+        
+        Args:
+            paper: Paper to score
+            text: Body text to match instead of the abstract (e.g. full text)
+            
         Returns:
             Tuple of (score, matched_categories)
         """
-        title = paper.get("title", "").lower()
-        summary = paper.get("summary", "").lower()
-        categories = [c.lower() for c in paper.get("categories", [])]
-        
-        text = f"{title} {summary}"
-        score = 0.0
-        matched_areas = []
+        title = paper.title.lower()
         
-        # Check each focus area
-        for area, keywords in self.keywords.items():
-            area_score = 0
-            for keyword in keywords:
-                # Title matches are weighted more heavily
-                if keyword.lower() in title:
-                    area_score += 3
-                if keyword.lower() in summary:
-                    area_score += 1
-            
-            if area_score > 0:
-                score += area_score
-                matched_areas.append(area)
+        # Per-area weighted hit counts, in focus-area order
+        if text is None:
+            area_hits = self.matcher.area_hits(title, paper.summary.lower())
+        else:
+            area_hits = self._body_hits(title, text.lower())
+        score = float(sum(area_hits))
+        matched_areas = [
+            area for area, hits in zip(self.matcher.areas, area_hits) if hits > 0
+        ]
         
         # Bonus for target categories
-        target_cats = [c.lower() for c in TARGET_CATEGORIES]
-        if any(cat in target_cats for cat in categories):
+        if any(c.lower() in self.target_categories for c in paper.categories):
             score *= 1.2
         
         return score, matched_areas
     
+    def _body_hits(self, title: str, body: str) -> List[float]:
+        """Per-area keyword occurrences in a body text, scaled by its length."""
+        matcher = self.matcher
+        scale = FULLTEXT_REFERENCE_WORDS / max(len(body.split()), FULLTEXT_REFERENCE_WORDS)
+        hits = [0.0] * len(matcher.areas)
+        for keyword_id, in_title, in_body in matcher.keyword_counts(title, body):
+            weight = matcher.TITLE_WEIGHT * (in_title > 0) + in_body * scale
+            for index in matcher.keyword_areas[keyword_id]:
+                hits[index] += weight
+        return hits
+    
+    def score_papers(
+        self,
+        papers: Iterable[Paper]
+    ) -> Iterator[tuple]:
+        """
+        Score papers one at a time.
+        
+        Yields:
+            (paper, score, matched_areas) tuples, in input order
+        """
+        clock = time.perf_counter
+        for paper in papers:
+            start = clock()
+            score, matched_areas = self.calculate_score(paper)
+            self.metrics.add_time("filter_papers", clock() - start)
+            yield paper, score, matched_areas
+    
+    @staticmethod
+    def rank_key(paper: Paper) -> tuple:
+        """
+        Ranking key: higher score first, ties broken by newer publication
+        date and then by id, so the order is reproducible across runs.
+        """
+        return (paper.relevance_score, paper.published, paper.id)
+    
     def filter_papers(
         self,
-        papers: List[Dict[str, Any]],
+        papers: Iterable[Paper],
         min_score: float = 1.0,
         top_k: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Paper]:
         """
         Filter and rank papers by relevance.
         
+        Papers are scored one at a time as they are consumed, so a streaming
+        source is filtered while it is still being fetched and papers below
+        the threshold are never retained. With top_k, only a bounded heap of
+        the best top_k papers is kept.
+        
         Args:
-            papers: List of paper dictionaries
+            papers: Iterable of papers
             min_score: Minimum relevance score to include
             top_k: Maximum number of papers to return (None for all above threshold)
             
         Returns:
             Filtered and sorted list of papers with relevance metadata
         """
-        scored_papers = []
+        total = 0
+        
+        def scored() -> Iterator[Paper]:
+            nonlocal total
+            for paper, score, matched_areas in self.score_papers(papers):
+                total += 1
+                if score >= min_score:
+                    paper.relevance_score = round(score, 2)
+                    paper.matched_areas = matched_areas
+                    yield paper
+        
+        # Rank by score (descending)
+        if top_k:
+            scored_papers = heapq.nlargest(top_k, scored(), key=self.rank_key)
+        else:
+            scored_papers = list(scored())
+            with self.metrics.stage("filter_papers"):
+                scored_papers.sort(key=self.rank_key, reverse=True)
         
-        for paper in papers:
-            score, matched_areas = self.calculate_score(paper)
+        self.logger.info(
+            f"Filtered {total} papers to {len(scored_papers)} relevant papers "
+            f"(min_score={min_score})"
+        )
+        
+        return scored_papers
+
+
+class BM25RelevanceFilter(RelevanceFilter):
+    """
+    Ranks a batch of papers with BM25 over the KIGLAND keyword phrases.
+    
+    Each keyword is a term. Term frequencies are occurrence counts (title
+    occurrences weighted like the keyword scorer), saturated by k1 and
+    normalised by document length, and weighted by inverse document frequency
+    over the batch. So repeated mentions count for more, long abstracts do
+    not win by length alone, and keywords every paper mentions count for
+    little. All papers are scored against every focus area in one matrix
+    product, which needs the whole batch in memory and NumPy installed.
+    
+    calculate_score() is inherited and still gives the single-paper keyword
+    score; only score_papers() uses BM25.
+    
+    Because document frequencies come from the batch, filter_papers() holds
+    the whole batch before scoring instead of streaming, and a paper's score
+    depends on which other papers were scored with it. The pipeline therefore
+    always scores a full day's fetch with this scorer (no incremental merge),
+    so the IDF comes from the same corpus on every run of that day.
+    """
+    
+    batch_dependent = True
+    
+    def __init__(
+        self,
+        metrics: Optional[PipelineMetrics] = None,
+        k1: float = BM25_K1,
+        b: float = BM25_B
+    ):
+        if np is None:
+            raise ImportError("The bm25 scorer requires numpy (pip install numpy)")
+        super().__init__(metrics=metrics)
+        self.k1 = k1
+        self.b = b
+        
+        # Keyword-to-area incidence matrix, (keywords x areas)
+        matcher = self.matcher
+        self.area_matrix = np.zeros((len(matcher.keywords), len(matcher.areas)))
+        for keyword_id, indices in enumerate(matcher.keyword_areas):
+            for index in indices:
+                self.area_matrix[keyword_id, index] += 1
+    
+    def score_papers(
+        self,
+        papers: Iterable[Paper]
+    ) -> Iterator[tuple]:
+        """
+        Score a batch of papers with BM25.
+        
+        Yields:
+            (paper, score, matched_areas) tuples, in input order
+        """
+        papers = list(papers)
+        if not papers:
+            return
+        
+        with self.metrics.stage("filter_papers"):
+            scores = self._score_matrix(papers)
+            totals = scores.sum(axis=1)
+            matched = scores > 0
+            bonus = np.array([
+                any(c.lower() in self.target_categories for c in paper.categories)
+                for paper in papers
+            ])
+            totals = np.where(bonus, totals * 1.2, totals)
+        
+        areas = self.matcher.areas
+        for i, paper in enumerate(papers):
+            matched_areas = [area for area, hit in zip(areas, matched[i]) if hit]
+            yield paper, float(totals[i]), matched_areas
+    
+    def _score_matrix(self, papers: List[Paper]) -> "np.ndarray":
+        """Return BM25 scores as a (papers x areas) matrix."""
+        matcher = self.matcher
+        title_weight = matcher.TITLE_WEIGHT
+        
+        rows: List[int] = []
+        cols: List[int] = []
+        values: List[int] = []
+        lengths = np.empty(len(papers))
+        
+        for i, paper in enumerate(papers):
+            title = paper.title.lower()
+            summary = paper.summary.lower()
+            lengths[i] = title_weight * len(title.split()) + len(summary.split())
+            for keyword_id, in_title, in_summary in matcher.keyword_counts(title, summary):
+                rows.append(i)
+                cols.append(keyword_id)
+                values.append(title_weight * in_title + in_summary)
+        
+        tf = np.zeros((len(papers), len(matcher.keywords)))
+        tf[rows, cols] = values
+        
+        n_docs = len(papers)
+        df = np.count_nonzero(tf, axis=0)
+        idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+        
+        avg_length = lengths.mean() or 1.0
+        norm = self.k1 * (1 - self.b + self.b * lengths / avg_length)
+        weights = tf * (self.k1 + 1) / (tf + norm[:, None])
+        
+        return weights @ (idf[:, None] * self.area_matrix)
+
+
+# Relevance scorers selectable with --scorer
+SCORERS = {
+    "keyword": RelevanceFilter,
+    "bm25": BM25RelevanceFilter,
+}
+
+
+def _blend_fulltext(abstract_score: float, fulltext_score: float) -> float:
+    """Relevance score of a paper whose full text was scored (FULLTEXT_WEIGHT of it)."""
+    return round(
+        (1 - FULLTEXT_WEIGHT) * abstract_score + FULLTEXT_WEIGHT * fulltext_score, 2
+    )
+
+
+# Per-process filters used by rescore workers, by scorer name
+_worker_filters: Dict[str, RelevanceFilter] = {}
+
+
+def _score_chunk(
+    task: tuple
+) -> List[tuple]:
+    """
+    Score a chunk of papers in a worker process.
+    
+    Papers with a stored full text get it scored too and blended in, as
+    run() does after --fetch-pdfs.
+    
+    Args:
+        task: (scorer name, chunk) where chunk holds (title, summary,
+            categories, text path or None) tuples
+        
+    Returns:
+        (relevance_score, matched_areas, fulltext_score) tuples, in input
+        order; fulltext_score is None for papers without a text path
+    """
+    scorer, chunk = task
+    relevance = _worker_filters.get(scorer)
+    if relevance is None:
+        relevance = _worker_filters[scorer] = SCORERS[scorer]()
+    
+    results = []
+    for title, summary, categories, text_path in chunk:
+        paper = Paper(id="", title=title, summary=summary, categories=categories)
+        score, matched_areas = relevance.calculate_score(paper)
+        score = round(score, 2)
+        fulltext_score = None
+        if text_path is not None:
+            text = Path(text_path).read_text(encoding="utf-8")
+            fulltext, _ = relevance.calculate_score(paper, text=text)
+            fulltext_score = round(fulltext, 2)
+            score = _blend_fulltext(score, fulltext)
+        results.append((score, matched_areas, fulltext_score))
+    return results
+
+
+# ============================================================================
+# PDF Full Text
+# ============================================================================
+
+PDF_STREAM_RE = re.compile(rb"stream\r?\n(.*?)\r?\nendstream", re.S)
+PDF_TEXT_OP_RE = re.compile(
+    rb"\(((?:\\.|[^\\)])*)\)\s*(?:Tj|')|\[((?:\\.|[^\\\]])*)\]\s*TJ", re.S
+)
+PDF_ARRAY_ITEM_RE = re.compile(rb"\(((?:\\.|[^\\)])*)\)|(-?\d+(?:\.\d+)?)", re.S)
+PDF_ESCAPE_RE = re.compile(rb"\\([0-7]{1,3}|.)", re.S)
+PDF_ESCAPES = {
+    b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f",
+    b"\n": b"", b"\r": b"",
+}
+
+
+def _unescape_pdf_string(raw: bytes) -> bytes:
+    """Resolve backslash escapes in a PDF literal string."""
+    def replace(match: re.Match) -> bytes:
+        code = match.group(1)
+        if code[:1].isdigit():
+            return bytes([int(code, 8) & 0xFF])
+        return PDF_ESCAPES.get(code, code)
+    return PDF_ESCAPE_RE.sub(replace, raw)
+
+
+def extract_pdf_text(data: bytes) -> str:
+    """
+    Best-effort text extraction from a PDF, using only the standard library.
+    
+    Inflates every Flate-compressed stream and collects the literal strings
+    drawn by the Tj, ' and TJ text operators. Good enough for keyword
+    matching on pdfLaTeX output; text in CID fonts or custom encodings is
+    skipped.
+    
+    Args:
+        data: Raw PDF bytes
+        
+    Returns:
+        Extracted text with whitespace collapsed
+    """
+    pieces: List[bytes] = []
+    for match in PDF_STREAM_RE.finditer(data):
+        stream = match.group(1)
+        try:
+            stream = zlib.decompress(stream)
+        except zlib.error:
+            pass
+        if b"BT" not in stream:
+            continue
+        
+        for op in PDF_TEXT_OP_RE.finditer(stream):
+            if op.group(1) is not None:
+                pieces.append(_unescape_pdf_string(op.group(1)))
+            else:
+                # TJ arrays: large negative kerning marks a word gap
+                for item in PDF_ARRAY_ITEM_RE.finditer(op.group(2)):
+                    if item.group(1) is not None:
+                        pieces.append(_unescape_pdf_string(item.group(1)))
+                    elif float(item.group(2)) <= -200:
+                        pieces.append(b" ")
+            pieces.append(b" ")
+    
+    text = b"".join(pieces).decode("latin-1")
+    return " ".join(text.split())
+
+
+class PdfStore:
+    """
+    Content-addressed local store for paper PDFs and their extracted text.
+    
+    PDFs are kept under objects/ by the SHA-256 of their bytes, next to a
+    .txt file with the extracted text. refs/ maps each versioned arXiv id to
+    its hash, so a PDF is never downloaded twice, and partial/ holds
+    interrupted downloads until they are resumed.
+    """
+    
+    def __init__(self, store_dir: Path):
+        self.store_dir = store_dir
+        self.objects_dir = store_dir / "objects"
+        self.refs_dir = store_dir / "refs"
+        self.partial_dir = store_dir / "partial"
+    
+    @staticmethod
+    def _key(paper_id: str) -> str:
+        """File-name-safe key for a paper id (e.g. 2401.12345v2)."""
+        return re.sub(r"[^A-Za-z0-9.-]", "_", paper_id.rsplit("/abs/", 1)[-1])
+    
+    def object_path(self, digest: str, suffix: str = ".pdf") -> Path:
+        """Path of a stored object."""
+        return self.objects_dir / digest[:2] / f"{digest}{suffix}"
+    
+    def partial_path(self, paper_id: str) -> Path:
+        """Path of the in-progress download for a paper."""
+        self.partial_dir.mkdir(parents=True, exist_ok=True)
+        return self.partial_dir / f"{self._key(paper_id)}.part"
+    
+    def lookup(self, paper_id: str) -> Optional[str]:
+        """Return the stored PDF's hash for a paper, or None."""
+        try:
+            digest = (self.refs_dir / self._key(paper_id)).read_text().strip()
+        except OSError:
+            return None
+        return digest if self.object_path(digest).exists() else None
+    
+    def commit(self, paper_id: str, partial: Path) -> str:
+        """
+        Move a completed download into the store.
+        
+        Args:
+            paper_id: Paper the PDF belongs to
+            partial: Completed download
             
-            if score >= min_score:
-                paper["relevance_score"] = round(score, 2)
-                paper["matched_areas"] = matched_areas
-                scored_papers.append(paper)
+        Returns:
+            SHA-256 hex digest of the PDF
+        """
+        sha = hashlib.sha256()
+        with open(partial, "rb") as f:
+            for chunk in iter(lambda: f.read(PDF_CHUNK_SIZE), b""):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+        
+        path = self.object_path(digest)
+        if path.exists():
+            partial.unlink()
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(partial, path)
+        
+        self.refs_dir.mkdir(parents=True, exist_ok=True)
+        ref = self.refs_dir / self._key(paper_id)
+        tmp = ref.with_name(f"{ref.name}.{os.getpid()}.tmp")
+        tmp.write_text(digest)
+        os.replace(tmp, ref)
+        return digest
+    
+    def text(self, digest: str) -> str:
+        """Return a stored PDF's text, extracting it on first use."""
+        text_path = self.object_path(digest, ".txt")
+        try:
+            return text_path.read_text(encoding="utf-8")
+        except OSError:
+            pass
+        
+        text = extract_pdf_text(self.object_path(digest).read_bytes())
+        tmp = text_path.with_name(f"{text_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, text_path)
+        return text
+
+
+class PdfFetcher:
+    """
+    Downloads paper PDFs into a PdfStore on a bounded thread pool.
+    
+    Requests to the same host are spaced by the rate-limit delay whatever
+    the number of workers, so the pool only overlaps transfer time. A
+    download that fails midway is resumed with a Range request on retry,
+    or on the next run.
+    """
+    
+    def __init__(
+        self,
+        store: PdfStore,
+        workers: int = PDF_WORKERS,
+        delay: float = RATE_LIMIT_SECONDS,
+        metrics: Optional[PipelineMetrics] = None,
+        opener: Optional[urllib.request.OpenerDirector] = None
+    ):
+        """
+        Initialize the fetcher.
         
-        # Sort by score (descending)
-        scored_papers.sort(key=lambda x: x["relevance_score"], reverse=True)
+        Args:
+            store: Where downloaded PDFs are kept
+            workers: Concurrent downloads
+            delay: Seconds between requests to the same host
+            metrics: Records download counts, bytes and rate-limit time
+            opener: urllib opener used for every request (e.g. one routing
+                to a local stand-in server); defaults to a plain opener
+        """
+        self.store = store
+        self.workers = max(1, workers)
+        self.delay = delay
+        self.metrics = metrics or PipelineMetrics()
+        self.opener = opener or urllib.request.build_opener()
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+        self.logger = logging.getLogger("arxiv_fetcher.pdf")
+    
+    def fetch(self, papers: Iterable[Paper]) -> Dict[str, str]:
+        """
+        Make sure the PDFs for some papers are in the store.
         
-        if top_k:
-            scored_papers = scored_papers[:top_k]
+        Papers whose PDF is already stored are not requested again.
+        
+        Args:
+            papers: Papers to fetch PDFs for
+            
+        Returns:
+            Mapping of paper id to PDF hash, for papers whose PDF is stored
+        """
+        stored: Dict[str, str] = {}
+        pending: List[Paper] = []
+        for paper in papers:
+            digest = self.store.lookup(paper.id)
+            if digest:
+                stored[paper.id] = digest
+            elif paper.pdf_url:
+                pending.append(paper)
+        self.metrics.count("pdfs_cached", len(stored))
+        
+        if not pending:
+            return stored
         
         self.logger.info(
-            f"Filtered {len(papers)} papers to {len(scored_papers)} relevant papers "
-            f"(min_score={min_score})"
+            f"Downloading {len(pending)} PDFs ({len(stored)} already stored)"
         )
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {
+                pool.submit(self._download, paper.pdf_url, paper.id): paper
+                for paper in pending
+            }
+            # Metrics are only updated here, on the calling thread
+            for future in as_completed(futures):
+                paper = futures[future]
+                try:
+                    digest, size, waited = future.result()
+                except ArxivAPIError as e:
+                    self.logger.warning(f"PDF for {paper.id} failed: {e}")
+                    self.metrics.count("pdfs_failed")
+                    continue
+                stored[paper.id] = digest
+                self.metrics.count("pdfs_downloaded")
+                self.metrics.count("pdf_bytes", size)
+                self.metrics.add_time("rate_limit", waited)
+        
+        return stored
+    
+    def _rate_limit(self, url: str) -> float:
+        """Wait for this host's next request slot; returns seconds waited."""
+        host = urllib.parse.urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.delay
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    def _download(self, url: str, paper_id: str, retries: int = 3) -> tuple:
+        """
+        Download one PDF, resuming a partial download if there is one.
         
-        return scored_papers
+        Returns:
+            Tuple of (digest, bytes_downloaded, seconds_rate_limited)
+            
+        Raises:
+            ArxivAPIError: If all retry attempts fail or the file is not a PDF
+        """
+        partial = self.store.partial_path(paper_id)
+        size = 0
+        waited = 0.0
+        
+        for attempt in range(retries):
+            offset = partial.stat().st_size if partial.exists() else 0
+            headers = {"User-Agent": "KIGLAND-Research/1.0 (research@kigland.dev)"}
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+            
+            waited += self._rate_limit(url)
+            try:
+                request = urllib.request.Request(url, headers=headers)
+                with self.opener.open(request, timeout=60) as response:
+                    if offset and response.status != 206:
+                        offset = 0  # Range ignored; start over
+                    expected = response.headers.get("Content-Length")
+                    received = 0
+                    with open(partial, "ab" if offset else "wb") as f:
+                        while chunk := response.read(PDF_CHUNK_SIZE):
+                            f.write(chunk)
+                            received += len(chunk)
+                    size += received
+                    if expected is not None and received < int(expected):
+                        raise http.client.IncompleteRead(b"", int(expected) - received)
+                break
+                
+            except urllib.error.HTTPError as e:
+                if e.code == 416 and offset:
+                    break  # Nothing left to send: the partial file is complete
+                error = f"HTTP Error {e.code}: {e.reason}"
+            except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
+                error = f"Download error: {e}"
+            
+            self.logger.debug(f"PDF {paper_id} attempt {attempt + 1}: {error}")
+            if attempt < retries - 1:
+                time.sleep(2 ** attempt)
+            else:
+                raise ArxivAPIError(error)
+        
+        with open(partial, "rb") as f:
+            if f.read(5) != b"%PDF-":
+                partial.unlink()
+                raise ArxivAPIError(f"Not a PDF: {url}")
+        
+        return self.store.commit(paper_id, partial), size, waited
+
+
+# ============================================================================
+# Near-Duplicate Grouping
+# ============================================================================
+
+class PaperDeduplicator:
+    """
+    Groups near-duplicate papers, such as companion papers with nearly the
+    same abstract.
+    
+    Each paper is embedded as a signed, hashed bag of word unigrams and
+    bigrams from its title and abstract, weighted by IDF over the batch and
+    L2-normalised. Candidate pairs come from random-hyperplane LSH: a pair
+    is only compared if it shares a bucket in at least one of the hash
+    tables, so the work grows with the number of papers rather than the
+    number of pairs. Candidates at or above the cosine threshold are joined
+    into groups. Needs NumPy.
+    
+    Only the papers passed to group() are compared. The pipeline groups one
+    day at a time, so duplicates that fall on different days (e.g. a v2
+    posted on a later date) are not found, during backfill or otherwise.
+    """
+    
+    # Lowercases ASCII and turns punctuation into spaces, so that
+    # bytes.split() yields the words
+    TOKEN_TABLE = bytes.maketrans(
+        string.ascii_uppercase.encode() + string.punctuation.encode(),
+        string.ascii_lowercase.encode() + b" " * len(string.punctuation)
+    )
+    
+    def __init__(
+        self,
+        threshold: float = DEDUP_THRESHOLD,
+        dim: int = EMBED_DIM,
+        tables: int = LSH_TABLES,
+        bits: int = LSH_BITS,
+        seed: int = 0
+    ):
+        if np is None:
+            raise ImportError("Near-duplicate grouping requires numpy (pip install numpy)")
+        self.threshold = threshold
+        self.dim = dim
+        self.tables = tables
+        self.bits = bits
+        rng = np.random.default_rng(seed)
+        self.planes = rng.standard_normal((dim, tables * bits)).astype(np.float32)
+        self.logger = logging.getLogger("arxiv_fetcher.dedup")
+    
+    def embed(self, papers: List[Paper]) -> "np.ndarray":
+        """
+        Embed papers as unit vectors.
+        
+        Args:
+            papers: Papers to embed
+            
+        Returns:
+            float32 matrix of shape (papers, dim); papers without any text
+            get a zero row
+        """
+        # Token ids, assigned in order of first appearance
+        vocab: Dict[bytes, int] = {}
+        token_ids: List[int] = []
+        lengths: List[int] = []
+        for paper in papers:
+            text = f"{paper.title} {paper.summary}".encode()
+            tokens = text.translate(self.TOKEN_TABLE).split()
+            token_ids.extend(vocab.setdefault(token, len(vocab)) for token in tokens)
+            lengths.append(len(tokens))
+        
+        n_docs = len(papers)
+        matrix = np.zeros((n_docs, self.dim), dtype=np.float32)
+        if not token_ids:
+            return matrix
+        
+        tokens = np.array(token_ids, dtype=np.int64)
+        docs = np.repeat(np.arange(n_docs, dtype=np.int64), lengths)
+        hashes = np.array(
+            [zlib.crc32(t) for t in vocab], dtype=np.uint64
+        )
+        
+        # Smoothed IDF per token, from distinct (doc, token) pairs
+        keys = np.sort(docs * len(vocab) + tokens)
+        distinct = keys[np.r_[True, keys[1:] != keys[:-1]]]
+        df = np.bincount(distinct % len(vocab), minlength=len(vocab))
+        idf = np.log((1 + n_docs) / (1 + df)) + 1.0
+        
+        # Bigrams: adjacent tokens within the same paper
+        same_doc = docs[1:] == docs[:-1]
+        first, second = tokens[:-1][same_doc], tokens[1:][same_doc]
+        bigram_hashes = (hashes[first] * np.uint64(0x9E3779B1) + hashes[second]) & np.uint64(0xFFFFFFFF)
+        
+        feature_hashes = np.concatenate([hashes[tokens], bigram_hashes])
+        weights = np.concatenate([idf[tokens], (idf[first] + idf[second]) / 2])
+        rows = np.concatenate([docs, docs[1:][same_doc]])
+        
+        # Signed feature hashing: the top bit picks the sign
+        columns = (feature_hashes % np.uint64(self.dim)).astype(np.int64)
+        signs = np.where(feature_hashes >> np.uint64(31), -1.0, 1.0)
+        matrix += np.bincount(
+            rows * self.dim + columns,
+            weights=signs * weights,
+            minlength=n_docs * self.dim
+        ).reshape(n_docs, self.dim).astype(np.float32)
+        
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+    
+    def candidate_pairs(self, matrix: "np.ndarray") -> "np.ndarray":
+        """
+        Find pairs of rows that share an LSH bucket in any table.
+        
+        Returns:
+            int64 array of shape (pairs, 2) with i < j in each row
+        """
+        nonzero = np.flatnonzero(matrix.any(axis=1))
+        if len(nonzero) < 2:
+            return np.empty((0, 2), dtype=np.int64)
+        
+        signs = (matrix[nonzero] @ self.planes) > 0
+        powers = 1 << np.arange(self.bits, dtype=np.int64)
+        keys = signs.reshape(len(nonzero), self.tables, self.bits) @ powers
+        
+        pairs = []
+        for table in range(self.tables):
+            order = np.argsort(keys[:, table], kind="stable")
+            sorted_keys = keys[order, table]
+            starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+            ends = np.r_[starts[1:], len(order)]
+            for start, end in zip(starts[ends - starts > 1], ends[ends - starts > 1]):
+                members = nonzero[order[start:end]]
+                pairs.extend(itertools.combinations(members.tolist(), 2))
+        
+        if not pairs:
+            return np.empty((0, 2), dtype=np.int64)
+        pairs = np.unique(np.sort(np.array(pairs, dtype=np.int64), axis=1), axis=0)
+        return pairs
+    
+    def group(self, papers: List[Paper]) -> List[List[Paper]]:
+        """
+        Group near-duplicate papers.
+        
+        Args:
+            papers: Papers in rank order
+            
+        Returns:
+            Groups in rank order of their best paper; each group is in rank
+            order, so its first paper is the one to show
+        """
+        matrix = self.embed(papers)
+        pairs = self.candidate_pairs(matrix)
+        if len(pairs):
+            cosine = np.einsum("ij,ij->i", matrix[pairs[:, 0]], matrix[pairs[:, 1]])
+            pairs = pairs[cosine >= self.threshold]
+        
+        # Union-find with the best-ranked paper as each group's root
+        parent = list(range(len(papers)))
+        
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        for i, j in pairs.tolist():
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+        
+        groups: Dict[int, List[Paper]] = {}
+        for i, paper in enumerate(papers):
+            groups.setdefault(find(i), []).append(paper)
+        
+        self.logger.debug(
+            f"{len(pairs)} near-duplicate pairs, {len(papers) - len(groups)} papers folded"
+        )
+        return list(groups.values())
 
 
 # ============================================================================
 # Report Generator
 # ============================================================================
 
+class ReportFormat(ABC):
+    """
+    One output format of the daily report.
+    
+    ReportGenerator.render computes each paper's display fields once and
+    hands the same dict to every format, whose entry() fills its template
+    and returns the text to write; formats never see the whole report.
+    Templates are f-strings, which Python compiles into the method body, so
+    filling one costs a single string build rather than a parse.
+    """
+    
+    name = ""
+    suffix = ""
+    
+    @abstractmethod
+    def header(self, summary: Dict[str, Any]) -> str:
+        """Text before the first paper entry."""
+    
+    @abstractmethod
+    def entry(self, f: Dict[str, Any]) -> str:
+        """Text for one paper entry."""
+    
+    @abstractmethod
+    def footer(self) -> str:
+        """Text after the last paper entry."""
+
+
+class MarkdownFormat(ReportFormat):
+    """The Markdown report, arxiv-YYYY-MM-DD.md."""
+    
+    name = "md"
+    suffix = ".md"
+    
+    def header(self, summary: Dict[str, Any]) -> str:
+        folded = summary["folded"]
+        folded = f"**Near-Duplicates Folded:** {folded}\n" if folded else ""
+        areas = "".join(
+            f"- **{area.title()}:** {count} papers\n" for area, count in summary["areas"]
+        )
+        return (
+            f"# KIGLAND Daily arXiv Intelligence Report\n"
+            f"\n"
+            f"**Date:** {summary['date']}\n"
+            f"**Categories:** {', '.join(TARGET_CATEGORIES)}\n"
+            f"**Total Papers Fetched:** {summary['total_fetched']}\n"
+            f"**Relevant Papers Found:** {summary['relevant']}\n"
+            f"{folded}"
+            f"\n"
+            f"---\n"
+            f"\n"
+            f"## 📊 Summary\n"
+            f"\n"
+            f"This report covers {summary['relevant']} papers relevant to KIGLAND focus areas:\n"
+            f"\n"
+            f"{areas}"
+            f"\n"
+            f"---\n"
+            f"\n"
+            f"## 📄 Papers\n"
+            f"\n"
+        )
+    
+    def entry(self, f: Dict[str, Any]) -> str:
+        categories = f"**Categories:** {f['categories']}\n" if f["categories"] else ""
+        published = f"**Published:** {f['published']}\n" if f["published"] else ""
+        relevance = (
+            f"**Relevance Score:** {f['score']} | **Areas:** {', '.join(f['areas'])}\n"
+            if f["areas"] else ""
+        )
+        fulltext = (
+            f"**Full-text Score:** {f['fulltext_score']}\n"
+            if f["fulltext_score"] is not None else ""
+        )
+        pdf = f"**PDF:** [Download]({f['pdf_url']})\n" if f["pdf_url"] else ""
+        similar = ""
+        if f["similar"]:
+            links = ", ".join(f"[{title}]({url})" for title, url in f["similar"])
+            similar = f"**Similar:** {links}\n"
+        abstract = f"**Abstract:** {f['abstract']}\n" if f["abstract"] else ""
+        return (
+            f"### {f['index']}. [{f['title']}]({f['url']})\n"
+            f"\n"
+            f"**Authors:** {f['authors']}\n"
+            f"{categories}{published}{relevance}{fulltext}{pdf}{similar}"
+            f"\n"
+            f"{abstract}"
+            f"\n"
+        )
+    
+    def footer(self) -> str:
+        return (
+            "---\n"
+            "\n"
+            "*This report was automatically generated by the KIGLAND arXiv Pipeline.*\n"
+            "*Thank you to arXiv for use of its open access interoperability.*"
+        )
+
+
+class HtmlDigestFormat(ReportFormat):
+    """A self-contained HTML digest, arxiv-YYYY-MM-DD.html."""
+    
+    name = "html"
+    suffix = ".html"
+    
+    def header(self, summary: Dict[str, Any]) -> str:
+        folded = summary["folded"]
+        folded = f" &middot; {folded} near-duplicates folded" if folded else ""
+        areas = "".join(
+            f"<li><b>{escape_html(area.title())}</b>: {count} papers</li>\n"
+            for area, count in summary["areas"]
+        )
+        return (
+            f"<!DOCTYPE html>\n"
+            f"<html lang=\"en\">\n"
+            f"<head>\n"
+            f"<meta charset=\"utf-8\">\n"
+            f"<title>KIGLAND arXiv Digest {summary['date']}</title>\n"
+            f"<style>body{{font-family:sans-serif;max-width:52em;margin:auto;padding:1em}}"
+            f"article{{border-top:1px solid #ddd;padding:.5em 0}}.meta{{color:#555}}</style>\n"
+            f"</head>\n"
+            f"<body>\n"
+            f"<h1>KIGLAND Daily arXiv Digest</h1>\n"
+            f"<p class=\"meta\">{summary['date']} &middot; "
+            f"{escape_html(', '.join(TARGET_CATEGORIES))} &middot; "
+            f"{summary['relevant']} relevant of {summary['total_fetched']} fetched{folded}</p>\n"
+            f"<ul>\n"
+            f"{areas}"
+            f"</ul>\n"
+            f"<ol>\n"
+        )
+    
+    def entry(self, f: Dict[str, Any]) -> str:
+        meta = escape_html(f["authors"])
+        if f["published"]:
+            meta += f" &middot; {escape_html(f['published'])}"
+        if f["categories"]:
+            meta += f" &middot; {escape_html(f['categories'])}"
+        relevance = ""
+        if f["areas"]:
+            fulltext = f["fulltext_score"]
+            fulltext = f" (full text {fulltext})" if fulltext is not None else ""
+            relevance = (
+                f"<p class=\"meta\">Score {f['score']}{fulltext} &middot; "
+                f"{escape_html(', '.join(f['areas']))}</p>\n"
+            )
+        links = [f"<a href=\"{escape_html(f['pdf_url'])}\">PDF</a>"] if f["pdf_url"] else []
+        links.extend(
+            f"<a href=\"{escape_html(url)}\">Similar: {escape_html(title)}</a>"
+            for title, url in f["similar"]
+        )
+        links = f"<p>{' &middot; '.join(links)}</p>\n" if links else ""
+        abstract = f"<p>{escape_html(f['abstract'])}</p>\n" if f["abstract"] else ""
+        title = escape_html(f["title"] or "Untitled")
+        return (
+            f"<li><article>\n"
+            f"<h2><a href=\"{escape_html(f['url'])}\">{title}</a></h2>\n"
+            f"<p class=\"meta\">{meta}</p>\n"
+            f"{relevance}{links}{abstract}"
+            f"</article></li>\n"
+        )
+    
+    def footer(self) -> str:
+        return (
+            "</ol>\n"
+            "<p class=\"meta\">Generated by the KIGLAND arXiv Pipeline. "
+            "Thank you to arXiv for use of its open access interoperability.</p>\n"
+            "</body>\n"
+            "</html>\n"
+        )
+
+
+class EmailFormat(ReportFormat):
+    """A plain-text email body, arxiv-YYYY-MM-DD.txt, wrapped at 72 columns."""
+    
+    name = "txt"
+    suffix = ".txt"
+    width = 72
+    
+    def __init__(self):
+        self._wrap = textwrap.TextWrapper(
+            width=self.width, initial_indent="   ", subsequent_indent="   "
+        ).fill
+    
+    def header(self, summary: Dict[str, Any]) -> str:
+        folded = summary["folded"]
+        folded = f" ({folded} near-duplicates folded)" if folded else ""
+        areas = "".join(
+            f"  {area.title():<24} {count:>4}\n" for area, count in summary["areas"]
+        )
+        return (
+            f"KIGLAND Daily arXiv Digest - {summary['date']}\n"
+            f"\n"
+            f"{summary['relevant']} relevant papers out of "
+            f"{summary['total_fetched']} fetched{folded}.\n"
+            f"\n"
+            f"{areas}"
+            f"\n"
+        )
+    
+    def entry(self, f: Dict[str, Any]) -> str:
+        details = ""
+        if f["areas"]:
+            details += f"   Score {f['score']}: {', '.join(f['areas'])}\n"
+        if f["fulltext_score"] is not None:
+            details += f"   Full-text score {f['fulltext_score']}\n"
+        for title, url in f["similar"]:
+            details += f"   Similar: {title} <{url}>\n"
+        abstract = f"{self._wrap(f['abstract'])}\n" if f["abstract"] else ""
+        return (
+            f"{f['index']}. {f['title'] or 'Untitled'}\n"
+            f"   {f['authors']}\n"
+            f"   {f['url']}\n"
+            f"{details}"
+            f"{abstract}"
+            f"\n"
+        )
+    
+    def footer(self) -> str:
+        return (
+            "--\n"
+            "Generated by the KIGLAND arXiv Pipeline.\n"
+            "Thank you to arXiv for use of its open access interoperability.\n"
+        )
+
+
+REPORT_FORMATS = {
+    format_class.name: format_class
+    for format_class in (MarkdownFormat, HtmlDigestFormat, EmailFormat)
+}
+
+
 class ReportGenerator:
     """
     Generates markdown reports from paper data.
@@ -490,151 +2347,565 @@ class ReportGenerator:
     
     def __init__(self):
         self.logger = logging.getLogger("arxiv_fetcher.report")
+        self.formats = {name: cls() for name, cls in REPORT_FORMATS.items()}
+    
+    def render(
+        self,
+        papers: List[Paper],
+        date: datetime,
+        total_fetched: int,
+        outputs: Dict[str, TextIO],
+        similar: Optional[Dict[str, List[Paper]]] = None
+    ) -> None:
+        """
+        Render the report in several formats in one pass over the papers.
+        
+        Each paper's fields are computed once and every format's entry is
+        written to its handle straight away, so no format holds more than
+        one entry in memory.
+        
+        Args:
+            papers: List of papers with relevance metadata
+            date: Date of the report
+            total_fetched: Total number of papers fetched
+            outputs: Open text handles to write to, by format name (md,
+                html, txt)
+            similar: Near-duplicates to fold into each paper's entry, by
+                paper id; folded papers are not listed on their own
+        """
+        similar = similar or {}
+        folded = {p.id for group in similar.values() for p in group}
+        writers = [(self.formats[name], handle.write) for name, handle in outputs.items()]
+        
+        # Count by focus area
+        area_counts = Counter(area for paper in papers for area in paper.matched_areas)
+        summary = {
+            "date": date.strftime("%Y-%m-%d"),
+            "total_fetched": total_fetched,
+            "relevant": len(papers),
+            "folded": len(folded),
+            "areas": sorted(area_counts.items(), key=lambda x: -x[1]),
+        }
+        for fmt, write in writers:
+            write(fmt.header(summary))
+        
+        listed = (paper for paper in papers if paper.id not in folded)
+        for i, paper in enumerate(listed, 1):
+            fields = self._paper_fields(paper, i, similar.get(paper.id))
+            for fmt, write in writers:
+                write(fmt.entry(fields))
+        
+        for fmt, write in writers:
+            write(fmt.footer())
     
     def generate_markdown(
         self,
-        papers: List[Dict[str, Any]],
+        papers: List[Paper],
         date: datetime,
-        total_fetched: int
+        total_fetched: int,
+        similar: Optional[Dict[str, List[Paper]]] = None
     ) -> str:
         """
         Generate a markdown report from paper list.
         
         Args:
-            papers: List of paper dictionaries with relevance metadata
+            papers: List of papers with relevance metadata
             date: Date of the report
             total_fetched: Total number of papers fetched
+            similar: Near-duplicates to fold into each paper's entry, by
+                paper id; folded papers are not listed on their own
             
         Returns:
             Markdown-formatted report string
         """
-        date_str = date.strftime("%Y-%m-%d")
+        buffer = io.StringIO()
+        self.render(papers, date, total_fetched, {"md": buffer}, similar=similar)
+        return buffer.getvalue()
+    
+    def _paper_fields(
+        self,
+        paper: Paper,
+        index: int,
+        similar: Optional[List[Paper]] = None
+    ) -> Dict[str, Any]:
+        """Display fields of a single paper entry, shared by all formats."""
+        # Metadata
+        authors = paper.authors
+        if len(authors) > 3:
+            author_str = f"{', '.join(authors[:3])} et al."
+        else:
+            author_str = ', '.join(authors) if authors else "Unknown"
         
-        lines = [
-            "# KIGLAND Daily arXiv Intelligence Report",
-            "",
-            f"**Date:** {date_str}",
-            f"**Categories:** {', '.join(TARGET_CATEGORIES)}",
-            f"**Total Papers Fetched:** {total_fetched}",
-            f"**Relevant Papers Found:** {len(papers)}",
-            "",
-            "---",
-            "",
+        # Publication date
+        published = paper.published
+        if published:
+            try:
+                pub_date = datetime.fromisoformat(published.replace('Z', '+00:00'))
+                published = pub_date.date().isoformat()
+            except ValueError:
+                pass
+        
+        # Abstract (truncated to ~300 chars)
+        summary = paper.summary
+        if len(summary) > 300:
+            summary = summary[:297] + "..."
+        
+        return {
+            "index": index,
+            "title": paper.title,  # Markdown keeps an empty title as empty link text
+            "url": paper.abstract_url or paper.id,
+            "authors": author_str,
+            "categories": ', '.join(paper.categories[:5]),
+            "published": published,
+            "score": paper.relevance_score,
+            "areas": paper.matched_areas,
+            "fulltext_score": paper.fulltext_score,
+            "pdf_url": paper.pdf_url,
+            "similar": [(p.title or "Untitled", p.abstract_url or p.id) for p in similar or ()],
+            "abstract": summary,
+        }
+    
+    def save_json(
+        self,
+        papers: List[Paper],
+        filepath: Path
+    ) -> None:
+        """Save papers as JSON file."""
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump([paper.to_dict() for paper in papers], f, indent=2, ensure_ascii=False)
+        self.logger.info(f"Saved JSON to {filepath}")
+    
+    def load_json(self, filepath: Path) -> List[Paper]:
+        """Load papers saved by save_json."""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return [Paper.from_dict(data) for data in json.load(f)]
+    
+    def save_jsonl(
+        self,
+        papers: List[Paper],
+        filepath: Path
+    ) -> None:
+        """
+        Save papers as gzipped JSON Lines.
+        
+        The first line is a header naming the schema and its version; each
+        following line is one paper. The gzip timestamp is fixed so that
+        rewriting unchanged papers gives an identical file.
+        """
+        header = {"schema": SCHEMA_NAME, "version": SCHEMA_VERSION, "count": len(papers)}
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        with open(filepath, 'wb') as raw, \
+                gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=6, mtime=0) as gz, \
+                io.TextIOWrapper(gz, encoding='utf-8') as f:
+            f.write(dumps(header) + "\n")
+            for paper in papers:
+                f.write(dumps(paper.to_dict()) + "\n")
+        self.logger.info(f"Saved JSON Lines to {filepath}")
+    
+    def iter_jsonl(self, filepath: Path) -> Iterator[Paper]:
+        """
+        Lazily read papers saved by save_jsonl, one line at a time.
+        
+        Raises:
+            ValueError: If the header is missing or from a newer schema version
+        """
+        with gzip.open(filepath, 'rt', encoding='utf-8') as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("schema") != SCHEMA_NAME:
+                raise ValueError(f"{filepath} is not a {SCHEMA_NAME} file")
+            if header.get("version", 0) > SCHEMA_VERSION:
+                raise ValueError(
+                    f"{filepath} uses schema version {header['version']}; "
+                    f"this script reads up to version {SCHEMA_VERSION}"
+                )
+            for line in f:
+                yield Paper.from_dict(json.loads(line))
+    
+    def save_papers(self, papers: List[Paper], filepath: Path) -> None:
+        """Save papers in the format given by the file name."""
+        if filepath.name.endswith(".jsonl.gz"):
+            self.save_jsonl(papers, filepath)
+        else:
+            self.save_json(papers, filepath)
+    
+    def iter_papers(self, filepath: Path) -> Iterator[Paper]:
+        """Read papers from a .jsonl.gz (lazily) or .json output."""
+        if filepath.name.endswith(".jsonl.gz"):
+            return self.iter_jsonl(filepath)
+        return iter(self.load_json(filepath))
+    
+    def load_papers(self, filepath: Path) -> List[Paper]:
+        """Load all papers from a .jsonl.gz or .json output."""
+        return list(self.iter_papers(filepath))
+    
+    def save_markdown(
+        self,
+        content: str,
+        filepath: Path
+    ) -> None:
+        """Save markdown report to file."""
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(content)
+        self.logger.info(f"Saved Markdown to {filepath}")
+
+
+# ============================================================================
+# Paper Index
+# ============================================================================
+
+class PaperIndex:
+    """
+    Cross-day SQLite index of saved papers with FTS5 full-text search.
+    
+    papers holds one row per arXiv id with the day it was reported under,
+    its scores and matched areas, and the full record as JSON. papers_fts is
+    an external-content FTS5 table over title and summary, kept in sync by
+    triggers.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS papers (
+            rowid INTEGER PRIMARY KEY,
+            id TEXT UNIQUE NOT NULL,
+            date TEXT NOT NULL,
+            title TEXT NOT NULL,
+            summary TEXT NOT NULL,
+            published TEXT,
+            primary_category TEXT,
+            categories TEXT,  -- space separated
+            relevance_score REAL,
+            fulltext_score REAL,
+            matched_areas TEXT,  -- space separated
+            abstract_url TEXT,
+            data TEXT NOT NULL  -- Paper.to_dict() as JSON
+        );
+        CREATE INDEX IF NOT EXISTS idx_papers_date ON papers(date);
+        
+        CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+            title, summary, content='papers', content_rowid='rowid'
+        );
+        
+        CREATE TRIGGER IF NOT EXISTS papers_ai AFTER INSERT ON papers BEGIN
+            INSERT INTO papers_fts(rowid, title, summary)
+            VALUES (new.rowid, new.title, new.summary);
+        END;
+        CREATE TRIGGER IF NOT EXISTS papers_ad AFTER DELETE ON papers BEGIN
+            INSERT INTO papers_fts(papers_fts, rowid, title, summary)
+            VALUES ('delete', old.rowid, old.title, old.summary);
+        END;
+        CREATE TRIGGER IF NOT EXISTS papers_au AFTER UPDATE ON papers BEGIN
+            INSERT INTO papers_fts(papers_fts, rowid, title, summary)
+            VALUES ('delete', old.rowid, old.title, old.summary);
+            INSERT INTO papers_fts(rowid, title, summary)
+            VALUES (new.rowid, new.title, new.summary);
+        END;
+    """
+    
+    # Title matches weigh more than abstract matches, as in RelevanceFilter
+    RANK = "bm25(papers_fts, 3.0, 1.0)"
+    
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self.conn: Optional[sqlite3.Connection] = None
+        self.logger = logging.getLogger("arxiv_fetcher.index")
+    
+    def get_connection(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use."""
+        if self.conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(self.db_path)
+            self.conn.row_factory = sqlite3.Row
+            self.conn.executescript(self.SCHEMA)
+        return self.conn
+    
+    def save_day(self, date_str: str, papers: List[Paper]) -> None:
+        """
+        Make the index match one day's saved papers, in a single transaction.
+        
+        Papers are upserted by id. Papers previously saved under this date
+        that are no longer in the list are removed.
+        
+        Args:
+            date_str: Report date (YYYY-MM-DD)
+            papers: The day's papers, as written to its JSON file
+        """
+        rows = [
+            (
+                paper.id, date_str, paper.title, paper.summary, paper.published,
+                paper.primary_category, " ".join(paper.categories),
+                paper.relevance_score, paper.fulltext_score,
+                " ".join(paper.matched_areas), paper.abstract_url,
+                json.dumps(paper.to_dict(), ensure_ascii=False),
+            )
+            for paper in papers
         ]
         
-        # Summary section
-        lines.extend([
-            "## 📊 Summary",
-            "",
-            f"This report covers {len(papers)} papers relevant to KIGLAND focus areas:",
-            "",
-        ])
+        conn = self.get_connection()
+        with conn:
+            conn.executemany("""
+                INSERT INTO papers (
+                    id, date, title, summary, published, primary_category,
+                    categories, relevance_score, fulltext_score, matched_areas,
+                    abstract_url, data
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    date = excluded.date,
+                    title = excluded.title,
+                    summary = excluded.summary,
+                    published = excluded.published,
+                    primary_category = excluded.primary_category,
+                    categories = excluded.categories,
+                    relevance_score = excluded.relevance_score,
+                    fulltext_score = excluded.fulltext_score,
+                    matched_areas = excluded.matched_areas,
+                    abstract_url = excluded.abstract_url,
+                    data = excluded.data
+            """, rows)
+            conn.execute(
+                "DELETE FROM papers WHERE date = ? "
+                "AND id NOT IN (SELECT value FROM json_each(?))",
+                (date_str, json.dumps([paper.id for paper in papers]))
+            )
+        self.logger.debug(f"Indexed {len(rows)} papers for {date_str}")
+    
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Full-text search over every indexed paper.
         
-        # Count by focus area
-        area_counts = {}
-        for paper in papers:
-            for area in paper.get("matched_areas", []):
-                area_counts[area] = area_counts.get(area, 0) + 1
+        Args:
+            query: FTS5 query; plain words must all match, "quoted phrases"
+                must match exactly. Falls back to literal words if the query
+                is not valid FTS5 syntax.
+            limit: Maximum results
+            start_date: Earliest report date to include
+            end_date: Latest report date to include
+            
+        Returns:
+            Best matches first, as dicts with date, id, title, abstract_url,
+            relevance_score, matched_areas and a highlighted snippet
+        """
+        sql = f"""
+            SELECT p.date, p.id, p.title, p.abstract_url, p.relevance_score,
+                   p.matched_areas,
+                   snippet(papers_fts, 1, '[', ']', '...', 12) AS snippet
+            FROM papers_fts
+            JOIN papers p ON p.rowid = papers_fts.rowid
+            WHERE papers_fts MATCH ?
+              AND p.date BETWEEN ? AND ?
+            ORDER BY {self.RANK}, p.relevance_score DESC
+            LIMIT ?
+        """
+        since = start_date.strftime("%Y-%m-%d") if start_date else "0000-00-00"
+        until = end_date.strftime("%Y-%m-%d") if end_date else "9999-99-99"
         
-        for area, count in sorted(area_counts.items(), key=lambda x: -x[1]):
-            lines.append(f"- **{area.title()}:** {count} papers")
+        conn = self.get_connection()
+        try:
+            rows = conn.execute(sql, (query, since, until, limit)).fetchall()
+        except sqlite3.OperationalError:
+            literal = " ".join('"' + word.replace('"', '""') + '"' for word in query.split())
+            rows = conn.execute(sql, (literal, since, until, limit)).fetchall()
+        return [dict(row) for row in rows]
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+# ============================================================================
+# Trend Analytics
+# ============================================================================
+
+class TrendAnalytics:
+    """
+    Weekly counts of authors, categories, category pairs and focus areas
+    over the saved daily outputs, with week-over-week trend reports.
+    
+    Counts are kept per ISO week in a JSON state file, along with the size
+    and mtime of every daily file that went into them. An update only
+    re-reads the files of weeks that gained or changed a file, so a weekly
+    run reads one week of outputs rather than the whole history.
+    """
+    
+    DIMENSIONS = ("areas", "categories", "category_pairs", "authors")
+    
+    def __init__(self, state_path: Path, report: Optional[ReportGenerator] = None):
+        self.state_path = state_path
+        self.report = report or ReportGenerator()
+        self.weeks: Dict[str, Dict[str, Any]] = {}
+        self.logger = logging.getLogger("arxiv_fetcher.trends")
+        self._load()
+    
+    @staticmethod
+    def week_of(day: datetime) -> str:
+        """ISO week key for a date, e.g. 2026-W05."""
+        year, week, _ = day.isocalendar()
+        return f"{year}-W{week:02d}"
+    
+    @staticmethod
+    def week_start(week: str) -> datetime:
+        """Monday of an ISO week key."""
+        return datetime.strptime(f"{week}-1", "%G-W%V-%u")
+    
+    def _load(self) -> None:
+        """Load saved weekly counts, starting empty if there are none."""
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        if state.get("version") != TRENDS_STATE_VERSION:
+            self.logger.info("Trend state is from another version; rebuilding")
+            return
+        self.weeks = state["weeks"]
+    
+    def _save(self) -> None:
+        """Write weekly counts atomically."""
+        tmp = self.state_path.with_name(f"{self.state_path.name}.{os.getpid()}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(
+                {"version": TRENDS_STATE_VERSION, "weeks": self.weeks},
+                f, ensure_ascii=False, separators=(",", ":")
+            )
+        os.replace(tmp, self.state_path)
+    
+    def update(self, paths: List[Path]) -> Dict[str, int]:
+        """
+        Bring weekly counts up to date with the saved daily outputs.
+        
+        Args:
+            paths: Every saved daily papers file (see saved_json_paths)
+            
+        Returns:
+            Dictionary with the number of weeks recounted and files read
+        """
+        by_week: Dict[str, List[Path]] = {}
+        for path in paths:
+            day = datetime.strptime(DAILY_JSON_PATTERN.match(path.name).group(1), "%Y-%m-%d")
+            by_week.setdefault(self.week_of(day), []).append(path)
+        
+        recounted = files_read = 0
+        for week, week_paths in sorted(by_week.items()):
+            fingerprints = {}
+            for path in week_paths:
+                stat = path.stat()
+                fingerprints[path.name] = [stat.st_mtime_ns, stat.st_size]
+            if self.weeks.get(week, {}).get("files") == fingerprints:
+                continue
+            
+            self.weeks[week] = {"files": fingerprints, **self._count(week_paths)}
+            recounted += 1
+            files_read += len(week_paths)
         
-        lines.extend(["", "---", ""])
+        for week in set(self.weeks) - set(by_week):
+            del self.weeks[week]
         
-        # Papers section
-        lines.extend([
-            "## 📄 Papers",
+        self._save()
+        self.logger.info(f"Recounted {recounted} weeks from {files_read} files")
+        return {"weeks_recounted": recounted, "files_read": files_read}
+    
+    def _count(self, paths: List[Path]) -> Dict[str, Any]:
+        """Count one week's papers, each paper once however many days list it."""
+        counters = {dimension: Counter() for dimension in self.DIMENSIONS}
+        seen = set()
+        for path in paths:
+            for paper in self.report.iter_papers(path):
+                if paper.id in seen:
+                    continue
+                seen.add(paper.id)
+                counters["areas"].update(paper.matched_areas)
+                categories = sorted(set(paper.categories))
+                counters["categories"].update(categories)
+                counters["category_pairs"].update(
+                    f"{a} + {b}" for a, b in itertools.combinations(categories, 2)
+                )
+                counters["authors"].update(paper.authors)
+        return {"papers": len(seen), **{k: dict(v) for k, v in counters.items()}}
+    
+    def latest_week(self) -> Optional[str]:
+        """Most recent week with any counts."""
+        return max(self.weeks) if self.weeks else None
+    
+    def trend_report(self, week: str, top: int = 10) -> str:
+        """
+        Markdown trend report for a week compared with the week before.
+        
+        Args:
+            week: ISO week key, e.g. 2026-W05
+            top: Rows per table
+            
+        Returns:
+            Markdown-formatted report string
+        """
+        start = self.week_start(week)
+        previous = self.week_of(start - timedelta(days=7))
+        current_week = self.weeks.get(week, {})
+        previous_week = self.weeks.get(previous, {})
+        papers = current_week.get("papers", 0)
+        
+        lines = [
+            f"# KIGLAND arXiv Trends: {week}",
+            "",
+            f"**Week:** {start.strftime('%Y-%m-%d')} to "
+            f"{(start + timedelta(days=6)).strftime('%Y-%m-%d')}",
+            f"**Papers:** {papers} ({self._delta(papers, previous_week.get('papers', 0))} "
+            f"vs {previous})",
+            f"**Days Covered:** {len(current_week.get('files', {}))}",
             "",
-        ])
+            "---",
+            "",
+        ]
         
-        for i, paper in enumerate(papers, 1):
-            lines.extend(self._format_paper(paper, i))
+        sections = (
+            ("Focus Areas", "areas", "Area", False),
+            ("Rising Category Pairs", "category_pairs", "Categories", True),
+            ("Categories", "categories", "Category", False),
+            ("Rising Authors", "authors", "Author", True),
+        )
+        for title, dimension, label, rising in sections:
+            current = Counter(current_week.get(dimension, {}))
+            before = Counter(previous_week.get(dimension, {}))
+            if rising:
+                # Biggest week-over-week gains first
+                keys = sorted(
+                    current, key=lambda k: (current[k] - before[k], current[k], k),
+                    reverse=True
+                )[:top]
+            else:
+                keys = [k for k, _ in sorted(current.items(), key=lambda x: (-x[1], x[0]))[:top]]
+            
+            lines.extend([f"## {title}", ""])
+            if not keys:
+                lines.extend(["*No data.*", ""])
+                continue
+            lines.extend([
+                f"| {label} | Papers | Change |",
+                "|---|---:|---:|",
+            ])
+            for key in keys:
+                lines.append(f"| {key} | {current[key]} | {self._delta(current[key], before[key])} |")
             lines.append("")
         
-        # Footer
         lines.extend([
             "---",
             "",
             "*This report was automatically generated by the KIGLAND arXiv Pipeline.*",
-            "*Thank you to arXiv for use of its open access interoperability.*",
         ])
-        
         return "\n".join(lines)
     
-    def _format_paper(self, paper: Dict[str, Any], index: int) -> List[str]:
-        """Format a single paper entry."""
-        lines = []
-        
-        # Title with link
-        title = paper.get("title", "Untitled")
-        abstract_url = paper.get("abstract_url") or paper.get("id", "")
-        lines.append(f"### {index}. [{title}]({abstract_url})")
-        lines.append("")
-        
-        # Metadata
-        authors = paper.get("authors", [])
-        if len(authors) > 3:
-            author_str = f"{', '.join(authors[:3])} et al."
-        else:
-            author_str = ', '.join(authors) if authors else "Unknown"
-        lines.append(f"**Authors:** {author_str}")
-        
-        # Categories
-        categories = paper.get("categories", [])
-        if categories:
-            lines.append(f"**Categories:** {', '.join(categories[:5])}")
-        
-        # Publication date
-        published = paper.get("published", "")
-        if published:
-            try:
-                pub_date = datetime.fromisoformat(published.replace('Z', '+00:00'))
-                lines.append(f"**Published:** {pub_date.strftime('%Y-%m-%d')}")
-            except:
-                lines.append(f"**Published:** {published}")
-        
-        # Relevance
-        score = paper.get("relevance_score", 0)
-        matched_areas = paper.get("matched_areas", [])
-        if matched_areas:
-            lines.append(f"**Relevance Score:** {score} | **Areas:** {', '.join(matched_areas)}")
-        
-        # Links
-        pdf_url = paper.get("pdf_url", "")
-        if pdf_url:
-            lines.append(f"**PDF:** [Download]({pdf_url})")
-        
-        lines.append("")
-        
-        # Abstract (truncated)
-        summary = paper.get("summary", "")
-        if summary:
-            # Truncate to ~300 chars
-            if len(summary) > 300:
-                summary = summary[:297] + "..."
-            lines.append(f"**Abstract:** {summary}")
-        
-        return lines
-    
-    def save_json(
-        self,
-        papers: List[Dict[str, Any]],
-        filepath: Path
-    ) -> None:
-        """Save papers as JSON file."""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(papers, f, indent=2, ensure_ascii=False)
-        self.logger.info(f"Saved JSON to {filepath}")
-    
-    def save_markdown(
-        self,
-        content: str,
-        filepath: Path
-    ) -> None:
-        """Save markdown report to file."""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        self.logger.info(f"Saved Markdown to {filepath}")
+    @staticmethod
+    def _delta(current: int, previous: int) -> str:
+        """Week-over-week change, marking keys that are new this week."""
+        if previous == 0 and current > 0:
+            return "new"
+        return f"{current - previous:+d}"
 
 
 # ============================================================================
@@ -646,16 +2917,64 @@ class ArxivPipeline:
     Main pipeline for fetching and processing arXiv papers.
     """
     
-    def __init__(self, output_dir: Path = OUTPUT_DIR):
+    def __init__(
+        self,
+        output_dir: Path = OUTPUT_DIR,
+        cache_dir: Optional[Path] = None,
+        use_cache: bool = True,
+        page_ceiling: int = PAGE_CEILING,
+        scorer: str = "keyword",
+        pdf_dir: Optional[Path] = None,
+        pdf_workers: int = PDF_WORKERS,
+        dedup_threshold: Optional[float] = None,
+        use_index: bool = True,
+        keep_alive: bool = False,
+        output_format: str = "jsonl",
+        report_formats: Iterable[str] = ("md",),
+        record_dir: Optional[Path] = None,
+        replay_dir: Optional[Path] = None
+    ):
         self.output_dir = output_dir
-        self.api = ArxivAPI()
-        self.filter = RelevanceFilter()
+        self.output_format = output_format
+        self.report_formats = list(dict.fromkeys(report_formats))
+        self.metrics = PipelineMetrics()
+        self.cache = None
+        if use_cache and not replay_dir:
+            self.cache = ResponseCache(cache_dir or output_dir / CACHE_DIRNAME)
+        if record_dir:
+            self.cache = FixtureRecorder(ResponseCache(record_dir), self.cache)
+        
+        if replay_dir:
+            self.api = ReplayArxivAPI(
+                ResponseCache(replay_dir), page_ceiling=page_ceiling, metrics=self.metrics
+            )
+        else:
+            api_class = KeepAliveArxivAPI if keep_alive else ArxivAPI
+            self.api = api_class(
+                cache=self.cache, page_ceiling=page_ceiling, metrics=self.metrics
+            )
+        self.scorer = scorer
+        self.filter = SCORERS[scorer](metrics=self.metrics)
+        self.pdf_store = PdfStore(pdf_dir or output_dir / PDF_DIRNAME)
+        self.pdfs = PdfFetcher(
+            self.pdf_store, workers=pdf_workers, metrics=self.metrics
+        )
+        self.dedup = None
+        if dedup_threshold is not None:
+            self.dedup = PaperDeduplicator(threshold=dedup_threshold)
         self.report = ReportGenerator()
+        self.index = PaperIndex(output_dir / INDEX_FILENAME) if use_index else None
         self.logger = logging.getLogger("arxiv_fetcher.pipeline")
         
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
+    def close(self) -> None:
+        """Close the API client and the search index."""
+        self.api.close()
+        if self.index:
+            self.index.close()
+    
     def build_query(self, date: Optional[datetime] = None) -> str:
         """
         Build the search query for target categories and date.
@@ -686,16 +3005,29 @@ class ArxivPipeline:
         date: Optional[datetime] = None,
         test_mode: bool = False,
         min_score: float = 1.0,
-        max_papers: Optional[int] = None
+        max_papers: Optional[int] = None,
+        top_k: Optional[int] = None,
+        incremental: bool = True,
+        fetch_pdfs: int = 0
     ) -> Dict[str, Any]:
         """
         Run the full pipeline.
         
+        If an earlier run already produced this date's JSON, only papers that
+        are new or updated since its watermark are fetched and merged in. The
+        watermark only applies to the scorer, min_score and top_k it was
+        written with; papers dropped by an earlier filter are never saved, so
+        a change in any of them forces a full fetch.
+        
         Args:
             date: Target date for fetching papers
             test_mode: If True, fetch only a small batch for testing
             min_score: Minimum relevance score for filtering
             max_papers: Maximum papers to fetch (None for unlimited)
+            top_k: Keep only the top_k most relevant papers (None for all)
+            incremental: Resume from the saved watermark when there is one
+            fetch_pdfs: Download PDFs of the N most relevant papers, score
+                their full text and re-rank them on it (0 to skip)
             
         Returns:
             Dictionary with results summary
@@ -703,26 +3035,76 @@ class ArxivPipeline:
         if date is None:
             date = datetime.now() - timedelta(days=1)
         
+        self.metrics.reset()
         self.logger.info(f"Starting arXiv pipeline for {date.strftime('%Y-%m-%d')}")
         self.logger.info(f"Test mode: {test_mode}")
         
         # Build query
         query = self.build_query(date)
         self.logger.debug(f"Query: {query}")
+        self.api.cache_not_before = self._cache_not_before(date)
+        
+        date_str = date.strftime("%Y-%m-%d")
+        json_path = self.papers_path(date_str)
+        saved_path = self._saved_papers_path(date_str)
+        watermark_path = self.watermark_path(date_str)
+        
+        filter_params = {"scorer": self.scorer, "min_score": min_score, "top_k": top_k}
+        watermark = None
+        if incremental and not test_mode and saved_path:
+            if self.filter.batch_dependent:
+                # A merge of saved and new papers would change every paper's IDF
+                self.logger.info(
+                    f"The {self.scorer} scorer needs the whole day; doing a full fetch"
+                )
+            else:
+                watermark = self._load_watermark(watermark_path, query, filter_params)
         
         # Fetch papers
+        known = {"ids": set(), "updated": ""}
         if test_mode:
             self.logger.info("Test mode: fetching small batch (10 papers)")
-            xml_data = self.api.fetch(query, start=0, max_results=10)
-            papers = self.api._parse_entries(xml_data)
+            stream = self.api.open_page(query, start=0, max_results=10)
+        elif watermark:
+            self.logger.info(
+                f"Incremental run: {len(watermark['ids'])} papers known, "
+                f"last updated {watermark['updated']}"
+            )
+            known_ids = set(watermark["ids"])
+            last_updated = watermark["updated"]
+            known["ids"].update(known_ids)
+            known["updated"] = last_updated
+            # The lastUpdatedDate head page changes during the day, so a cached
+            # copy from an earlier run would hide every update since then
+            self.api.cache_not_before = time.time()
+            # Newest updates come first; stop at the first unchanged known paper
+            stream = self.api.iter_all(
+                query,
+                max_total=max_papers or 500,
+                sort_by="lastUpdatedDate",
+                until=lambda p: p.id in known_ids and p.updated <= last_updated,
+                page_size=BATCH_SIZE
+            )
         else:
             max_fetch = max_papers or 500
-            papers = self.api.fetch_all(query, max_total=max_fetch)
+            stream = self.api.iter_all(query, max_total=max_fetch)
+        
+        papers = self._counted(stream, self.metrics.counters, known)
+        if watermark:
+            # Merge new and updated papers into the saved ones
+            papers = self._latest(
+                itertools.chain(self.report.iter_papers(saved_path), papers)
+            )
+        
+        # Filter by relevance; papers are scored as they stream in
+        relevant_papers = self.filter.filter_papers(
+            papers, min_score=min_score, top_k=top_k
+        )
         
-        total_fetched = len(papers)
-        self.logger.info(f"Fetched {total_fetched} papers")
+        total_fetched = len(known["ids"])
+        self.logger.info(f"Fetched {self.metrics.counters['papers_fetched']} papers")
         
-        if not papers:
+        if not total_fetched:
             self.logger.warning("No papers found for the specified criteria")
             return {
                 "date": date.strftime("%Y-%m-%d"),
@@ -731,41 +3113,433 @@ class ArxivPipeline:
                 "output_files": []
             }
         
-        # Filter by relevance
-        relevant_papers = self.filter.filter_papers(papers, min_score=min_score)
         self.logger.info(f"Found {len(relevant_papers)} relevant papers")
+        self.metrics.count("papers_relevant", len(relevant_papers))
         
-        # Generate report
-        date_str = date.strftime("%Y-%m-%d")
-        markdown_content = self.report.generate_markdown(
-            relevant_papers, date, total_fetched
-        )
+        if fetch_pdfs > 0:
+            self._score_full_text(relevant_papers[:fetch_pdfs])
+            relevant_papers.sort(key=self.filter.rank_key, reverse=True)
+        
+        # Fold near-duplicates into the best-ranked paper of each group
+        similar = None
+        if self.dedup:
+            with self.metrics.stage("dedup"):
+                groups = self.dedup.group(relevant_papers)
+            similar = {g[0].id: g[1:] for g in groups if len(g) > 1}
+            self.metrics.count("near_duplicates", len(relevant_papers) - len(groups))
         
         # Save outputs
         output_files = []
         
         # JSON output
-        json_path = self.output_dir / f"arxiv-{date_str}.json"
-        self.report.save_json(relevant_papers, json_path)
+        with self.metrics.stage("save_json"):
+            self.report.save_papers(relevant_papers, json_path)
         output_files.append(str(json_path))
-        
-        # Markdown report
-        md_path = self.output_dir / f"arxiv-{date_str}.md"
-        self.report.save_markdown(markdown_content, md_path)
-        output_files.append(str(md_path))
+        if saved_path and saved_path != json_path:
+            self.logger.warning(
+                f"Leaving {saved_path.name} in place; {json_path.name} is read "
+                "from now on"
+            )
+        
+        if not test_mode:
+            self._save_watermark(watermark_path, query, filter_params, known)
+        
+        if self.index:
+            with self.metrics.stage("save_index"):
+                self.index.save_day(date_str, relevant_papers)
+        
+        # Reports, rendered in one pass straight to their files
+        report_paths = {
+            name: self.output_dir / f"arxiv-{date_str}{REPORT_FORMATS[name].suffix}"
+            for name in self.report_formats
+        }
+        with self.metrics.stage("render_report"), ExitStack() as stack:
+            outputs = {
+                name: stack.enter_context(open(path, 'w', encoding='utf-8'))
+                for name, path in report_paths.items()
+            }
+            self.report.render(
+                relevant_papers, date, total_fetched, outputs, similar=similar
+            )
+        for path in report_paths.values():
+            self.logger.info(f"Saved report to {path}")
+            output_files.append(str(path))
+        
+        # Metrics
+        metrics = self.metrics.to_dict()
+        metrics_path = self.output_dir / f"arxiv-{date_str}.metrics.json"
+        with open(metrics_path, 'w', encoding='utf-8') as f:
+            json.dump({"date": date_str, **metrics}, f, indent=2)
+        output_files.append(str(metrics_path))
         
         # Summary
         result = {
             "date": date_str,
             "total_fetched": total_fetched,
             "relevant_count": len(relevant_papers),
-            "output_files": output_files
+            "output_files": output_files,
+            "metrics": metrics
         }
         
         self.logger.info("Pipeline completed successfully")
         self.logger.info(f"Results saved to: {self.output_dir}")
         
         return result
+    
+    def backfill(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        **run_kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the pipeline for every date in a range.
+        
+        Args:
+            start_date: First date to process
+            end_date: Last date to process (inclusive)
+            **run_kwargs: Passed through to run()
+            
+        Returns:
+            List of per-day result summaries
+        """
+        results = []
+        days = (end_date.date() - start_date.date()).days + 1
+        self.logger.info(
+            f"Backfilling {days} days: {start_date.strftime('%Y-%m-%d')} "
+            f"to {end_date.strftime('%Y-%m-%d')}"
+        )
+        
+        for offset in range(days):
+            date = start_date + timedelta(days=offset)
+            results.append(self.run(date=date, **run_kwargs))
+        
+        if self.cache is not None:
+            self.logger.info(
+                f"Response cache: {self.cache.hits} hits, {self.cache.misses} misses"
+            )
+        
+        return results
+    
+    def papers_path(self, date_str: str) -> Path:
+        """Path of a day's papers file in the current output format."""
+        return self.output_dir / f"arxiv-{date_str}{OUTPUT_SUFFIXES[self.output_format]}"
+    
+    def watermark_path(self, date_str: str) -> Path:
+        """Path of a day's incremental-fetch watermark."""
+        return self.output_dir / f"arxiv-{date_str}.watermark.json"
+    
+    def _saved_papers_path(self, date_str: str) -> Optional[Path]:
+        """Existing papers file for a day, preferring the current format."""
+        for output_format in (self.output_format, *OUTPUT_SUFFIXES):
+            path = self.output_dir / f"arxiv-{date_str}{OUTPUT_SUFFIXES[output_format]}"
+            if path.exists():
+                return path
+        return None
+    
+    def saved_json_paths(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Path]:
+        """
+        List saved daily outputs (.jsonl.gz or .json), optionally within a
+        date range. If a day has both, only the current format's is listed.
+        """
+        by_day: Dict[str, Path] = {}
+        preferred = OUTPUT_SUFFIXES[self.output_format]
+        for path in sorted(self.output_dir.iterdir()):
+            match = DAILY_JSON_PATTERN.match(path.name)
+            if not match:
+                continue
+            day = match.group(1)
+            if start_date and day < start_date.strftime("%Y-%m-%d"):
+                continue
+            if end_date and day > end_date.strftime("%Y-%m-%d"):
+                continue
+            if day in by_day:
+                skipped = by_day[day] if path.name.endswith(preferred) else path
+                self.logger.warning(
+                    f"Skipping {skipped.name}; {day} also has a {preferred} file"
+                )
+            if day not in by_day or path.name.endswith(preferred):
+                by_day[day] = path
+        return [by_day[day] for day in sorted(by_day)]
+    
+    def rescore(
+        self,
+        paths: List[Path],
+        workers: Optional[int] = None,
+        chunk_size: int = RESCORE_CHUNK_SIZE,
+        min_score: float = 1.0,
+        top_k: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Re-score saved daily outputs with the current keywords and scorer.
+        
+        Papers from all files are scored in chunks on a process pool, then
+        each file is filtered and re-ranked like run() and written back in
+        place, so papers that no longer reach min_score (or fall outside
+        top_k) are dropped from the file and the index. With workers=1 the
+        scoring runs in this process; both paths give identical results.
+        
+        Papers whose PDF is still in the store have their full text scored
+        again and blended in as run() does; papers whose PDF is gone lose
+        their full-text score. Each day's watermark is deleted, since the
+        papers it marks as seen were filtered with the old keywords; the
+        next fetch of that day is a full one.
+        
+        Scorers whose scores depend on the whole day (BM25) are not
+        supported: saved files keep only the papers that passed the filter,
+        so the day's corpus cannot be rebuilt from them.
+        
+        Args:
+            paths: Daily JSON files to rescore
+            workers: Worker processes (default: CPU count)
+            chunk_size: Papers per task
+            min_score: Minimum relevance score to keep
+            top_k: Keep only the top_k most relevant papers per day (None for all)
+            
+        Returns:
+            Dictionary with results summary
+            
+        Raises:
+            ValueError: If the pipeline's scorer is batch dependent
+        """
+        if self.filter.batch_dependent:
+            raise ValueError(
+                f"rescore does not support the {self.scorer} scorer; "
+                "saved files keep only the papers that passed the filter"
+            )
+        
+        workers = workers or os.cpu_count() or 1
+        start = time.perf_counter()
+        
+        files = [(path, self.report.load_papers(path)) for path in paths]
+        items = [
+            (paper.title, paper.summary, paper.categories, self._stored_text_path(paper))
+            for _, papers in files for paper in papers
+        ]
+        chunks = [
+            (self.scorer, items[i:i + chunk_size])
+            for i in range(0, len(items), chunk_size)
+        ]
+        self.logger.info(
+            f"Rescoring {len(items)} papers from {len(files)} files "
+            f"({len(chunks)} chunks, {workers} workers)"
+        )
+        
+        if workers == 1:
+            scored = map(_score_chunk, chunks)
+        else:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            scored = executor.map(_score_chunk, chunks)
+        
+        dropped = 0
+        try:
+            results = itertools.chain.from_iterable(scored)
+            for path, papers in files:
+                for paper, (score, matched_areas, fulltext_score) in zip(papers, results):
+                    paper.relevance_score = score
+                    paper.matched_areas = matched_areas
+                    paper.fulltext_score = fulltext_score
+                kept = [paper for paper in papers if paper.relevance_score >= min_score]
+                kept.sort(key=self.filter.rank_key, reverse=True)
+                if top_k:
+                    kept = kept[:top_k]
+                dropped += len(papers) - len(kept)
+                papers = kept
+                self.report.save_papers(papers, path)
+                day = DAILY_JSON_PATTERN.match(path.name).group(1)
+                self.watermark_path(day).unlink(missing_ok=True)
+                if self.index:
+                    self.index.save_day(day, papers)
+        finally:
+            if workers != 1:
+                executor.shutdown()
+        
+        elapsed = time.perf_counter() - start
+        self.logger.info(
+            f"Rescored {len(items)} papers in {elapsed:.2f}s, "
+            f"dropped {dropped} below the filter (min_score={min_score})"
+        )
+        
+        return {
+            "files": len(files),
+            "papers": len(items),
+            "dropped": dropped,
+            "workers": workers,
+            "seconds": round(elapsed, 3),
+        }
+    
+    def reindex(self, paths: List[Path]) -> Dict[str, Any]:
+        """
+        Load saved daily outputs into the search index, one transaction per day.
+        
+        Args:
+            paths: Daily JSON files to index
+            
+        Returns:
+            Dictionary with results summary
+        """
+        if self.index is None:
+            raise ValueError("Pipeline was created without an index")
+        
+        start = time.perf_counter()
+        papers = 0
+        for path in paths:
+            day_papers = self.report.load_papers(path)
+            day = DAILY_JSON_PATTERN.match(path.name).group(1)
+            self.index.save_day(day, day_papers)
+            papers += len(day_papers)
+        
+        elapsed = time.perf_counter() - start
+        self.logger.info(f"Indexed {papers} papers from {len(paths)} files in {elapsed:.2f}s")
+        
+        return {
+            "files": len(paths),
+            "papers": papers,
+            "seconds": round(elapsed, 3),
+        }
+    
+    def trends(self, date: Optional[datetime] = None, top: int = 10) -> Dict[str, Any]:
+        """
+        Update weekly counts and write a week-over-week trend report.
+        
+        Args:
+            date: Any date in the week to report (default: latest week with data)
+            top: Rows per table
+            
+        Returns:
+            Dictionary with results summary
+        """
+        analytics = TrendAnalytics(self.output_dir / TRENDS_STATE_FILENAME, self.report)
+        summary = analytics.update(self.saved_json_paths())
+        
+        week = analytics.week_of(date) if date else analytics.latest_week()
+        if week is None:
+            self.logger.warning("No saved outputs to analyse")
+            return {"week": None, "output_files": [], **summary}
+        
+        report_path = self.output_dir / f"arxiv-trends-{week}.md"
+        self.report.save_markdown(analytics.trend_report(week, top=top), report_path)
+        return {"week": week, "output_files": [str(report_path)], **summary}
+    
+    def _stored_text_path(self, paper: Paper) -> Optional[str]:
+        """Path of a paper's extracted PDF text, or None if its PDF is not stored."""
+        if not paper.pdf_sha256 or not self.pdf_store.object_path(paper.pdf_sha256).exists():
+            return None
+        self.pdf_store.text(paper.pdf_sha256)  # Extract now if it never was
+        return str(self.pdf_store.object_path(paper.pdf_sha256, ".txt"))
+    
+    def _score_full_text(self, papers: List[Paper]) -> None:
+        """
+        Fetch PDFs for some papers and fold their full-text scores into
+        their relevance scores (FULLTEXT_WEIGHT of the result). The caller
+        re-sorts.
+        """
+        with self.metrics.stage("fetch_pdfs"):
+            digests = self.pdfs.fetch(papers)
+        
+        for paper in papers:
+            digest = digests.get(paper.id)
+            if digest is None:
+                continue
+            with self.metrics.stage("extract_text"):
+                text = self.pdf_store.text(digest)
+            score, _ = self.filter.calculate_score(paper, text=text)
+            paper.pdf_sha256 = digest
+            paper.fulltext_score = round(score, 2)
+            paper.relevance_score = _blend_fulltext(paper.relevance_score, score)
+        
+        self.logger.info(f"Scored full text of {len(digests)}/{len(papers)} papers")
+    
+    @staticmethod
+    def _counted(
+        papers: Iterable[Paper],
+        counts: Dict[str, int],
+        known: Dict[str, Any]
+    ) -> Iterator[Paper]:
+        """
+        Pass papers through, counting them in counts["papers_fetched"] and adding
+        them to the known ids and latest updated timestamp.
+        """
+        for paper in papers:
+            counts["papers_fetched"] += 1
+            known["ids"].add(paper.id)
+            if paper.updated > known["updated"]:
+                known["updated"] = paper.updated
+            yield paper
+    
+    @staticmethod
+    def _latest(papers: Iterable[Paper]) -> List[Paper]:
+        """Keep only the most recently updated record of each paper."""
+        latest: Dict[str, Paper] = {}
+        for paper in papers:
+            current = latest.get(paper.id)
+            if current is None or paper.updated >= current.updated:
+                latest[paper.id] = paper
+        return list(latest.values())
+    
+    def _load_watermark(
+        self,
+        path: Path,
+        query: str,
+        filter_params: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load a date's watermark, ignoring it if it belongs to another query
+        or was written with different filter parameters.
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                watermark = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if watermark.get("query") != query:
+            self.logger.info("Watermark is for a different query; doing a full fetch")
+            return None
+        
+        if watermark.get("filter") != filter_params:
+            self.logger.info(
+                "Watermark was written with different scorer, --min-score or "
+                "--top-k; doing a full fetch"
+            )
+            return None
+        
+        return watermark
+    
+    def _save_watermark(
+        self,
+        path: Path,
+        query: str,
+        filter_params: Dict[str, Any],
+        known: Dict[str, Any]
+    ) -> None:
+        """Record the latest updated timestamp and every paper id seen."""
+        watermark = {
+            "query": query,
+            "filter": filter_params,
+            "updated": known["updated"],
+            "ids": sorted(known["ids"]),
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(watermark, f)
+    
+    def _cache_not_before(self, date: datetime) -> Optional[float]:
+        """
+        Return the oldest acceptable cache timestamp for a date's query.
+        
+        arXiv results only change at midnight, so recent dates are served from
+        cache only if the page was stored since the last midnight. Dates older
+        than SETTLED_DAYS no longer change and any cached page is valid.
+        """
+        now = datetime.now()
+        if (now.date() - date.date()).days > SETTLED_DAYS:
+            return None
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return midnight.timestamp()
 
 
 # ============================================================================
@@ -777,11 +3551,40 @@ def main():
     parser = argparse.ArgumentParser(
         description="Fetch and process daily arXiv papers for KIGLAND research"
     )
+    parser.add_argument(
+        "command",
+        nargs="?",
+        default="fetch",
+        choices=["fetch", "rescore", "index", "search", "trends"],
+        help="fetch: run the daily pipeline (default); "
+             "rescore: re-score saved JSON outputs with the current keywords; "
+             "index: load saved JSON outputs into the search index; "
+             "search: query the search index; "
+             "trends: write a week-over-week trend report"
+    )
+    parser.add_argument(
+        "query",
+        nargs="?",
+        help="Search query for the search command (FTS5 syntax, "
+             "e.g. 'pose estimation' or '\"digital twin\"')"
+    )
     parser.add_argument(
         "--date",
         type=str,
         help="Date to fetch papers for (YYYY-MM-DD format, default: yesterday)"
     )
+    parser.add_argument(
+        "--from",
+        dest="from_date",
+        type=str,
+        help="Backfill start date (YYYY-MM-DD format)"
+    )
+    parser.add_argument(
+        "--to",
+        dest="to_date",
+        type=str,
+        help="Backfill end date, inclusive (YYYY-MM-DD format, default: yesterday)"
+    )
     parser.add_argument(
         "--test",
         action="store_true",
@@ -799,12 +3602,129 @@ def main():
         default=None,
         help="Maximum papers to fetch (default: unlimited)"
     )
+    parser.add_argument(
+        "--scorer",
+        choices=sorted(SCORERS),
+        default="keyword",
+        help="Relevance scorer (default: keyword; bm25 requires numpy)"
+    )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=None,
+        help="Keep only the N most relevant papers (default: all above --min-score)"
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="Maximum search results, or rows per trends table (default: 20)"
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=PAGE_CEILING,
+        help=f"Largest page to request per API call (default: {PAGE_CEILING}, "
+             f"max: {ARXIV_MAX_PAGE_SIZE})"
+    )
     parser.add_argument(
         "--output-dir",
         type=str,
         default=str(OUTPUT_DIR),
         help=f"Output directory (default: {OUTPUT_DIR})"
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help=f"Raw response cache directory (default: <output-dir>/{CACHE_DIRNAME})"
+    )
+    parser.add_argument(
+        "--keep-alive",
+        action="store_true",
+        help="Send every API request over one persistent connection"
+    )
+    parser.add_argument(
+        "--record",
+        metavar="DIR",
+        help="Also save every API page the run uses to DIR, for --replay"
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="Serve API pages from a --record directory, offline and without "
+             "rate limiting"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the arXiv API, bypassing the response cache"
+    )
+    parser.add_argument(
+        "--pretty-json",
+        action="store_true",
+        help="Save papers as indented arxiv-YYYY-MM-DD.json instead of .jsonl.gz"
+    )
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        choices=sorted(REPORT_FORMATS),
+        default=["md"],
+        help="Report formats to render in one pass: md, html digest, txt email "
+             "(default: md)"
+    )
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help=f"Do not update the search index ({INDEX_FILENAME} in the output directory)"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Refetch the whole day instead of resuming from the saved watermark"
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Fold near-duplicate papers together in the report (requires numpy)"
+    )
+    parser.add_argument(
+        "--dedup-threshold",
+        type=float,
+        default=DEDUP_THRESHOLD,
+        help=f"Cosine similarity for papers to count as near-duplicates "
+             f"(default: {DEDUP_THRESHOLD})"
+    )
+    parser.add_argument(
+        "--fetch-pdfs",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Download PDFs of the N most relevant papers and score their full text"
+    )
+    parser.add_argument(
+        "--pdf-workers",
+        type=int,
+        default=PDF_WORKERS,
+        help=f"Concurrent PDF downloads (default: {PDF_WORKERS})"
+    )
+    parser.add_argument(
+        "--pdf-dir",
+        type=str,
+        default=None,
+        help=f"PDF store directory (default: <output-dir>/{PDF_DIRNAME})"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for rescore (default: CPU count)"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-stage timings and counters after each run"
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -816,36 +3736,149 @@ def main():
     # Setup logging
     logger = setup_logging(verbose=args.verbose)
     
-    # Parse date
-    target_date = None
-    if args.date:
+    # Parse dates
+    def parse_date(value: str) -> datetime:
         try:
-            target_date = datetime.strptime(args.date, "%Y-%m-%d")
+            return datetime.strptime(value, "%Y-%m-%d")
         except ValueError:
-            logger.error(f"Invalid date format: {args.date}. Use YYYY-MM-DD.")
+            logger.error(f"Invalid date format: {value}. Use YYYY-MM-DD.")
+            sys.exit(1)
+    
+    target_date = parse_date(args.date) if args.date else None
+    from_date = parse_date(args.from_date) if args.from_date else None
+    to_date = parse_date(args.to_date) if args.to_date else None
+    
+    if target_date and (from_date or to_date):
+        logger.error("--date cannot be combined with --from/--to")
+        sys.exit(1)
+    if args.record and args.replay:
+        logger.error("--record cannot be combined with --replay")
+        sys.exit(1)
+    if args.replay and not Path(args.replay).is_dir():
+        logger.error(f"No recorded fixtures in {args.replay}")
+        sys.exit(1)
+    if args.command == "search" and not args.query:
+        logger.error("search requires a query")
+        sys.exit(1)
+    if args.command == "rescore" and SCORERS[args.scorer].batch_dependent:
+        logger.error(f"rescore does not support --scorer {args.scorer}")
+        sys.exit(1)
+    if args.command in ("index", "search") and args.no_index:
+        logger.error(f"{args.command} cannot be combined with --no-index")
+        sys.exit(1)
+    if to_date and not from_date and args.command == "fetch":
+        logger.error("--to requires --from")
+        sys.exit(1)
+    if from_date and args.command == "fetch":
+        to_date = to_date or datetime.now() - timedelta(days=1)
+        if from_date.date() > to_date.date():
+            logger.error("--from must not be after --to")
             sys.exit(1)
     
     # Run pipeline
+    pipeline = None
     try:
-        pipeline = ArxivPipeline(output_dir=Path(args.output_dir))
-        result = pipeline.run(
-            date=target_date,
-            test_mode=args.test,
-            min_score=args.min_score,
-            max_papers=args.max_papers
+        pipeline = ArxivPipeline(
+            output_dir=Path(args.output_dir),
+            cache_dir=Path(args.cache_dir) if args.cache_dir else None,
+            use_cache=not args.no_cache,
+            page_ceiling=args.page_size,
+            scorer=args.scorer,
+            pdf_dir=Path(args.pdf_dir) if args.pdf_dir else None,
+            pdf_workers=args.pdf_workers,
+            dedup_threshold=args.dedup_threshold if args.dedup else None,
+            use_index=not args.no_index,
+            keep_alive=args.keep_alive,
+            output_format="json" if args.pretty_json else "jsonl",
+            report_formats=args.formats,
+            record_dir=Path(args.record) if args.record else None,
+            replay_dir=Path(args.replay) if args.replay else None
         )
         
+        if args.command == "rescore":
+            paths = pipeline.saved_json_paths(from_date, to_date)
+            summary = pipeline.rescore(
+                paths, workers=args.workers, min_score=args.min_score, top_k=args.top_k
+            )
+            print("\n" + "=" * 50)
+            print("RESCORE COMPLETE")
+            print("=" * 50)
+            print(f"Files: {summary['files']}")
+            print(f"Papers: {summary['papers']}")
+            print(f"Dropped: {summary['dropped']}")
+            print(f"Workers: {summary['workers']}")
+            print(f"Time: {summary['seconds']}s")
+            print("=" * 50)
+            return
+        
+        if args.command == "index":
+            paths = pipeline.saved_json_paths(from_date, to_date)
+            summary = pipeline.reindex(paths)
+            print("\n" + "=" * 50)
+            print("INDEX COMPLETE")
+            print("=" * 50)
+            print(f"Files: {summary['files']}")
+            print(f"Papers: {summary['papers']}")
+            print(f"Time: {summary['seconds']}s")
+            print("=" * 50)
+            return
+        
+        if args.command == "trends":
+            summary = pipeline.trends(date=target_date, top=args.limit)
+            print("\n" + "=" * 50)
+            print("TRENDS COMPLETE")
+            print("=" * 50)
+            print(f"Week: {summary['week']}")
+            print(f"Weeks recounted: {summary['weeks_recounted']}")
+            print(f"Files read: {summary['files_read']}")
+            for f in summary['output_files']:
+                print(f"  - {f}")
+            print("=" * 50)
+            return
+        
+        if args.command == "search":
+            start = time.perf_counter()
+            results = pipeline.index.search(
+                args.query, limit=args.limit, start_date=from_date, end_date=to_date
+            )
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            for row in results:
+                areas = row["matched_areas"] or "-"
+                print(f"{row['date']}  {row['relevance_score']:6.2f}  {row['title']}")
+                print(f"            {row['abstract_url'] or row['id']}  [{areas}]")
+                print(f"            {row['snippet']}")
+            print(f"{len(results)} results in {elapsed_ms:.1f} ms")
+            return
+        
+        run_kwargs = {
+            "test_mode": args.test,
+            "min_score": args.min_score,
+            "max_papers": args.max_papers,
+            "top_k": args.top_k,
+            "incremental": not args.full,
+            "fetch_pdfs": args.fetch_pdfs,
+        }
+        
+        if from_date:
+            results = pipeline.backfill(from_date, to_date, **run_kwargs)
+        else:
+            results = [pipeline.run(date=target_date, **run_kwargs)]
+        
         # Print summary
-        print("\n" + "=" * 50)
-        print("PIPELINE COMPLETE")
-        print("=" * 50)
-        print(f"Date: {result['date']}")
-        print(f"Total papers fetched: {result['total_fetched']}")
-        print(f"Relevant papers: {result['relevant_count']}")
-        print(f"Output files:")
-        for f in result['output_files']:
-            print(f"  - {f}")
-        print("=" * 50)
+        for result in results:
+            print("\n" + "=" * 50)
+            print("PIPELINE COMPLETE")
+            print("=" * 50)
+            print(f"Date: {result['date']}")
+            print(f"Total papers fetched: {result['total_fetched']}")
+            print(f"Relevant papers: {result['relevant_count']}")
+            print(f"Output files:")
+            for f in result['output_files']:
+                print(f"  - {f}")
+            print("=" * 50)
+            if args.profile and "metrics" in result:
+                print(PipelineMetrics.format_table(result["metrics"]))
+                print("=" * 50)
         
     except KeyboardInterrupt:
         logger.info("Pipeline interrupted by user")
@@ -856,6 +3889,9 @@ def main():
             import traceback
             traceback.print_exc()
         sys.exit(1)
+    finally:
+        if pipeline is not None:
+            pipeline.close()
 
 
 if __name__ == "__main__":
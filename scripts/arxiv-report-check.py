@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Offline check of the report renderer of arxiv-daily-fetch.py
+
+Renders a report for a few synthetic papers, one of them without a title,
+and checks that:
+
+- the Markdown entry for an untitled paper keeps an empty link text, as the
+  report always has (`### 1. [](url)`),
+- titled papers are linked by their title,
+- the HTML digest and plain-text email show "Untitled" instead.
+
+Usage:
+    python scripts/arxiv-report-check.py
+
+Author: KIGLAND Research Intelligence
+Version: 1.0.0
+"""
+
+import importlib.util
+import io
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import List, Tuple
+
+# The pipeline lives in a script with a hyphenated name, so load it by path
+FETCHER_PATH = Path(__file__).with_name("arxiv-daily-fetch.py")
+_spec = importlib.util.spec_from_file_location("arxiv_daily_fetch", FETCHER_PATH)
+fetcher = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(fetcher)
+
+# ============================================================================
+# Checks
+# ============================================================================
+
+def run_checks() -> List[Tuple[str, bool, str]]:
+    """
+    Render every format once and check the entry titles.
+    
+    Returns:
+        (check name, passed, detail) tuples
+    """
+    untitled = "http://arxiv.org/abs/2602.00001v1"
+    titled = "http://arxiv.org/abs/2602.00002v1"
+    papers = [
+        fetcher.Paper(id=untitled, summary="No title.", relevance_score=9.0),
+        fetcher.Paper(id=titled, title="Agents", summary="Agents.", relevance_score=5.0),
+    ]
+    
+    report = fetcher.ReportGenerator()
+    outputs = {name: io.StringIO() for name in ("md", "html", "txt")}
+    report.render(papers, datetime(2026, 2, 2), len(papers), outputs)
+    markdown = outputs["md"].getvalue()
+    
+    md_untitled = f"### 1. []({untitled})\n"
+    md_titled = f"### 2. [Agents]({titled})\n"
+    html_untitled = f"<h2><a href=\"{untitled}\">Untitled</a></h2>"
+    
+    return [
+        (
+            "md empty title",
+            md_untitled in markdown and "Untitled" not in markdown,
+            f"expected {md_untitled.strip()!r}",
+        ),
+        (
+            "md titled",
+            md_titled in markdown,
+            f"expected {md_titled.strip()!r}",
+        ),
+        (
+            "html untitled",
+            html_untitled in outputs["html"].getvalue(),
+            f"expected {html_untitled!r}",
+        ),
+        (
+            "txt untitled",
+            "1. Untitled\n" in outputs["txt"].getvalue(),
+            "expected '1. Untitled'",
+        ),
+        (
+            "generate_markdown",
+            report.generate_markdown(papers, datetime(2026, 2, 2), len(papers)) == markdown,
+            "same output as render()",
+        ),
+    ]
+
+# ============================================================================
+# CLI Entry Point
+# ============================================================================
+
+def main():
+    """Main entry point for the CLI."""
+    logging.getLogger("arxiv_fetcher").setLevel(logging.ERROR)
+    
+    results = run_checks()
+    for name, passed, detail in results:
+        print(f"{'PASS' if passed else 'FAIL'}  {name:<22}{detail}")
+    
+    sys.exit(0 if all(passed for _, passed, _ in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Offline check of the rescore command of arxiv-daily-fetch.py
+
+Writes a small saved day into a temporary output directory, rescores it and
+checks that:
+
+- the pipeline's scorer is the one used in the scoring workers, and a
+  scorer that needs the whole day (BM25) is refused,
+- papers whose PDF is in the store get their full text scored again and
+  blended in as fetch does, and papers whose PDF is gone lose their stale
+  full-text score,
+- the day's watermark is deleted, so the next fetch is a full one.
+
+Nothing touches the network.
+
+Usage:
+    python scripts/arxiv-rescore-check.py
+
+Author: KIGLAND Research Intelligence
+Version: 1.0.0
+"""
+
+import hashlib
+import importlib.util
+import json
+import logging
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Tuple
+
+# The pipeline lives in a script with a hyphenated name, so load it by path
+FETCHER_PATH = Path(__file__).with_name("arxiv-daily-fetch.py")
+_spec = importlib.util.spec_from_file_location("arxiv_daily_fetch", FETCHER_PATH)
+fetcher = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(fetcher)
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+DAY = "2026-02-02"
+FULLTEXT = "large language model agents " * 40 + "reinforcement learning " * 20
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+class ConstantFilter(fetcher.RelevanceFilter):
+    """Scorer that gives every paper the same score, to see which scorer ran."""
+    
+    SCORE = 7.0
+    
+    def calculate_score(self, paper, text=None):
+        return self.SCORE, ["constant"]
+
+
+def saved_day(output_dir: Path, store: "fetcher.PdfStore") -> Path:
+    """
+    Write a saved day of three papers: one with its PDF in the store, one
+    whose PDF is gone, and one that never had a PDF. The first two carry
+    stale full-text scores.
+    """
+    digest = hashlib.sha256(b"stored").hexdigest()
+    pdf_path = store.object_path(digest)
+    pdf_path.parent.mkdir(parents=True, exist_ok=True)
+    pdf_path.write_bytes(b"%PDF-1.5\n")
+    store.object_path(digest, ".txt").write_text(FULLTEXT, encoding="utf-8")
+    
+    papers = [
+        fetcher.Paper(
+            id="http://arxiv.org/abs/2602.00001v1",
+            title="Large language model agents",
+            summary="An agent built on a large language model.",
+            categories=["cs.AI"],
+            relevance_score=99.0,
+            fulltext_score=99.0,
+            pdf_sha256=digest,
+        ),
+        fetcher.Paper(
+            id="http://arxiv.org/abs/2602.00002v1",
+            title="Diffusion models for image generation",
+            summary="A diffusion model with a large language model prompt encoder.",
+            categories=["cs.CV"],
+            relevance_score=50.0,
+            fulltext_score=50.0,
+            pdf_sha256=hashlib.sha256(b"gone").hexdigest(),
+        ),
+        fetcher.Paper(
+            id="http://arxiv.org/abs/2602.00003v1",
+            title="Reinforcement learning for robots",
+            summary="Reinforcement learning with a large language model planner.",
+            categories=["cs.RO"],
+            relevance_score=10.0,
+        ),
+    ]
+    path = output_dir / f"arxiv-{DAY}.jsonl.gz"
+    fetcher.ReportGenerator().save_papers(papers, path)
+    return path
+
+
+def pipeline(output_dir: Path, scorer: str = "keyword") -> "fetcher.ArxivPipeline":
+    """Pipeline writing to output_dir, without the search index."""
+    return fetcher.ArxivPipeline(output_dir=output_dir, use_index=False, scorer=scorer)
+
+# ============================================================================
+# Checks
+# ============================================================================
+
+def check_scorer(tmp: Path) -> List[Tuple[str, bool, str]]:
+    """The chosen scorer reaches the workers; BM25 is refused."""
+    results = []
+    fetcher.SCORERS["constant"] = ConstantFilter
+    try:
+        pl = pipeline(tmp, scorer="constant")
+        path = saved_day(tmp, pl.pdf_store)
+        pl.rescore([path], workers=1, min_score=0)
+        scores = [p.relevance_score for p in pl.report.load_papers(path)]
+        pl.close()
+    finally:
+        del fetcher.SCORERS["constant"]
+    
+    results.append((
+        "scorer used",
+        scores == [ConstantFilter.SCORE] * 3,
+        f"scores {scores}",
+    ))
+    
+    if fetcher.np is None:
+        results.append(("bm25 refused", True, "skipped, numpy not installed"))
+        return results
+    pl = pipeline(tmp, scorer="bm25")
+    try:
+        pl.rescore([path], workers=1)
+        refused, detail = False, "rescore ran"
+    except ValueError as e:
+        refused, detail = True, str(e)
+    pl.close()
+    results.append(("bm25 refused", refused, detail))
+    return results
+
+
+def check_fulltext(tmp: Path) -> List[Tuple[str, bool, str]]:
+    """Full-text scores are recomputed from the store, or cleared."""
+    pl = pipeline(tmp)
+    path = saved_day(tmp, pl.pdf_store)
+    pl.rescore([path], workers=1, min_score=0)
+    papers = {p.id.rsplit("/", 1)[-1]: p for p in pl.report.load_papers(path)}
+    
+    stored = papers["2602.00001v1"]
+    abstract, _ = pl.filter.calculate_score(stored)
+    fulltext, _ = pl.filter.calculate_score(stored, text=FULLTEXT)
+    weight = fetcher.FULLTEXT_WEIGHT
+    expected = round((1 - weight) * round(abstract, 2) + weight * fulltext, 2)
+    
+    gone = papers["2602.00002v1"]
+    gone_abstract, _ = pl.filter.calculate_score(gone)
+    pl.close()
+    
+    return [
+        (
+            "full text rescored",
+            stored.fulltext_score == round(fulltext, 2) and stored.relevance_score == expected,
+            f"fulltext {stored.fulltext_score} (expected {round(fulltext, 2)}), "
+            f"relevance {stored.relevance_score} (expected {expected})",
+        ),
+        (
+            "missing PDF cleared",
+            gone.fulltext_score is None and gone.relevance_score == round(gone_abstract, 2),
+            f"fulltext {gone.fulltext_score}, relevance {gone.relevance_score}",
+        ),
+    ]
+
+
+def check_watermark(tmp: Path) -> List[Tuple[str, bool, str]]:
+    """The rescored day's watermark is deleted."""
+    pl = pipeline(tmp)
+    path = saved_day(tmp, pl.pdf_store)
+    watermark = tmp / f"arxiv-{DAY}.watermark.json"
+    watermark.write_text(json.dumps({
+        "query": "q", "filter": {}, "updated": "", "ids": ["2602.00009v1"]
+    }))
+    pl.rescore([path], workers=1, min_score=5, top_k=1)
+    pl.close()
+    return [(
+        "watermark deleted",
+        not watermark.exists(),
+        f"{watermark.name} {'still exists' if watermark.exists() else 'removed'}",
+    )]
+
+
+def run_checks() -> List[Tuple[str, bool, str]]:
+    """Run every check in a fresh output directory."""
+    results = []
+    for check in (check_scorer, check_fulltext, check_watermark):
+        with tempfile.TemporaryDirectory() as tmp:
+            results.extend(check(Path(tmp)))
+    return results
+
+# ============================================================================
+# CLI Entry Point
+# ============================================================================
+
+def main():
+    """Main entry point for the CLI."""
+    logging.getLogger("arxiv_fetcher").setLevel(logging.ERROR)
+    
+    results = run_checks()
+    for name, passed, detail in results:
+        print(f"{'PASS' if passed else 'FAIL'}  {name:<22}{detail}")
+    
+    sys.exit(0 if all(passed for _, passed, _ in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
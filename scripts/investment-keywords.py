@@ -0,0 +1,94 @@
+"""
+Investment Ecosystem Intelligence - Keyword Matcher
+投资生态情报 - 关键词匹配器
+
+investment-tracker.py 与 investment-tracker-v2.py 共用的关键词匹配器。
+关键词配置统一来自 investment-tracker.config.py，两个版本的打分保持一致。
+
+所有关键词在加载时编译为一个正则，文本只需扫描一遍，
+不再对每个关键词分别调用 lower() 和子串查找。
+
+作者: OpenClaw Agent
+版本: 1.0.0
+"""
+
+import re
+import importlib.util
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# 配置文件名含连字符和点，按路径加载
+CONFIG_PATH = Path(__file__).with_name('investment-tracker.config.py')
+_spec = importlib.util.spec_from_file_location('investment_tracker_config', CONFIG_PATH)
+config = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(config)
+
+KEYWORDS_CONFIG = config.KEYWORDS_CONFIG
+
+
+class KeywordMatcher:
+    """
+    预编译的关键词匹配器
+    
+    所有关键词 (小写) 合并为一个交替正则，文本只转换一次小写。每次匹配后
+    从下一个字符继续查找，相互重叠的关键词不会互相吞掉；每个位置取最长的
+    关键词，并把它包含的其他关键词所属的类别一并计入。匹配结果与逐个
+    关键词做子串查找相同，每个类别只计一次分。
+    """
+    
+    def __init__(self, keywords_config: Dict[str, Dict]):
+        self.keywords_config = keywords_config
+        self.categories = [cfg['category'] for cfg in keywords_config.values()]
+        self.weights = {cfg['category']: cfg['weight'] for cfg in keywords_config.values()}
+        
+        # 关键词 (小写) -> 类别
+        keyword_categories = {}
+        for cfg in keywords_config.values():
+            for keyword in cfg['keywords']:
+                keyword_categories.setdefault(keyword.lower(), set()).add(cfg['category'])
+        
+        # 匹配到的关键词 -> 它所包含的全部关键词的类别
+        self.lookup = {
+            keyword: frozenset(
+                category
+                for other, categories in keyword_categories.items()
+                if other in keyword
+                for category in categories
+            )
+            for keyword in keyword_categories
+        }
+        
+        # 长关键词优先，同一位置取最长匹配
+        alternation = '|'.join(
+            re.escape(keyword) for keyword in sorted(keyword_categories, key=len, reverse=True)
+        )
+        self.pattern = re.compile(alternation)
+    
+    def match(self, text: str) -> Tuple[List[str], int]:
+        """
+        匹配关键词，返回匹配的标签和权重分数
+        
+        Args:
+            text: 待匹配的文本
+        
+        Returns:
+            (匹配的标签列表 (按配置顺序), 总权重分数)
+        """
+        if not text:
+            return [], 0
+        
+        text = text.lower()
+        lookup = self.lookup
+        search = self.pattern.search
+        matched = set()
+        found = search(text)
+        while found:
+            matched |= lookup[found.group()]
+            found = search(text, found.start() + 1)
+        
+        tags = [category for category in self.categories if category in matched]
+        return tags, sum(self.weights[category] for category in tags)
+
+
+# 共享实例
+matcher = KeywordMatcher(KEYWORDS_CONFIG)
@@ -23,9 +23,12 @@ import json
 import sqlite3
 import hashlib
 import logging
+import time
 import argparse
+import importlib.util
+from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
@@ -33,10 +36,20 @@ from pathlib import Path
 BASE_DIR = Path(__file__).parent.parent
 RESEARCH_DIR = BASE_DIR / "research" / "investment"
 DAILY_REPORTS_DIR = RESEARCH_DIR / "daily-reports"
+WEEKLY_REPORTS_DIR = RESEARCH_DIR / "weekly-reports"
 DB_PATH = RESEARCH_DIR / "investment.db"
+SCHEDULER_STATE_PATH = RESEARCH_DIR / "scheduler-state.json"
+
+# 共享关键词匹配器 (文件名含连字符，按路径加载)
+_spec = importlib.util.spec_from_file_location(
+    'investment_keywords', Path(__file__).with_name('investment-keywords.py')
+)
+keywords = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(keywords)
 
 # 确保目录存在
 DAILY_REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+WEEKLY_REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
 # 配置日志
 logging.basicConfig(
@@ -50,6 +63,119 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# ============ 统计表 ============
+
+# 事件标签拆分到 event_tags，按日期、平台、标签的计数由触发器在
+# funding_events 增删改时同步更新，get_stats 只需读取这些小表。
+# 日期、平台为 NULL 的事件计在空字符串下。
+STATS_SCHEMA_VERSION = 1
+
+STATS_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS event_tags (
+    event_id INTEGER NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (event_id, tag)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_event_tags_tag ON event_tags(tag);
+
+CREATE TABLE IF NOT EXISTS stats_daily (
+    funding_date TEXT PRIMARY KEY,
+    events INTEGER NOT NULL DEFAULT 0,
+    high_priority INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS stats_platform (
+    source_platform TEXT PRIMARY KEY,
+    events INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS stats_tag (
+    tag TEXT PRIMARY KEY,
+    events INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+-- 标签计数跟随 event_tags
+CREATE TRIGGER IF NOT EXISTS trg_event_tags_insert AFTER INSERT ON event_tags
+BEGIN
+    INSERT INTO stats_tag (tag, events) VALUES (NEW.tag, 1)
+    ON CONFLICT(tag) DO UPDATE SET events = events + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_event_tags_delete AFTER DELETE ON event_tags
+BEGIN
+    UPDATE stats_tag SET events = events - 1 WHERE tag = OLD.tag;
+    DELETE FROM stats_tag WHERE tag = OLD.tag AND events <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_funding_events_insert AFTER INSERT ON funding_events
+BEGIN
+    INSERT OR IGNORE INTO event_tags (event_id, tag)
+    SELECT NEW.id, value FROM json_each(
+        CASE WHEN json_valid(NEW.tags) AND json_type(NEW.tags) = 'array'
+             THEN NEW.tags ELSE '[]' END
+    )
+    WHERE type = 'text';
+    
+    INSERT INTO stats_daily (funding_date, events, high_priority)
+    VALUES (IFNULL(NEW.funding_date, ''), 1, IFNULL(NEW.match_score, 0) >= 10)
+    ON CONFLICT(funding_date) DO UPDATE SET
+        events = events + 1,
+        high_priority = high_priority + excluded.high_priority;
+    
+    INSERT INTO stats_platform (source_platform, events)
+    VALUES (IFNULL(NEW.source_platform, ''), 1)
+    ON CONFLICT(source_platform) DO UPDATE SET events = events + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_funding_events_delete AFTER DELETE ON funding_events
+BEGIN
+    DELETE FROM event_tags WHERE event_id = OLD.id;
+    
+    UPDATE stats_daily SET
+        events = events - 1,
+        high_priority = high_priority - (IFNULL(OLD.match_score, 0) >= 10)
+    WHERE funding_date = IFNULL(OLD.funding_date, '');
+    DELETE FROM stats_daily WHERE funding_date = IFNULL(OLD.funding_date, '') AND events <= 0;
+    
+    UPDATE stats_platform SET events = events - 1
+    WHERE source_platform = IFNULL(OLD.source_platform, '');
+    DELETE FROM stats_platform
+    WHERE source_platform = IFNULL(OLD.source_platform, '') AND events <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_funding_events_update
+AFTER UPDATE OF tags, funding_date, match_score, source_platform ON funding_events
+BEGIN
+    DELETE FROM event_tags WHERE event_id = OLD.id;
+    INSERT OR IGNORE INTO event_tags (event_id, tag)
+    SELECT NEW.id, value FROM json_each(
+        CASE WHEN json_valid(NEW.tags) AND json_type(NEW.tags) = 'array'
+             THEN NEW.tags ELSE '[]' END
+    )
+    WHERE type = 'text';
+    
+    UPDATE stats_daily SET
+        events = events - 1,
+        high_priority = high_priority - (IFNULL(OLD.match_score, 0) >= 10)
+    WHERE funding_date = IFNULL(OLD.funding_date, '');
+    DELETE FROM stats_daily WHERE funding_date = IFNULL(OLD.funding_date, '') AND events <= 0;
+    INSERT INTO stats_daily (funding_date, events, high_priority)
+    VALUES (IFNULL(NEW.funding_date, ''), 1, IFNULL(NEW.match_score, 0) >= 10)
+    ON CONFLICT(funding_date) DO UPDATE SET
+        events = events + 1,
+        high_priority = high_priority + excluded.high_priority;
+    
+    UPDATE stats_platform SET events = events - 1
+    WHERE source_platform = IFNULL(OLD.source_platform, '');
+    DELETE FROM stats_platform
+    WHERE source_platform = IFNULL(OLD.source_platform, '') AND events <= 0;
+    INSERT INTO stats_platform (source_platform, events)
+    VALUES (IFNULL(NEW.source_platform, ''), 1)
+    ON CONFLICT(source_platform) DO UPDATE SET events = events + 1;
+END;
+'''
+
+
 # ============ 数据模型 ============
 
 @dataclass
@@ -147,10 +273,53 @@ class Database:
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_funding_date ON funding_events(funding_date)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_company ON funding_events(company_name)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_match_score ON funding_events(match_score)')
+        # 日报的时间窗口查询显式使用该索引，避免按 match_score 扫全表
+        cursor.execute(
+            'CREATE INDEX IF NOT EXISTS idx_date_score ON funding_events(funding_date, match_score)'
+        )
+        
+        # 标签与统计表 (由触发器维护)
+        cursor.executescript(STATS_SCHEMA)
         
         conn.commit()
+        
+        # 旧数据库: 按现有事件重建一次统计
+        if cursor.execute('PRAGMA user_version').fetchone()[0] < STATS_SCHEMA_VERSION:
+            self.rebuild_stats()
+            cursor.execute(f'PRAGMA user_version = {STATS_SCHEMA_VERSION}')
+            conn.commit()
+        
         logger.info("Database initialized successfully")
     
+    def rebuild_stats(self):
+        """由 funding_events 全量重建 event_tags 和统计表"""
+        conn = self.get_connection()
+        # event_tags 的触发器会同时重建 stats_tag
+        conn.executescript('''
+            BEGIN;
+            DELETE FROM event_tags;
+            DELETE FROM stats_daily;
+            DELETE FROM stats_platform;
+            DELETE FROM stats_tag;
+            
+            INSERT INTO event_tags (event_id, tag)
+            SELECT DISTINCT e.id, j.value
+            FROM funding_events e, json_each(
+                CASE WHEN json_valid(e.tags) AND json_type(e.tags) = 'array'
+                     THEN e.tags ELSE '[]' END
+            ) j
+            WHERE j.type = 'text';
+            
+            INSERT INTO stats_daily (funding_date, events, high_priority)
+            SELECT IFNULL(funding_date, ''), COUNT(*), SUM(IFNULL(match_score, 0) >= 10)
+            FROM funding_events GROUP BY IFNULL(funding_date, '');
+            
+            INSERT INTO stats_platform (source_platform, events)
+            SELECT IFNULL(source_platform, ''), COUNT(*)
+            FROM funding_events GROUP BY IFNULL(source_platform, '');
+            COMMIT;
+        ''')
+    
     def insert_event(self, event: FundingEvent) -> bool:
         """插入融资事件，自动去重"""
         conn = self.get_connection()
@@ -197,54 +366,151 @@ class Database:
         
         return [dict(row) for row in cursor.fetchall()]
     
-    def get_stats(self) -> Dict:
-        """获取数据统计"""
+    def get_priority_counts(self, days: int = 30) -> Dict:
+        """
+        一次查询统计最近事件的优先级分档和专题计数
+        
+        分档用 CASE 在 SQLite 中计算，二次元标签走 event_tags，
+        不再把整个时间窗口的事件读进 Python。
+        """
         conn = self.get_connection()
         cursor = conn.cursor()
         
-        stats = {}
+        since_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
         
-        # 总事件数
-        cursor.execute('SELECT COUNT(*) FROM funding_events')
-        stats['total_events'] = cursor.fetchone()[0]
+        cursor.execute('''
+            SELECT
+                COUNT(*) AS total,
+                IFNULL(SUM(CASE WHEN match_score >= 20 THEN 1 ELSE 0 END), 0) AS p0,
+                IFNULL(SUM(CASE WHEN match_score >= 15 AND match_score < 20 THEN 1 ELSE 0 END), 0) AS p1,
+                IFNULL(SUM(CASE WHEN match_score >= 10 AND match_score < 15 THEN 1 ELSE 0 END), 0) AS p2,
+                IFNULL(SUM(CASE WHEN instr(lower(investors), 'miracleplus') > 0 THEN 1 ELSE 0 END), 0)
+                    AS miracleplus,
+                IFNULL(SUM(CASE WHEN instr(lower(description), 'agent') > 0 THEN 1 ELSE 0 END), 0)
+                    AS ai_agent,
+                IFNULL(SUM(CASE WHEN EXISTS (
+                    SELECT 1 FROM event_tags t WHERE t.event_id = e.id AND instr(t.tag, '二次元') > 0
+                ) THEN 1 ELSE 0 END), 0) AS niche
+            FROM funding_events e INDEXED BY idx_date_score
+            WHERE funding_date >= ? AND match_score >= 0
+        ''', (since_date,))
         
-        # 近30天事件数
-        since_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-        cursor.execute('SELECT COUNT(*) FROM funding_events WHERE funding_date >= ?', (since_date,))
-        stats['recent_30d'] = cursor.fetchone()[0]
+        return dict(cursor.fetchone())
+    
+    def get_report_events(self, days: int = 30, min_score: int = 15) -> List[sqlite3.Row]:
+        """
+        获取简报中列出的事件，只取渲染用到的列
         
-        # 近7天事件数
-        since_date_7d = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-        cursor.execute('SELECT COUNT(*) FROM funding_events WHERE funding_date >= ?', (since_date_7d,))
-        stats['recent_7d'] = cursor.fetchone()[0]
+        投资方由 json_each 在 SQLite 中拼接好，渲染时不必逐行解析 JSON。
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
         
-        # 高匹配度事件数
-        cursor.execute('SELECT COUNT(*) FROM funding_events WHERE match_score >= 10')
-        stats['high_priority'] = cursor.fetchone()[0]
+        since_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
         
-        # 按平台统计
         cursor.execute('''
-            SELECT source_platform, COUNT(*) as count 
-            FROM funding_events 
-            GROUP BY source_platform
-        ''')
+            SELECT
+                company_name, funding_round, amount, funding_date, description, match_score,
+                CASE WHEN json_valid(investors) THEN
+                    (SELECT IFNULL(group_concat(value, ', '), '') FROM json_each(investors))
+                ELSE '' END AS investor_list
+            FROM funding_events INDEXED BY idx_date_score
+            WHERE funding_date >= ? AND match_score >= ?
+            ORDER BY match_score DESC, funding_date DESC, id
+        ''', (since_date, min_score))
+        
+        return cursor.fetchall()
+    
+    def get_stats(self) -> Dict:
+        """获取数据统计 (读取触发器维护的统计表)"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        stats = {}
+        
+        # 总事件数 / 高匹配度事件数
+        cursor.execute('SELECT IFNULL(SUM(events), 0), IFNULL(SUM(high_priority), 0) FROM stats_daily')
+        stats['total_events'], stats['high_priority'] = cursor.fetchone()
+        
+        # 近30天 / 近7天事件数
+        for key, days in (('recent_30d', 30), ('recent_7d', 7)):
+            since_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+            cursor.execute(
+                'SELECT IFNULL(SUM(events), 0) FROM stats_daily WHERE funding_date >= ?',
+                (since_date,)
+            )
+            stats[key] = cursor.fetchone()[0]
+        
+        # 按平台统计
+        cursor.execute('SELECT source_platform, events FROM stats_platform ORDER BY source_platform')
         stats['by_platform'] = {row[0]: row[1] for row in cursor.fetchall()}
         
         # 按领域统计
-        cursor.execute('SELECT tags FROM funding_events WHERE tags IS NOT NULL')
-        tags_data = cursor.fetchall()
-        tag_counts = {}
-        for row in tags_data:
-            try:
-                tags = json.loads(row[0])
-                for tag in tags:
-                    tag_counts[tag] = tag_counts.get(tag, 0) + 1
-            except:
-                pass
-        stats['by_tag'] = tag_counts
+        cursor.execute('SELECT tag, events FROM stats_tag ORDER BY events DESC, tag')
+        stats['by_tag'] = {row[0]: row[1] for row in cursor.fetchall()}
         
         return stats
     
+    def get_weekly_breakdown(self, end_date: str, weeks: int = 4) -> Dict:
+        """
+        统计截至 end_date (不含) 的周度数据
+        
+        Returns:
+            最近一周的轮次分布 (by_round) 和标签分布 (by_tag)，
+            以及最近 weeks 周每周的事件数和融资总额 (by_week，下标 0 为最早一周)
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        end = datetime.strptime(end_date, '%Y-%m-%d')
+        week_start = (end - timedelta(days=7)).strftime('%Y-%m-%d')
+        trend_start = (end - timedelta(days=7 * weeks)).strftime('%Y-%m-%d')
+        
+        cursor.execute('''
+            SELECT IFNULL(funding_round, '未知') AS funding_round, COUNT(*) AS events
+            FROM funding_events
+            WHERE funding_date >= ? AND funding_date < ?
+            GROUP BY 1
+            ORDER BY events DESC, funding_round
+        ''', (week_start, end_date))
+        by_round = {row['funding_round']: row['events'] for row in cursor.fetchall()}
+        
+        cursor.execute('''
+            SELECT t.tag, COUNT(*) AS events
+            FROM event_tags t JOIN funding_events e ON e.id = t.event_id
+            WHERE e.funding_date >= ? AND e.funding_date < ?
+            GROUP BY t.tag
+            ORDER BY events DESC, t.tag
+        ''', (week_start, end_date))
+        by_tag = {row['tag']: row['events'] for row in cursor.fetchall()}
+        
+        cursor.execute('''
+            SELECT
+                CAST((julianday(funding_date) - julianday(?)) / 7 AS INTEGER) AS week,
+                COUNT(*) AS events,
+                COUNT(amount_usd) AS priced,
+                IFNULL(SUM(amount_usd), 0) AS amount_usd
+            FROM funding_events
+            WHERE funding_date >= ? AND funding_date < ?
+            GROUP BY week
+        ''', (trend_start, trend_start, end_date))
+        by_week = [{'events': 0, 'priced': 0, 'amount_usd': 0} for _ in range(weeks)]
+        for row in cursor.fetchall():
+            by_week[row['week']] = {
+                'events': row['events'],
+                'priced': row['priced'],
+                'amount_usd': row['amount_usd'],
+            }
+        
+        return {
+            'week_start': week_start,
+            'trend_start': trend_start,
+            'events': sum(by_round.values()),
+            'by_round': by_round,
+            'by_tag': by_tag,
+            'by_week': by_week,
+        }
+    
     def close(self):
         """关闭数据库连接"""
         if self.conn:
@@ -265,21 +531,17 @@ class ReportGenerator:
         if date is None:
             date = datetime.now().strftime('%Y-%m-%d')
         
-        # 获取最近数据
-        events = self.db.get_recent_events(days=30, min_score=0)
+        # 分档与统计在 SQLite 中一次算完
+        counts = self.db.get_priority_counts(days=30)
         stats = self.db.get_stats()
         
-        # 分类事件
+        # 只读取要列出的 P0 / P1 事件
+        events = self.db.get_report_events(days=30, min_score=15)
         p0_events = [e for e in events if e['match_score'] >= 20]
-        p1_events = [e for e in events if 15 <= e['match_score'] < 20]
-        p2_events = [e for e in events if 10 <= e['match_score'] < 15]
-        
-        # 统计
-        miracleplus_count = len([e for e in events if 'miracleplus' in e.get('investors', '').lower()])
-        ai_agent_count = len([e for e in events if 'agent' in e.get('description', '').lower()])
-        niche_count = len([e for e in events if '二次元' in e.get('tags', '')])
+        p1_events = [e for e in events if e['match_score'] < 20]
         
-        report = f"""# 投资动态简报 - {date}
+        # 分段拼接，事件多时避免反复复制整个报告
+        parts = [f"""# 投资动态简报 - {date}
 
 **报告生成时间**: {datetime.now().strftime('%Y-%m-%d %H:%M')} CST  
 **数据来源**: 36Kr RSS, Investment Tracker  
@@ -292,10 +554,10 @@ class ReportGenerator:
 | 指标 | 数值 | 变化 |
 |------|------|------|
 | 新增投资事件 | {stats['recent_30d']} | - |
-| 高优先级事件 (≥20分) | {len(p0_events)} | - |
-| MiraclePlus 相关 | {miracleplus_count} | - |
-| AI Agent 领域 | {ai_agent_count} | - |
-| 二次元相关 | {niche_count} | - |
+| 高优先级事件 (≥20分) | {counts['p0']} | - |
+| MiraclePlus 相关 | {counts['miracleplus']} | - |
+| AI Agent 领域 | {counts['ai_agent']} | - |
+| 二次元相关 | {counts['niche']} | - |
 
 ---
 
@@ -303,39 +565,36 @@ class ReportGenerator:
 
 ### P0 - 最高优先级
 
-"""
+"""]
         
         for event in p0_events:
-            investors = json.loads(event.get('investors', '[]'))
-            tags = json.loads(event.get('tags', '[]'))
-            report += f"""#### {event['company_name']} - {event['funding_round']} ({event['amount']})
+            parts.append(f"""#### {event['company_name']} - {event['funding_round']} ({event['amount']})
 - **匹配分**: {event['match_score']}/30 ⭐⭐⭐
-- **投资方**: {', '.join(investors)}
+- **投资方**: {event['investor_list']}
 - **日期**: {event['funding_date']}
 - **简介**: {event['description'][:100]}...
 
-"""
+""")
         
         if not p0_events:
-            report += "*暂无 P0 级别事件*\n\n"
+            parts.append("*暂无 P0 级别事件*\n\n")
         
-        report += """### P1 - 高优先级
+        parts.append("""### P1 - 高优先级
 
-"""
+""")
         
         for event in p1_events:
-            investors = json.loads(event.get('investors', '[]'))
-            report += f"""#### {event['company_name']} - {event['funding_round']}
+            parts.append(f"""#### {event['company_name']} - {event['funding_round']}
 - **匹配分**: {event['match_score']}/30 ⭐⭐
-- **投资方**: {', '.join(investors)}
+- **投资方**: {event['investor_list']}
 - **日期**: {event['funding_date']}
 
-"""
+""")
         
         if not p1_events:
-            report += "*暂无 P1 级别事件*\n\n"
+            parts.append("*暂无 P1 级别事件*\n\n")
         
-        report += f"""---
+        parts.append(f"""---
 
 ## 📈 数据统计
 
@@ -346,9 +605,9 @@ class ReportGenerator:
 ---
 
 *本报告由 Investment Ecosystem Intelligence 系统自动生成*
-"""
+""")
         
-        return report
+        return ''.join(parts)
     
     def save_daily_report(self, date: str = None):
         """保存每日报告"""
@@ -363,6 +622,93 @@ class ReportGenerator:
         
         logger.info(f"Daily report saved: {report_path}")
         return report_path
+    
+    def generate_weekly_analysis(self, date: str = None) -> str:
+        """生成周度趋势分析 (统计 date 之前的 7 天，趋势看 4 周)"""
+        if date is None:
+            date = datetime.now().strftime('%Y-%m-%d')
+        
+        breakdown = self.db.get_weekly_breakdown(date, weeks=4)
+        last_day = (datetime.strptime(date, '%Y-%m-%d') - timedelta(days=1)).strftime('%Y-%m-%d')
+        
+        parts = [f"""# 投资趋势周度分析
+
+**分析周期**: {breakdown['week_start']} 至 {last_day}  
+**更新时间**: {date}  
+**数据来源**: Investment Tracker Database
+
+---
+
+## 📈 整体趋势
+
+### 融资事件分布
+
+```
+按轮次分布:
+"""]
+        parts.extend(self._distribution_lines(breakdown['by_round'], breakdown['events'], bars=False))
+        parts.append("\n按领域分布:\n")
+        parts.extend(self._distribution_lines(breakdown['by_tag'], breakdown['events'], bars=True))
+        parts.append("""```
+
+### 融资规模趋势
+
+| 周次 | 事件数 | 总融资额(USD) | 平均单笔 |
+|------|--------|---------------|----------|
+""")
+        
+        trend_start = datetime.strptime(breakdown['trend_start'], '%Y-%m-%d')
+        for i, week in enumerate(breakdown['by_week']):
+            start = trend_start + timedelta(days=7 * i)
+            end = start + timedelta(days=6)
+            if week['priced']:
+                total = f"${week['amount_usd'] / 1e6:.1f}M"
+                average = f"${week['amount_usd'] / week['priced'] / 1e6:.1f}M"
+            else:
+                total = average = '-'
+            parts.append(
+                f"| W{i + 1} ({start.strftime('%m/%d')}-{end.strftime('%m/%d')}) "
+                f"| {week['events']} | {total} | {average} |\n"
+            )
+        
+        parts.append("""
+---
+
+*本报告由 Investment Ecosystem Intelligence 系统自动生成*
+""")
+        
+        return ''.join(parts)
+    
+    @staticmethod
+    def _distribution_lines(counts: Dict[str, int], total: int, bars: bool) -> List[str]:
+        """周报中的树状分布行"""
+        if not counts:
+            return ["└── 暂无数据\n"]
+        
+        most = max(counts.values())
+        lines = []
+        for i, (name, count) in enumerate(counts.items()):
+            branch = '└──' if i == len(counts) - 1 else '├──'
+            line = f"{branch} {name}: {count} ({count / total * 100:.1f}%)"
+            if bars:
+                line += ' ' + '█' * max(1, round(20 * count / most))
+            lines.append(line + "\n")
+        return lines
+    
+    def save_weekly_analysis(self, date: str = None):
+        """保存周度趋势分析 (按所分析的 ISO 周命名)"""
+        if date is None:
+            date = datetime.now().strftime('%Y-%m-%d')
+        
+        report = self.generate_weekly_analysis(date)
+        year, week, _ = (datetime.strptime(date, '%Y-%m-%d') - timedelta(days=7)).isocalendar()
+        report_path = WEEKLY_REPORTS_DIR / f"{year}-W{week:02d}.md"
+        
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(report)
+        
+        logger.info(f"Weekly analysis saved: {report_path}")
+        return report_path
 
 
 # ============ 数据采集器 ============
@@ -370,52 +716,15 @@ class ReportGenerator:
 class DataCollector:
     """数据采集器"""
     
-    # 监测关键词配置
-    KEYWORDS_CONFIG = {
-        'early_stage': {
-            'keywords': ['天使轮', '种子轮', 'Pre-A轮', '天使+', '种子+', 'A轮'],
-            'weight': 10,
-            'category': '早期投资'
-        },
-        'ai': {
-            'keywords': ['AI', '人工智能', '大模型', 'LLM', 'Agent', 'AIGC', 
-                        '机器学习', '深度学习', 'ChatGPT', 'Claude'],
-            'weight': 10,
-            'category': '人工智能'
-        },
-        'accelerator': {
-            'keywords': ['MiraclePlus', '奇绩创坛', 'Y Combinator', '陆奇'],
-            'weight': 8,
-            'category': '孵化器'
-        },
-        'niche': {
-            'keywords': ['Kigurumi', '二次元', 'Cosplay', 'ACG', '动漫', 
-                        '虚拟偶像', 'Vtuber', '手办', '潮玩'],
-            'weight': 6,
-            'category': '二次元文化'
-        }
-    }
+    # 监测关键词配置 (来自 investment-tracker.config.py，与 v1 共用)
+    KEYWORDS_CONFIG = keywords.KEYWORDS_CONFIG
     
     def __init__(self, db: Database):
         self.db = db
     
     def match_keywords(self, text: str) -> Tuple[List[str], int]:
         """匹配关键词"""
-        if not text:
-            return [], 0
-        
-        text = text.lower()
-        matched_categories = []
-        total_score = 0
-        
-        for category, config in self.KEYWORDS_CONFIG.items():
-            for keyword in config['keywords']:
-                if keyword.lower() in text:
-                    matched_categories.append(config['category'])
-                    total_score += config['weight']
-                    break
-        
-        return list(set(matched_categories)), total_score
+        return keywords.matcher.match(text)
     
     def collect_from_rss(self) -> List[FundingEvent]:
         """从 RSS 采集数据 (待实现)"""
@@ -510,6 +819,174 @@ class DataCollector:
         return inserted
 
 
+# ============ 调度器 ============
+
+DAILY_REPORT_HOUR = 9        # 每天 9 点生成日报
+WEEKLY_ANALYSIS_WEEKDAY = 0  # 每周一生成周度分析
+SCHEDULER_MAX_SLEEP = 300    # 单次最长睡眠 (秒)，醒来时检查系统时间是否跳变
+CLOCK_JUMP_TOLERANCE = 60    # 墙钟与单调时钟的偏差超过该秒数即视为跳变
+
+
+class Cadence(ABC):
+    """任务节奏：根据上次运行时间给出下次运行的墙钟时间"""
+    
+    # 为 True 时按墙钟对齐，系统时间跳变后重新排期
+    follows_wall_clock = False
+    
+    @abstractmethod
+    def next_run(self, last_run: Optional[datetime], now: datetime) -> datetime:
+        """下次运行时间；last_run 为 None 表示从未运行过"""
+
+
+class IntervalCadence(Cadence):
+    """固定间隔，从上次开始运行的时间算起"""
+    
+    def __init__(self, minutes: int):
+        self.interval = timedelta(minutes=minutes)
+    
+    def next_run(self, last_run: Optional[datetime], now: datetime) -> datetime:
+        """下次运行时间，从未运行过则立即运行"""
+        if last_run is None:
+            return now
+        return last_run + self.interval
+    
+    def __str__(self) -> str:
+        return f"every {self.interval.total_seconds() / 60:g} min"
+
+
+class CalendarCadence(Cadence):
+    """每天 (指定 weekday 时为每周) 的固定时刻"""
+    
+    follows_wall_clock = True
+    
+    def __init__(self, hour: int, minute: int = 0, weekday: Optional[int] = None):
+        self.hour = hour
+        self.minute = minute
+        self.weekday = weekday
+    
+    def next_run(self, last_run: Optional[datetime], now: datetime) -> datetime:
+        """上次运行之后的第一个时刻，从未运行过则取当前时间之后的第一个时刻"""
+        start = last_run or now
+        slot = start.replace(hour=self.hour, minute=self.minute, second=0, microsecond=0)
+        if slot <= start:
+            slot += timedelta(days=1)
+        if self.weekday is not None:
+            slot += timedelta(days=(self.weekday - slot.weekday()) % 7)
+        return slot
+    
+    def __str__(self) -> str:
+        day = 'daily' if self.weekday is None else f"weekday {self.weekday}"
+        return f"{day} at {self.hour:02d}:{self.minute:02d}"
+
+
+@dataclass
+class ScheduledJob:
+    """调度任务"""
+    name: str
+    cadence: Cadence
+    func: Callable[[], object]
+    due: Optional[datetime] = None  # 下次运行的墙钟时间，写入状态文件
+    deadline: float = 0.0           # 下次运行的单调时钟时间
+    clock_offset: float = 0.0       # 排期时墙钟与单调时钟之差
+
+
+class Scheduler:
+    """
+    进程内调度器
+    
+    每个任务按自己的节奏排期，截止时间记在单调时钟上，睡眠和判断到期都
+    不受系统时间调整影响。固定时刻的任务在系统时间跳变 (手动调整、休眠
+    唤醒) 后按墙钟重新对齐。各任务下次运行的时间写入状态文件 (运行失败时
+    不更新)，重启后已过期的任务立即补跑一次，多次错过合并为一次。同时
+    到期的任务按添加顺序运行。
+    """
+    
+    def __init__(self, state_path: str = None):
+        self.state_path = str(state_path or SCHEDULER_STATE_PATH)
+        self.state = self._load_state()
+        self.jobs: List[ScheduledJob] = []
+    
+    def _load_state(self) -> Dict[str, str]:
+        """读取各任务下次运行的时间"""
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_state(self):
+        """保存各任务下次运行的时间"""
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        with open(self.state_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+    
+    def add_job(self, name: str, cadence: Cadence, func: Callable[[], object]) -> ScheduledJob:
+        """添加任务，停机期间错过的排期会立即补跑"""
+        now = datetime.now()
+        job = ScheduledJob(name, cadence, func)
+        
+        if name in self.state:
+            job.due = datetime.fromisoformat(self.state[name])
+        else:
+            job.due = cadence.next_run(None, now)
+            self.state[name] = job.due.isoformat(timespec='seconds')
+            self._save_state()
+        self._set_deadline(job)
+        
+        if job.due < now:
+            logger.info(f"Job {name} missed its run at {job.due:%Y-%m-%d %H:%M}, catching up")
+        else:
+            logger.info(f"Job {name} ({cadence}) next run at {job.due:%Y-%m-%d %H:%M}")
+        
+        self.jobs.append(job)
+        return job
+    
+    def _set_deadline(self, job: ScheduledJob):
+        """把下次运行的墙钟时间换算为单调时钟截止时间"""
+        now = datetime.now()
+        monotonic_now = time.monotonic()
+        job.deadline = monotonic_now + max(0.0, (job.due - now).total_seconds())
+        job.clock_offset = now.timestamp() - monotonic_now
+    
+    def _run_job(self, job: ScheduledJob):
+        """运行任务；失败只记录日志，按节奏等待下次运行"""
+        started = datetime.now()
+        job.due = job.cadence.next_run(started, started)
+        try:
+            job.func()
+        except Exception as e:
+            logger.error(f"Job {job.name} failed: {e}")
+        else:
+            self.state[job.name] = job.due.isoformat(timespec='seconds')
+            self._save_state()
+        self._set_deadline(job)
+    
+    def run_pending(self) -> float:
+        """
+        运行所有到期的任务
+        
+        Returns:
+            距最近一个截止时间的秒数
+        """
+        for job in self.jobs:
+            if job.cadence.follows_wall_clock:
+                offset = time.time() - time.monotonic()
+                if abs(offset - job.clock_offset) > CLOCK_JUMP_TOLERANCE:
+                    logger.info(f"System clock changed, rescheduling {job.name}")
+                    self._set_deadline(job)
+            
+            if time.monotonic() >= job.deadline:
+                self._run_job(job)
+        
+        return max(0.0, min(job.deadline for job in self.jobs) - time.monotonic())
+    
+    def run_forever(self):
+        """循环运行到期任务，在两次截止时间之间睡眠"""
+        while True:
+            delay = self.run_pending()
+            time.sleep(min(delay, SCHEDULER_MAX_SLEEP))
+
+
 # ============ 主程序 ============
 
 def run_once(use_mock: bool = True, generate_report: bool = True):
@@ -547,52 +1024,49 @@ def run_once(use_mock: bool = True, generate_report: bool = True):
     return new_events
 
 
-def run_daemon(interval_minutes: int = 60, use_mock: bool = True):
-    """守护进程模式 - 持续运行"""
+def run_daemon(interval_minutes: int = 60, use_mock: bool = True,
+               report_hour: int = DAILY_REPORT_HOUR):
+    """守护进程模式 - 采集、日报、周度分析按各自节奏调度，共用一个数据库连接"""
     logger.info("=" * 50)
     logger.info("Investment Tracker v2.0 - Daemon Mode")
-    logger.info(f"Interval: {interval_minutes} minutes")
+    logger.info(f"Interval: {interval_minutes} minutes, reports at {report_hour:02d}:00")
     logger.info("Press Ctrl+C to stop")
     logger.info("=" * 50)
     
-    import time
+    db = Database()
+    collector = DataCollector(db)
+    reporter = ReportGenerator(db)
     
-    last_daily_report = None
+    # 同时到期时先采集，报告包含最新数据
+    scheduler = Scheduler()
+    scheduler.add_job(
+        'collect', IntervalCadence(interval_minutes),
+        lambda: collector.run_collection(use_mock=use_mock)
+    )
+    scheduler.add_job('daily_report', CalendarCadence(report_hour), reporter.save_daily_report)
+    scheduler.add_job(
+        'weekly_analysis', CalendarCadence(report_hour, weekday=WEEKLY_ANALYSIS_WEEKDAY),
+        reporter.save_weekly_analysis
+    )
     
     try:
-        while True:
-            current_time = datetime.now()
-            current_hour = current_time.hour
-            current_date = current_time.strftime('%Y-%m-%d')
-            
-            # 数据采集
-            run_once(use_mock=use_mock, generate_report=False)
-            
-            # 每天早上 9 点生成日报
-            if current_hour == 9 and last_daily_report != current_date:
-                db = Database()
-                reporter = ReportGenerator(db)
-                reporter.save_daily_report(current_date)
-                db.close()
-                last_daily_report = current_date
-                logger.info(f"Daily report generated for {current_date}")
-            
-            # 等待下一次采集
-            logger.info(f"Sleeping for {interval_minutes} minutes...")
-            time.sleep(interval_minutes * 60)
-            
+        scheduler.run_forever()
     except KeyboardInterrupt:
         logger.info("Daemon stopped by user")
     except Exception as e:
         logger.error(f"Daemon error: {e}")
         raise
+    finally:
+        db.close()
 
 
 def main():
     parser = argparse.ArgumentParser(description='Investment Ecosystem Intelligence Tracker v2')
     parser.add_argument('--run-once', action='store_true', help='Run once and exit')
     parser.add_argument('--daemon', action='store_true', help='Run in daemon mode')
-    parser.add_argument('--interval', type=int, default=60, help='Daemon check interval (minutes)')
+    parser.add_argument('--interval', type=int, default=60, help='Daemon collection interval (minutes)')
+    parser.add_argument('--report-hour', type=int, default=DAILY_REPORT_HOUR,
+                        help='Hour of day for daily and weekly reports in daemon mode')
     parser.add_argument('--mock', action='store_true', default=True, help='Use mock data')
     parser.add_argument('--no-mock', action='store_true', help='Use real data sources')
     parser.add_argument('--report', action='store_true', help='Generate daily report')
@@ -602,7 +1076,7 @@ def main():
     use_mock = not args.no_mock
     
     if args.daemon:
-        run_daemon(interval_minutes=args.interval, use_mock=use_mock)
+        run_daemon(interval_minutes=args.interval, use_mock=use_mock, report_hour=args.report_hour)
     else:
         run_once(use_mock=use_mock, generate_report=args.report or True)
 
@@ -12,7 +12,7 @@ REQUEST_CONFIG = {
     'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
 }
 
-# 关键词监测配置
+# 关键词监测配置 (investment-tracker.py 与 investment-tracker-v2.py 共用)
 KEYWORDS_CONFIG = {
     'early_stage': {
         'keywords': ['天使轮', '种子轮', 'Pre-A轮', '天使+', '种子+', 'A轮'],
@@ -22,13 +22,13 @@ KEYWORDS_CONFIG = {
     'ai': {
         'keywords': [
             'AI', '人工智能', '大模型', 'LLM', 'Agent', 'AIGC', 
-            '机器学习', '深度学习', '神经网络', 'ChatGPT', 'Claude'
+            '机器学习', '深度学习', '神经网络', 'ChatGPT', 'Claude', 'OpenAI', 'Anthropic'
         ],
         'weight': 10,
         'category': '人工智能'
     },
     'accelerator': {
-        'keywords': ['MiraclePlus', '奇绩创坛', 'Y Combinator', 'YC China', '陆奇'],
+        'keywords': ['MiraclePlus', '奇绩创坛', 'Y Combinator', 'YC China', '陆奇', 'Demo Day'],
         'weight': 8,
         'category': '孵化器'
     },
@@ -50,6 +50,15 @@ KEYWORDS_CONFIG = {
     }
 }
 
+# 汇率表: 1 单位货币折合美元，用于把融资金额换算为 amount_usd
+FX_RATES_TO_USD = {
+    'USD': 1.0,
+    'CNY': 0.14,
+    'HKD': 0.128,
+    'EUR': 1.08,
+    'JPY': 0.0067
+}
+
 # 数据源配置
 SOURCES = {
     '36kr_rss': {
@@ -26,8 +26,10 @@ import sqlite3
 import hashlib
 import logging
 import argparse
+import importlib.util
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterable, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from urllib.parse import urljoin, urlparse
 import xml.etree.ElementTree as ET
@@ -43,64 +45,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 共享关键词匹配器 (文件名含连字符，按路径加载)
+_spec = importlib.util.spec_from_file_location(
+    'investment_keywords', os.path.join(os.path.dirname(__file__), 'investment-keywords.py')
+)
+keywords = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(keywords)
+
 # ============ 配置 ============
 
-# 监测关键词
-KEYWORDS_CONFIG = {
-    'early_stage': {
-        'keywords': ['天使轮', '种子轮', 'Pre-A轮', '天使+', '种子+', 'A轮'],
-        'weight': 10,
-        'category': '早期投资'
-    },
-    'ai': {
-        'keywords': ['AI', '人工智能', '大模型', 'LLM', 'Agent', 'AIGC', '机器学习', 
-                     '深度学习', '神经网络', 'ChatGPT', 'Claude', 'OpenAI', 'Anthropic'],
-        'weight': 10,
-        'category': '人工智能'
-    },
-    'accelerator': {
-        'keywords': ['MiraclePlus', '奇绩创坛', 'Y Combinator', 'YC China', 
-                     '陆奇', 'Demo Day'],
-        'weight': 8,
-        'category': '孵化器'
-    },
-    'niche': {
-        'keywords': ['Kigurumi', '二次元', 'Cosplay', 'ACG', '动漫', '虚拟偶像', 
-                     'Vtuber', '手办', '潮玩', '盲盒', '谷子'],
-        'weight': 6,
-        'category': '二次元文化'
-    },
-    'vc_firms': {
-        'keywords': ['红杉', 'IDG', '高瓴', '源码资本', '五源资本', 'GGV', 
-                     '真格基金', '金沙江', '经纬中国', '启明创投'],
-        'weight': 5,
-        'category': '知名机构'
-    }
-}
+# 监测关键词 (来自 investment-tracker.config.py，与 v2 共用)
+KEYWORDS_CONFIG = keywords.KEYWORDS_CONFIG
 
-# 数据源配置
-SOURCES = {
-    '36kr_rss': {
-        'url': 'https://36kr.com/feed',
-        'enabled': True,
-        'type': 'rss'
-    },
-    '36kr_news': {
-        'url': 'https://36kr.com/api/newsflash',
-        'enabled': False,  # 需要绕开验证码
-        'type': 'api'
-    },
-    'jingdata': {
-        'url': 'https://www.jingdata.com/api/funding/search',
-        'enabled': False,  # 需要登录
-        'type': 'api',
-        'auth_required': True
-    }
-}
+# 数据源配置 (来自 investment-tracker.config.py)
+SOURCES = keywords.config.SOURCES
+
+# 并发采集的 RSS 源
+RSS_FEED_URLS = SOURCES['36kr_rss']['urls']
 
 # 数据库路径
 DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'research', 'investment', 'investment.db')
 
+# RSS 源 ETag / Last-Modified 记录
+FEED_STATE_PATH = os.path.join(os.path.dirname(DB_PATH), 'feed-state.json')
+
 
 # ============ 数据模型 ============
 
@@ -149,6 +117,9 @@ class Database:
             os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
             self.conn = sqlite3.connect(self.db_path)
             self.conn.row_factory = sqlite3.Row
+            # WAL: 写入不阻塞读取，提交时无需每次 fsync 主库文件
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('PRAGMA synchronous=NORMAL')
         return self.conn
     
     def init_db(self):
@@ -205,50 +176,72 @@ class Database:
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_match_score ON funding_events(match_score)
         ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_amount_usd ON funding_events(amount_usd)
+        ''')
         
         conn.commit()
         logger.info("Database initialized successfully")
     
     def insert_event(self, event: FundingEvent) -> bool:
         """插入融资事件，自动去重"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        inserted, _ = self.insert_events([event])
+        if inserted:
+            logger.info(f"Inserted event: {event.company_name} {event.funding_round}")
+        else:
+            logger.debug(f"Event already exists: {event.company_name} {event.funding_round}")
+        return inserted == 1
+    
+    def insert_events(self, events: Iterable[FundingEvent]) -> Tuple[int, int]:
+        """
+        批量插入融资事件，自动去重
         
-        event_hash = event.generate_hash()
+        所有事件在同一个事务中写入，只提交一次；event_hash 已存在的事件
+        (包括同一批次内的重复) 由 ON CONFLICT 跳过，无需逐条 SELECT。
         
-        # 检查是否已存在
-        cursor.execute('SELECT id FROM funding_events WHERE event_hash = ?', (event_hash,))
-        if cursor.fetchone():
-            logger.debug(f"Event already exists: {event.company_name} {event.funding_round}")
-            return False
+        Args:
+            events: 融资事件，可以是生成器
         
-        # 插入新记录
-        cursor.execute('''
-            INSERT INTO funding_events (
-                company_name, funding_round, amount, amount_usd, currency,
-                funding_date, investors, description, source_url, source_platform,
-                tags, keyword_matches, match_score, event_hash
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            event.company_name,
-            event.funding_round,
-            event.amount,
-            event.amount_usd,
-            event.currency,
-            event.funding_date,
-            event.investors,
-            event.description,
-            event.source_url,
-            event.source_platform,
-            event.tags,
-            event.keyword_matches,
-            event.match_score,
-            event_hash
-        ))
+        Returns:
+            (新插入数, 重复数)
+        """
+        conn = self.get_connection()
+        total = 0
         
-        conn.commit()
-        logger.info(f"Inserted event: {event.company_name} {event.funding_round}")
-        return True
+        def rows():
+            nonlocal total
+            for event in events:
+                total += 1
+                yield (
+                    event.company_name,
+                    event.funding_round,
+                    event.amount,
+                    event.amount_usd,
+                    event.currency,
+                    event.funding_date,
+                    event.investors,
+                    event.description,
+                    event.source_url,
+                    event.source_platform,
+                    event.tags,
+                    event.keyword_matches,
+                    event.match_score,
+                    event.generate_hash()
+                )
+        
+        with conn:
+            cursor = conn.executemany('''
+                INSERT INTO funding_events (
+                    company_name, funding_round, amount, amount_usd, currency,
+                    funding_date, investors, description, source_url, source_platform,
+                    tags, keyword_matches, match_score, event_hash
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(event_hash) DO NOTHING
+            ''', rows())
+        # rowcount 只计本语句插入的行，不含触发器写入的统计表
+        inserted = cursor.rowcount
+        
+        return inserted, total - inserted
     
     def get_recent_events(self, days: int = 30, min_score: int = 0) -> List[Dict]:
         """获取最近的投资事件"""
@@ -265,6 +258,22 @@ class Database:
         
         return [dict(row) for row in cursor.fetchall()]
     
+    def get_events_by_amount(self, min_usd: float, max_usd: float = None,
+                             days: int = 30) -> List[Dict]:
+        """按折合美元金额筛选最近的投资事件，金额从大到小"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        since_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        
+        cursor.execute('''
+            SELECT * FROM funding_events
+            WHERE amount_usd >= ? AND amount_usd <= ? AND funding_date >= ?
+            ORDER BY amount_usd DESC
+        ''', (min_usd, max_usd if max_usd is not None else float('inf'), since_date))
+        
+        return [dict(row) for row in cursor.fetchall()]
+    
     def get_stats(self) -> Dict:
         """获取数据统计"""
         conn = self.get_connection()
@@ -314,69 +323,162 @@ def match_keywords(text: str) -> Tuple[List[str], int]:
     Returns:
         (匹配的标签列表, 总权重分数)
     """
-    if not text:
-        return [], 0
-    
-    text = text.lower()
-    matched_categories = []
-    total_score = 0
-    
-    for category, config in KEYWORDS_CONFIG.items():
-        for keyword in config['keywords']:
-            if keyword.lower() in text:
-                matched_categories.append(config['category'])
-                total_score += config['weight']
-                break  # 每个类别只计一次分
-    
-    return list(set(matched_categories)), total_score
+    return keywords.matcher.match(text)
 
 
-def extract_funding_info(text: str) -> Dict:
+# ============ 融资信息提取 ============
+
+# 融资轮次 (按顺序尝试，取第一个匹配)
+ROUND_PATTERNS = [
+    re.compile(r'(种子轮|天使轮|天使\+|Pre-A轮|A轮|A\+轮|B轮|C轮|D轮|E轮|F轮|IPO|并购)', re.IGNORECASE),
+    re.compile(r'(天使|种子|Pre-A|A|B|C|D|E|F)轮[+\+]?', re.IGNORECASE),
+]
+
+# 公司名称 (简单启发式)
+COMPANY_PATTERNS = [
+    re.compile(r'([\u4e00-\u9fa5]{2,10})(?:公司|科技|智能|网络)?(?:完成|宣布|获得)'),
+    re.compile(r'(?:投资|融资)([\u4e00-\u9fa5]{2,10})(?:的|完成)'),
+]
+
+# 金额: 数字或模糊量词 + 单位 + 币种，如 "1.5亿元人民币"、"数千万美元"、"超5000万"、
+# "1,500万美元" (千分位逗号)
+AMOUNT_PATTERN = re.compile(
+    r'(?:(?P<number>\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?)|(?P<vague>数|几|上|近))\s*'
+    r'(?P<unit>[十百千万亿]+)'
+    r'(?P<currency>\s*(?:元人民币|人民币|美元|美金|港元|港币|欧元|日元|元|RMB|CNY|USD|HKD|EUR|JPY))?',
+    re.IGNORECASE
+)
+
+# 没有币种的金额，后面紧跟融资字样时才算 (如 "完成数千万A轮融资")，
+# 排除 "100万用户" 这类数字
+FUNDING_CONTEXT = re.compile(r'\s*(?:的|级|规模)?\s*(?:[A-F]\+?轮|Pre-?A|天使|种子|战略|融资|投资)', re.IGNORECASE)
+
+# 估值金额不是本轮融资额，如 "以10亿美元估值完成..."、"投后估值达10亿美元"
+VALUATION_AFTER = re.compile(r'\s*(?:的)?\s*(?:投前|投后)?估值')
+VALUATION_BEFORE = re.compile(r'估值\s*(?:达到?|为|超过?|约|逾|高达)?\s*$')
+
+UNIT_VALUES = {'十': 10, '百': 100, '千': 1000, '万': 10 ** 4, '亿': 10 ** 8}
+
+# 模糊量词的估算倍数，"数千万" 按 3 千万计
+VAGUE_MULTIPLIERS = {'数': 3, '几': 3, '上': 1, '近': 1}
+
+CURRENCY_CODES = {
+    '元人民币': 'CNY', '人民币': 'CNY', '元': 'CNY', 'rmb': 'CNY', 'cny': 'CNY',
+    '美元': 'USD', '美金': 'USD', 'usd': 'USD',
+    '港元': 'HKD', '港币': 'HKD', 'hkd': 'HKD',
+    '欧元': 'EUR', 'eur': 'EUR',
+    '日元': 'JPY', 'jpy': 'JPY',
+}
+
+# 汇率表 (1 单位货币折合美元，来自 investment-tracker.config.py)
+FX_RATES_TO_USD = keywords.config.FX_RATES_TO_USD
+
+
+def parse_amount(match: re.Match) -> Tuple[str, Optional[float], str]:
     """
-    从文本中提取融资信息
+    解析一个金额匹配
     
-    使用正则表达式匹配常见的融资信息格式
+    Returns:
+        (金额原文, 折合美元, 币种代码)；未写币种时按人民币计
     """
-    info = {
+    if match.group('number'):
+        value = float(match.group('number').replace(',', ''))
+    else:
+        value = VAGUE_MULTIPLIERS[match.group('vague')]
+    for unit in match.group('unit'):
+        value *= UNIT_VALUES[unit]
+    
+    currency = match.group('currency')
+    code = CURRENCY_CODES[currency.strip().lower()] if currency else 'CNY'
+    rate = FX_RATES_TO_USD.get(code)
+    amount_usd = round(value * rate, 2) if rate is not None else None
+    
+    return match.group().strip(), amount_usd, code
+
+
+def _is_valuation(text: str, match: re.Match) -> bool:
+    """金额紧挨着估值字样 (前后均可)"""
+    return bool(
+        VALUATION_AFTER.match(text, match.end())
+        or VALUATION_BEFORE.search(text, max(0, match.start() - 8), match.start())
+    )
+
+
+def _find_amount(text: str) -> Optional[re.Match]:
+    """找第一个有效金额 (带币种，或后面紧跟融资字样)，跳过估值"""
+    for match in AMOUNT_PATTERN.finditer(text):
+        if _is_valuation(text, match):
+            continue
+        if match.group('currency') or FUNDING_CONTEXT.match(text, match.end()):
+            return match
+    return None
+
+
+def _find_company(text: str) -> str:
+    """找第一个公司名称，跳过落在金额里的候选 (如 "10亿美元估值完成" 中的 "亿美元估值")"""
+    amount_spans = [match.span() for match in AMOUNT_PATTERN.finditer(text)]
+    for pattern in COMPANY_PATTERNS:
+        for match in pattern.finditer(text):
+            start = match.start(1)
+            if not any(begin <= start < end for begin, end in amount_spans):
+                return match.group(1)
+    return ''
+
+
+def _empty_funding_info() -> Dict:
+    return {
         'company_name': '',
         'funding_round': '',
         'amount': '',
+        'amount_usd': None,
+        'currency': 'CNY',
         'investors': []
     }
+
+
+def extract_funding_info(text: str) -> Dict:
+    """
+    从文本中提取融资信息
     
-    # 匹配融资轮次
-    round_patterns = [
-        r'(种子轮|天使轮|天使\+|Pre-A轮|A轮|A\+轮|B轮|C轮|D轮|E轮|F轮|IPO|并购)',
-        r'(天使|种子|Pre-A|A|B|C|D|E|F)轮[+\+]?',
-    ]
+    使用预编译的正则匹配常见的融资信息格式，金额按汇率表折合为美元
+    """
+    info = _empty_funding_info()
     
-    for pattern in round_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    # 匹配融资轮次
+    for pattern in ROUND_PATTERNS:
+        match = pattern.search(text)
         if match:
             info['funding_round'] = match.group(1)
             break
     
     # 匹配金额
-    amount_patterns = [
-        r'(\d+\.?\d*)\s*([万亿])?([人民币美元美金CNYUSD]+)?',
-        r'([数百万千万亿]+)([人民币美元美金CNYUSD]+)?',
-    ]
-    
-    # 匹配公司名称 (简单启发式)
-    company_patterns = [
-        r'([\u4e00-\u9fa5]{2,10})(?:公司|科技|智能|网络)?(?:完成|宣布|获得)',
-        r'(?:投资|融资)([\u4e00-\u9fa5]{2,10})(?:的|完成)',
-    ]
-    
-    for pattern in company_patterns:
-        match = re.search(pattern, text)
-        if match:
-            info['company_name'] = match.group(1)
-            break
+    match = _find_amount(text)
+    if match:
+        info['amount'], info['amount_usd'], info['currency'] = parse_amount(match)
+    
+    # 匹配公司名称
+    info['company_name'] = _find_company(text)
     
     return info
 
 
+def extract_funding_batch(texts: Iterable[str]) -> List[Dict]:
+    """
+    批量提取融资信息，与逐条调用 extract_funding_info 相同
+    
+    正则都在模块加载时编译，逐条提取已没有重复解析模式的开销。把整批
+    文本拼接后每个正则只扫一遍的做法实测反而更慢 (匹配需要按偏移量分回
+    各条文本，且无法在首个匹配处停止)，因此这里按条处理。
+    
+    Args:
+        texts: 待提取的文本
+    
+    Returns:
+        与 texts 一一对应的融资信息
+    """
+    return [extract_funding_info(text) for text in texts]
+
+
 # ============ 数据源采集器 ============
 
 class BaseCrawler:
@@ -414,73 +516,212 @@ class BaseCrawler:
 class Kr36RssCrawler(BaseCrawler):
     """36Kr RSS 采集器"""
     
-    def __init__(self):
+    def __init__(self, feed_urls: List[str] = None, state_path: str = None):
         super().__init__()
         self.source_name = '36kr_rss'
+        self.feed_urls = list(feed_urls or RSS_FEED_URLS)
+        self.state_path = state_path or FEED_STATE_PATH
+        self.feed_state = self._load_state()
+        self.pending_state = {}
     
     def fetch_rss(self) -> Optional[str]:
-        """获取 RSS 内容"""
-        # 尝试多个可能的 RSS 地址
-        rss_urls = [
-            'https://36kr.com/feed',
-            'https://36kr.com/feed-newsflash',
-            'https://rsshub.app/36kr/newsflashes'
-        ]
-        
-        for url in rss_urls:
+        """获取 RSS 内容 (依次尝试各个地址，返回第一个成功的)"""
+        for url in self.feed_urls:
             content = self.fetch(url)
-            if content and ('xml' in content or '<rss' in content or '<feed' in content):
+            if content and self._is_feed(content):
                 logger.info(f"Successfully fetched RSS from {url}")
                 return content
         
         return None
     
+    def fetch_all_feeds(self, max_workers: int = None) -> Dict[str, Optional[str]]:
+        """
+        并发获取全部 RSS 源 (条件 GET)
+        
+        线程池共用同一个 requests.Session。带上次保存的 ETag / Last-Modified
+        发送 If-None-Match / If-Modified-Since，未更新的源只返回 304。
+        新的校验值先记在 pending_state 中，事件入库后由 save_state() 写盘。
+        
+        Args:
+            max_workers: 线程数，默认每个源一个线程
+        
+        Returns:
+            {url: 内容}，未更新的源内容为 None，失败的源不在结果中
+        """
+        feeds = {}
+        if not self.feed_urls:
+            logger.warning("No RSS feeds configured")
+            return feeds
+        
+        with ThreadPoolExecutor(max_workers=max_workers or len(self.feed_urls)) as pool:
+            results = pool.map(self._fetch_conditional, self.feed_urls)
+            for url, (content, validators) in zip(self.feed_urls, results):
+                if validators is None:
+                    continue
+                feeds[url] = content
+                if content is not None:
+                    self.pending_state[url] = validators
+        
+        changed = sum(1 for content in feeds.values() if content is not None)
+        logger.info(
+            f"RSS feeds: {changed} updated, {len(feeds) - changed} not modified, "
+            f"{len(self.feed_urls) - len(feeds)} failed"
+        )
+        return feeds
+    
+    def _fetch_conditional(self, url: str) -> Tuple[Optional[str], Optional[Dict]]:
+        """
+        条件 GET 单个 RSS 源
+        
+        Returns:
+            (内容, 新的校验值)；304 时内容为 None，失败时两者都为 None
+        """
+        validators = self.feed_state.get(url, {})
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        
+        try:
+            response = self.session.get(url, timeout=30, headers=headers)
+            if response.status_code == 304:
+                logger.debug(f"RSS not modified: {url}")
+                return None, validators
+            response.raise_for_status()
+        except Exception as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+            return None, None
+        
+        content = response.text
+        if not self._is_feed(content):
+            logger.warning(f"Not an RSS/Atom feed: {url}")
+            return None, None
+        
+        logger.info(f"Fetched RSS from {url}")
+        return content, {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        }
+    
+    @staticmethod
+    def _is_feed(content: str) -> bool:
+        """粗略判断内容是否为 RSS/Atom"""
+        return bool(content) and ('xml' in content or '<rss' in content or '<feed' in content)
+    
+    def _load_state(self) -> Dict[str, Dict]:
+        """读取各 RSS 源的 ETag / Last-Modified"""
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def save_state(self):
+        """保存本次获取到的 ETag / Last-Modified (在事件入库后调用)"""
+        if not self.pending_state:
+            return
+        self.feed_state.update(self.pending_state)
+        self.pending_state = {}
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        with open(self.state_path, 'w', encoding='utf-8') as f:
+            json.dump(self.feed_state, f, ensure_ascii=False, indent=2)
+    
     def parse(self, content: str) -> List[FundingEvent]:
         """解析 RSS 内容"""
-        events = []
+        return self.parse_feeds([content])
+    
+    def parse_feeds(self, contents: Iterable[str]) -> List[FundingEvent]:
+        """
+        解析多个 RSS/Atom 源，跨源去重
+        
+        同一条目出现在多个源中时，只保留第一次出现的，去重在提取融资信息和
+        关键词打分之前完成。链接 (忽略协议、查询参数和末尾斜杠) 或标题相同
+        即视为同一条目。融资信息对整批条目一次提取。
+        """
+        entries = []
+        seen = set()
         
+        for content in contents:
+            for element, is_atom in self._iter_entries(content):
+                keys = self._entry_keys(element, is_atom)
+                if seen.intersection(keys):
+                    continue
+                seen.update(keys)
+                
+                if is_atom:
+                    fields = self._atom_entry_fields(element)
+                else:
+                    fields = self._rss_item_fields(element)
+                if fields:
+                    entries.append(fields)
+        
+        # 整批提取融资信息
+        funding_infos = extract_funding_batch([fields['text'] for fields in entries])
+        return [
+            self._build_event(fields, funding_info)
+            for fields, funding_info in zip(entries, funding_infos)
+        ]
+    
+    def _iter_entries(self, content: str):
+        """遍历 RSS item 或 Atom entry，返回 (元素, 是否 Atom)"""
         try:
             root = ET.fromstring(content)
-            
-            # 处理 Atom 格式
-            if root.tag.endswith('feed'):
-                entries = root.findall('.//{http://www.w3.org/2005/Atom}entry')
-                for entry in entries:
-                    event = self._parse_atom_entry(entry)
-                    if event:
-                        events.append(event)
-            
-            # 处理 RSS 2.0 格式
-            elif root.tag.endswith('rss') or root.tag == 'rss':
-                items = root.findall('.//item')
-                for item in items:
-                    event = self._parse_rss_item(item)
-                    if event:
-                        events.append(event)
-        
         except ET.ParseError as e:
             logger.error(f"RSS parse error: {e}")
+            return
         
-        return events
+        # 处理 Atom 格式
+        if root.tag.endswith('feed'):
+            for entry in root.findall('.//{http://www.w3.org/2005/Atom}entry'):
+                yield entry, True
+        
+        # 处理 RSS 2.0 格式
+        elif root.tag.endswith('rss') or root.tag == 'rss':
+            for item in root.findall('.//item'):
+                yield item, False
+    
+    @staticmethod
+    def _entry_keys(element: ET.Element, is_atom: bool) -> List[str]:
+        """条目的去重键: 规范化的链接和标题"""
+        if is_atom:
+            ns = {'atom': 'http://www.w3.org/2005/Atom'}
+            title = element.findtext('atom:title', '', ns)
+            link_elem = element.find('atom:link', ns)
+            link = link_elem.get('href', '') if link_elem is not None else ''
+        else:
+            title = element.findtext('title', '')
+            link = element.findtext('link', '')
+        
+        keys = []
+        if link.strip():
+            parsed = urlparse(link.strip())
+            keys.append('link:' + parsed.netloc.lower() + parsed.path.rstrip('/'))
+        if title.strip():
+            keys.append('title:' + title.strip())
+        return keys
     
     def _parse_rss_item(self, item: ET.Element) -> Optional[FundingEvent]:
         """解析 RSS item"""
+        fields = self._rss_item_fields(item)
+        if fields is None:
+            return None
+        return self._build_event(fields, extract_funding_info(fields['text']))
+    
+    def _parse_atom_entry(self, entry: ET.Element) -> Optional[FundingEvent]:
+        """解析 Atom entry"""
+        fields = self._atom_entry_fields(entry)
+        if fields is None:
+            return None
+        return self._build_event(fields, extract_funding_info(fields['text']))
+    
+    def _rss_item_fields(self, item: ET.Element) -> Optional[Dict]:
+        """读取 RSS item 的字段，与融资无关的条目返回 None"""
         title = item.findtext('title', '')
         description = item.findtext('description', '')
         link = item.findtext('link', '')
         pub_date = item.findtext('pubDate', '')
         
-        # 只处理与融资相关的条目
-        funding_keywords = ['融资', '投资', '轮', '基金', '天使', '种子']
-        if not any(kw in title or kw in description for kw in funding_keywords):
-            return None
-        
-        # 提取融资信息
-        funding_info = extract_funding_info(title + ' ' + description)
-        
-        # 关键词匹配
-        matched_tags, score = match_keywords(title + ' ' + description)
-        
         # 解析日期
         funding_date = None
         if pub_date:
@@ -491,23 +732,10 @@ class Kr36RssCrawler(BaseCrawler):
             except:
                 pass
         
-        event = FundingEvent(
-            company_name=funding_info['company_name'],
-            funding_round=funding_info['funding_round'],
-            amount=funding_info['amount'],
-            funding_date=funding_date,
-            description=description[:500] if description else title,
-            source_url=link,
-            source_platform=self.source_name,
-            tags=json.dumps(matched_tags),
-            keyword_matches=json.dumps(matched_tags),
-            match_score=score
-        )
-        
-        return event
+        return self._funding_fields(title, description, link, funding_date)
     
-    def _parse_atom_entry(self, entry: ET.Element) -> Optional[FundingEvent]:
-        """解析 Atom entry"""
+    def _atom_entry_fields(self, entry: ET.Element) -> Optional[Dict]:
+        """读取 Atom entry 的字段，与融资无关的条目返回 None"""
         ns = {'atom': 'http://www.w3.org/2005/Atom'}
         title = entry.findtext('atom:title', '', ns)
         content = entry.findtext('atom:content', '', ns)
@@ -518,17 +746,6 @@ class Kr36RssCrawler(BaseCrawler):
         
         description = content or summary or title
         
-        # 只处理与融资相关的条目
-        funding_keywords = ['融资', '投资', '轮', '基金', '天使', '种子']
-        if not any(kw in title or kw in description for kw in funding_keywords):
-            return None
-        
-        # 提取融资信息
-        funding_info = extract_funding_info(title + ' ' + description)
-        
-        # 关键词匹配
-        matched_tags, score = match_keywords(title + ' ' + description)
-        
         # 解析日期
         funding_date = None
         if updated:
@@ -538,20 +755,46 @@ class Kr36RssCrawler(BaseCrawler):
             except:
                 pass
         
-        event = FundingEvent(
+        return self._funding_fields(title, description, link, funding_date)
+    
+    @staticmethod
+    def _funding_fields(title: str, description: str, link: str,
+                        funding_date: Optional[str]) -> Optional[Dict]:
+        """只保留与融资相关的条目"""
+        funding_keywords = ['融资', '投资', '轮', '基金', '天使', '种子']
+        if not any(kw in title or kw in description for kw in funding_keywords):
+            return None
+        
+        return {
+            'title': title,
+            'description': description,
+            'link': link,
+            'funding_date': funding_date,
+            'text': title + ' ' + description
+        }
+    
+    def _build_event(self, fields: Dict, funding_info: Dict) -> FundingEvent:
+        """由条目字段和提取出的融资信息生成事件"""
+        title = fields['title']
+        description = fields['description']
+        
+        # 关键词匹配
+        matched_tags, score = match_keywords(fields['text'])
+        
+        return FundingEvent(
             company_name=funding_info['company_name'],
             funding_round=funding_info['funding_round'],
             amount=funding_info['amount'],
-            funding_date=funding_date,
+            amount_usd=funding_info['amount_usd'],
+            currency=funding_info['currency'],
+            funding_date=fields['funding_date'],
             description=description[:500] if description else title,
-            source_url=link,
+            source_url=fields['link'],
             source_platform=self.source_name,
             tags=json.dumps(matched_tags),
             keyword_matches=json.dumps(matched_tags),
             match_score=score
         )
-        
-        return event
 
 
 class MockDataCrawler(BaseCrawler):
@@ -694,15 +937,18 @@ def run_tracker(use_mock: bool = False, days: int = 30):
     db = Database()
     
     all_events = []
+    rss_crawler = None
     
     # 1. 尝试 RSS 采集
     if not use_mock:
         logger.info("Fetching data from 36Kr RSS...")
         rss_crawler = Kr36RssCrawler()
-        rss_content = rss_crawler.fetch_rss()
+        feeds = rss_crawler.fetch_all_feeds()
         
-        if rss_content:
-            rss_events = rss_crawler.parse(rss_content)
+        if feeds:
+            rss_events = rss_crawler.parse_feeds(
+                content for content in feeds.values() if content is not None
+            )
             logger.info(f"RSS parsed: {len(rss_events)} events found")
             all_events.extend(rss_events)
         else:
@@ -717,13 +963,17 @@ def run_tracker(use_mock: bool = False, days: int = 30):
         logger.info(f"Generated {len(mock_events)} sample events")
         all_events.extend(mock_events)
     
-    # 3. 插入数据库
-    inserted_count = 0
-    for event in all_events:
-        if db.insert_event(event):
-            inserted_count += 1
+    # 3. 插入数据库 (单个事务批量写入)
+    inserted_count, duplicate_count = db.insert_events(all_events)
     
-    logger.info(f"Total events: {len(all_events)}, Inserted: {inserted_count}")
+    logger.info(
+        f"Total events: {len(all_events)}, Inserted: {inserted_count}, "
+        f"Duplicates: {duplicate_count}"
+    )
+    
+    # 事件入库后再记录 RSS 源的校验值，避免未入库的条目被 304 跳过
+    if rss_crawler:
+        rss_crawler.save_state()
     
     # 4. 输出统计
     stats = db.get_stats()
@@ -780,6 +1030,8 @@ def main():
     parser.add_argument('--days', type=int, default=30, help='Number of days to track')
     parser.add_argument('--export', action='store_true', help='Export data to JSON')
     parser.add_argument('--output', type=str, help='Output file path for export')
+    parser.add_argument('--min-amount', type=float,
+                        help='List events of at least this many USD (amount_usd)')
     
     args = parser.parse_args()
     
@@ -798,6 +1050,16 @@ def main():
     print(f"Total events in database: {stats['total_events']}")
     print(f"Events in last 30 days: {stats['recent_30d']}")
     print(f"High priority events: {stats['high_priority']}")
+    
+    # 按金额筛选
+    if args.min_amount is not None:
+        db = Database()
+        events = db.get_events_by_amount(args.min_amount, days=args.days)
+        db.close()
+        print(f"\nEvents >= ${args.min_amount:,.0f} ({args.days}d): {len(events)}")
+        for event in events:
+            print(f"  ${event['amount_usd']:,.0f} {event['company_name']} - "
+                  f"{event['funding_round']} ({event['amount']}, {event['funding_date']})")
 
 
 if __name__ == '__main__':